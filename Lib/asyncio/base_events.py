@@ -51,6 +51,9 @@
 
 __all__ = 'BaseEventLoop',
 
+# Classes whose methods make up task steps, see _run_instrumented().
+_TASK_TYPES = (tasks._PyTask, tasks.Task)
+
 
 # Minimum number of _scheduled timer handles before cleanup of
 # cancelled handles is performed.
@@ -404,6 +407,9 @@ def __init__(self):
         self._task_factory = None
         self._coroutine_origin_tracking_enabled = False
         self._coroutine_origin_tracking_saved_depth = None
+        # Maps tasks to their statistics when task instrumentation is
+        # enabled, None otherwise.
+        self._task_stats = None
 
         # A weak set of all asynchronous generators that are
         # being iterated by the loop.
@@ -765,6 +771,8 @@ def _call_soon(self, callback, args, context):
         handle = events.Handle(callback, args, self, context)
         if handle._source_traceback:
             del handle._source_traceback[-1]
+        if self._task_stats is not None:
+            handle._ready_time = time.perf_counter()
         self._ready.append(handle)
         return handle
 
@@ -1791,6 +1799,8 @@ def _add_callback(self, handle):
         if handle._cancelled:
             return
         assert not isinstance(handle, events.TimerHandle)
+        if self._task_stats is not None:
+            handle._ready_time = time.perf_counter()
         self._ready.append(handle)
 
     def _add_callback_signalsafe(self, handle):
@@ -1853,6 +1863,8 @@ def _run_once(self):
                 break
             handle = heapq.heappop(self._scheduled)
             handle._scheduled = False
+            if self._task_stats is not None:
+                handle._ready_time = time.perf_counter()
             self._ready.append(handle)
 
         # This is the only place where callbacks are actually *called*.
@@ -1866,7 +1878,9 @@ def _run_once(self):
             handle = self._ready.popleft()
             if handle._cancelled:
                 continue
-            if self._debug:
+            if self._task_stats is not None:
+                self._run_instrumented(handle)
+            elif self._debug:
                 try:
                     self._current_handle = handle
                     t0 = self.time()
@@ -1881,6 +1895,73 @@ def _run_once(self):
                 handle._run()
         handle = None  # Needed to break cycles when an exception occurs.
 
+    def _run_instrumented(self, handle):
+        """Run a handle and account its timings to the owning task."""
+        ready_time = handle._ready_time
+        handle._ready_time = None
+        try:
+            self._current_handle = handle
+            t0 = time.perf_counter()
+            handle._run()
+            t1 = time.perf_counter()
+        finally:
+            self._current_handle = None
+
+        dt = t1 - t0
+        if self._debug and dt >= self.slow_callback_duration:
+            logger.warning('Executing %s took %.3f seconds',
+                           _format_handle(handle), dt)
+
+        # Task steps and wakeups are scheduled as methods of the task.
+        task = getattr(handle._callback, '__self__', None)
+        if not isinstance(task, _TASK_TYPES):
+            return
+        stats = self._task_stats
+        if stats is None:
+            # Instrumentation was disabled by the callback.
+            return
+        counters = stats.get(task)
+        if counters is None:
+            counters = stats[task] = [0, 0.0, 0.0, 0.0, 0.0]
+        counters[0] += 1
+        counters[1] += dt
+        if dt > counters[3]:
+            counters[3] = dt
+        if ready_time is not None:
+            delay = t0 - ready_time
+            counters[2] += delay
+            if delay > counters[4]:
+                counters[4] = delay
+
+    def set_task_instrumentation(self, enabled):
+        """Enable or disable the collection of per-task statistics.
+
+        While enabled, the loop records for every task the number of
+        steps it ran, the time spent running them and the time they
+        waited in the ready queue.  Disabling it discards the data.
+        """
+        if not enabled:
+            self._task_stats = None
+        elif self._task_stats is None:
+            self._task_stats = weakref.WeakKeyDictionary()
+
+    def get_task_instrumentation(self):
+        """Return True if per-task statistics are being collected."""
+        return self._task_stats is not None
+
+    def get_task_stats(self, task):
+        """Return a TaskStats snapshot for task, or None.
+
+        None is returned if instrumentation is disabled or the task
+        has not run since it was enabled.
+        """
+        if self._task_stats is None:
+            return None
+        counters = self._task_stats.get(task)
+        if counters is None:
+            return None
+        return tasks.TaskStats(*counters)
+
     def _set_coroutine_origin_tracking(self, enabled):
         if bool(enabled) == bool(self._coroutine_origin_tracking_enabled):
             return
@@ -26,7 +26,7 @@ class Handle:
 
     __slots__ = ('_callback', '_args', '_cancelled', '_loop',
                  '_source_traceback', '_repr', '__weakref__',
-                 '_context')
+                 '_context', '_ready_time')
 
     def __init__(self, callback, args, loop, context=None):
         if context is None:
@@ -37,6 +37,9 @@ def __init__(self, callback, args, loop, context=None):
         self._args = args
         self._cancelled = False
         self._repr = None
+        # Set by loops with task instrumentation enabled to the
+        # time.perf_counter() value when the handle became ready.
+        self._ready_time = None
         if self._loop.get_debug():
             self._source_traceback = format_helpers.extract_stack(
                 sys._getframe(1))
@@ -577,6 +580,17 @@ def default_exception_handler(self, context):
     def call_exception_handler(self, context):
         raise NotImplementedError
 
+    # Task instrumentation.
+
+    def set_task_instrumentation(self, enabled):
+        raise NotImplementedError
+
+    def get_task_instrumentation(self):
+        raise NotImplementedError
+
+    def get_task_stats(self, task):
+        raise NotImplementedError
+
     # Debug flag management.
 
     def get_debug(self):
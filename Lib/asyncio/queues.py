@@ -1,8 +1,12 @@
-__all__ = ('Queue', 'PriorityQueue', 'LifoQueue', 'QueueFull', 'QueueEmpty')
+__all__ = ('Queue', 'PriorityQueue', 'LifoQueue', 'ThreadSafeQueue',
+           'QueueFull', 'QueueEmpty')
 
 import collections
 import heapq
+import threading
+import time
 
+from . import events
 from . import locks
 from . import mixins
 
@@ -63,6 +67,14 @@ def _wakeup_next(self, waiters):
                 waiter.set_result(None)
                 break
 
+    def _wakeup_many(self, waiters, n):
+        # Wake up to n waiters that aren't cancelled.
+        while n and waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                n -= 1
+
     def __repr__(self):
         return f'<{type(self).__name__} at {id(self):#x} {self._format()}>'
 
@@ -145,7 +157,64 @@ def put_nowait(self, item):
         self._put(item)
         self._unfinished_tasks += 1
         self._finished.clear()
-        self._wakeup_next(self._getters)
+        if self._getters:
+            self._wakeup_next(self._getters)
+
+    async def put_many(self, items):
+        """Put all items of an iterable into the queue, in order.
+
+        Waiting getters are woken up once per batch of items added, rather
+        than once per item.  If the queue is full, wait until free slots
+        are available before adding the remaining items.  If cancelled
+        while waiting, the items added so far stay in the queue.
+        """
+        added = 0
+        try:
+            for item in items:
+                while self.full():
+                    if added:
+                        self._notify_put(added)
+                        added = 0
+                    putter = self._get_loop().create_future()
+                    self._putters.append(putter)
+                    try:
+                        await putter
+                    except:
+                        putter.cancel()  # Just in case putter is not done yet.
+                        try:
+                            # Clean self._putters from canceled putters.
+                            self._putters.remove(putter)
+                        except ValueError:
+                            pass
+                        if not self.full() and not putter.cancelled():
+                            # We were woken up by get_nowait(), but can't
+                            # take the call.  Wake up the next in line.
+                            self._wakeup_next(self._putters)
+                        raise
+                self._put(item)
+                added += 1
+        finally:
+            if added:
+                self._notify_put(added)
+
+    def put_many_nowait(self, items):
+        """Put all items of an iterable into the queue without blocking.
+
+        If there are not enough free slots for all of them, raise QueueFull
+        and add none.
+        """
+        items = list(items)
+        if self._maxsize > 0 and self.qsize() + len(items) > self._maxsize:
+            raise QueueFull
+        for item in items:
+            self._put(item)
+        if items:
+            self._notify_put(len(items))
+
+    def _notify_put(self, n):
+        self._unfinished_tasks += n
+        self._finished.clear()
+        self._wakeup_many(self._getters, n)
 
     async def get(self):
         """Remove and return an item from the queue.
@@ -181,9 +250,76 @@ def get_nowait(self):
         if self.empty():
             raise QueueEmpty
         item = self._get()
-        self._wakeup_next(self._putters)
+        if self._putters:
+            self._wakeup_next(self._putters)
         return item
 
+    async def get_many(self, max_items, timeout=None):
+        """Remove and return a list of up to max_items items.
+
+        If the queue is empty, wait until an item is available, then return
+        all the items available at that point, up to max_items.  If timeout
+        is not None and no item arrives within timeout seconds, return an
+        empty list.
+        """
+        if max_items < 1:
+            raise ValueError('max_items must be at least 1')
+        if self.empty():
+            loop = self._get_loop()
+            if timeout is not None:
+                deadline = loop.time() + timeout
+            getter = None
+            while self.empty():
+                timer = None
+                if timeout is not None:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        if getter is not None:
+                            try:
+                                # Our getter was released by the timer.
+                                self._getters.remove(getter)
+                            except ValueError:
+                                pass
+                        return []
+                getter = loop.create_future()
+                self._getters.append(getter)
+                if timeout is not None:
+                    timer = loop.call_later(remaining, _release_waiter,
+                                            getter)
+                try:
+                    await getter
+                except:
+                    getter.cancel()  # Just in case getter is not done yet.
+                    try:
+                        # Clean self._getters from canceled getters.
+                        self._getters.remove(getter)
+                    except ValueError:
+                        pass
+                    if not self.empty() and not getter.cancelled():
+                        # We were woken up by put_nowait(), but can't take
+                        # the call.  Wake up the next in line.
+                        self._wakeup_next(self._getters)
+                    raise
+                finally:
+                    if timer is not None:
+                        timer.cancel()
+        return self.get_many_nowait(max_items)
+
+    def get_many_nowait(self, max_items):
+        """Remove and return a list of up to max_items items.
+
+        Return the items immediately available, else raise QueueEmpty.
+        """
+        if max_items < 1:
+            raise ValueError('max_items must be at least 1')
+        if self.empty():
+            raise QueueEmpty
+        items = []
+        while len(items) < max_items and not self.empty():
+            items.append(self._get())
+        self._wakeup_many(self._putters, len(items))
+        return items
+
     def task_done(self):
         """Indicate that a formerly enqueued task is complete.
 
@@ -216,6 +352,12 @@ async def join(self):
             await self._finished.wait()
 
 
+def _release_waiter(waiter):
+    # Timeout callback of Queue.get_many().
+    if not waiter.done():
+        waiter.set_result(None)
+
+
 class PriorityQueue(Queue):
     """A subclass of Queue; retrieves entries in priority order (lowest first).
 
@@ -243,3 +385,250 @@ def _put(self, item):
 
     def _get(self):
         return self._queue.pop()
+
+
+class ThreadSafeQueue(mixins._LoopBoundMixin):
+    """A FIFO queue shared by coroutines of one event loop and other threads.
+
+    Coroutines use "await put()", "await get()" and "await get_many()";
+    other threads use put_sync() and get_sync(), which block the calling
+    thread.  put_nowait() and get_nowait() can be called from anywhere.
+
+    If maxsize is less than or equal to zero, the queue size is infinite.
+    Otherwise both sides block when the queue reaches maxsize.
+
+    Waiting coroutines are woken up through a single
+    loop.call_soon_threadsafe() call however many items other threads put
+    before the event loop gets to run it.
+    """
+
+    def __init__(self, maxsize=0, *, loop=mixins._marker):
+        super().__init__(loop=loop)
+        self._maxsize = maxsize
+        self._queue = collections.deque()
+        self._mutex = threading.Lock()
+        # Conditions for the threads blocked in get_sync() and put_sync().
+        self._not_empty = threading.Condition(self._mutex)
+        self._not_full = threading.Condition(self._mutex)
+        # Futures of the coroutines blocked in get() and put(), only
+        # completed from the event loop thread.
+        self._getters = collections.deque()
+        self._putters = collections.deque()
+        self._wakeup_scheduled = False
+
+    def __repr__(self):
+        return (f'<{type(self).__name__} at {id(self):#x} '
+                f'maxsize={self._maxsize!r} qsize={self.qsize()}>')
+
+    def __class_getitem__(cls, type):
+        return cls
+
+    def qsize(self):
+        """Number of items in the queue."""
+        return len(self._queue)
+
+    @property
+    def maxsize(self):
+        """Number of items allowed in the queue."""
+        return self._maxsize
+
+    def empty(self):
+        """Return True if the queue is empty, False otherwise."""
+        return not self._queue
+
+    def full(self):
+        """Return True if there are maxsize items in the queue."""
+        return 0 < self._maxsize <= len(self._queue)
+
+    def _wakeup_waiters_locked(self):
+        # Wake up as many waiting coroutines as can make progress.  Must
+        # be called from the event loop thread, with the mutex held.
+        n = len(self._queue)
+        getters = self._getters
+        while n and getters:
+            getter = getters.popleft()
+            if not getter.done():
+                getter.set_result(None)
+                n -= 1
+        if self._maxsize > 0:
+            n = self._maxsize - len(self._queue)
+        else:
+            n = len(self._putters)
+        putters = self._putters
+        while n > 0 and putters:
+            putter = putters.popleft()
+            if not putter.done():
+                putter.set_result(None)
+                n -= 1
+
+    def _wakeup_waiters(self):
+        with self._mutex:
+            self._wakeup_scheduled = False
+            self._wakeup_waiters_locked()
+
+    def _notify_locked(self):
+        # Called with the mutex held after items were added or removed.
+        if not (self._getters or self._putters):
+            return
+        loop = self._loop
+        if events._get_running_loop() is loop:
+            self._wakeup_waiters_locked()
+        elif not self._wakeup_scheduled:
+            try:
+                loop.call_soon_threadsafe(self._wakeup_waiters)
+            except RuntimeError:
+                # The event loop is closed; nobody is left to wake up.
+                pass
+            else:
+                self._wakeup_scheduled = True
+
+    def _check_thread(self, method):
+        loop = events._get_running_loop()
+        if loop is not None and loop is self._loop:
+            raise RuntimeError(
+                f'{method}() would block the event loop; '
+                f'use "await {method[:-5]}()" in coroutines')
+
+    async def _wait(self, waiter, waiters):
+        try:
+            await waiter
+        except:
+            waiter.cancel()  # Just in case waiter is not done yet.
+            with self._mutex:
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    # The waiter was woken up: pass the wakeup on.
+                    self._wakeup_waiters_locked()
+            raise
+
+    async def put(self, item):
+        """Put an item into the queue.
+
+        If the queue is full, wait until a free slot is available before
+        adding item.
+        """
+        loop = self._get_loop()
+        while True:
+            with self._mutex:
+                if not self.full():
+                    self._put_locked(item)
+                    return
+                putter = loop.create_future()
+                self._putters.append(putter)
+            await self._wait(putter, self._putters)
+
+    def put_nowait(self, item):
+        """Put an item into the queue without blocking.
+
+        If no free slot is immediately available, raise QueueFull.
+        This method can be called from any thread.
+        """
+        with self._mutex:
+            if self.full():
+                raise QueueFull
+            self._put_locked(item)
+
+    def put_sync(self, item, timeout=None):
+        """Put an item into the queue, blocking the calling thread.
+
+        If the queue is full, block until a free slot is available, or at
+        most timeout seconds if it is not None, then raise QueueFull.
+        Must not be called from the event loop thread.
+        """
+        self._check_thread('put_sync')
+        with self._not_full:
+            if timeout is None:
+                while self.full():
+                    self._not_full.wait()
+            elif timeout < 0:
+                raise ValueError("'timeout' must be a non-negative number")
+            else:
+                endtime = time.monotonic() + timeout
+                while self.full():
+                    remaining = endtime - time.monotonic()
+                    if remaining <= 0.0:
+                        raise QueueFull
+                    self._not_full.wait(remaining)
+            self._put_locked(item)
+
+    def _put_locked(self, item):
+        self._queue.append(item)
+        self._not_empty.notify()
+        self._notify_locked()
+
+    async def get(self):
+        """Remove and return an item from the queue.
+
+        If queue is empty, wait until an item is available.
+        """
+        loop = self._get_loop()
+        while True:
+            with self._mutex:
+                if self._queue:
+                    return self._get_locked()
+                getter = loop.create_future()
+                self._getters.append(getter)
+            await self._wait(getter, self._getters)
+
+    async def get_many(self, max_items):
+        """Remove and return a list of up to max_items items.
+
+        If the queue is empty, wait until an item is available, then return
+        all the items available at that point, up to max_items.
+        """
+        if max_items < 1:
+            raise ValueError('max_items must be at least 1')
+        loop = self._get_loop()
+        while True:
+            with self._mutex:
+                if self._queue:
+                    queue = self._queue
+                    items = [queue.popleft()
+                             for _ in range(min(max_items, len(queue)))]
+                    self._not_full.notify(len(items))
+                    self._notify_locked()
+                    return items
+                getter = loop.create_future()
+                self._getters.append(getter)
+            await self._wait(getter, self._getters)
+
+    def get_nowait(self):
+        """Remove and return an item from the queue.
+
+        Return an item if one is immediately available, else raise
+        QueueEmpty.  This method can be called from any thread.
+        """
+        with self._mutex:
+            if not self._queue:
+                raise QueueEmpty
+            return self._get_locked()
+
+    def get_sync(self, timeout=None):
+        """Remove and return an item, blocking the calling thread.
+
+        If the queue is empty, block until an item is available, or at
+        most timeout seconds if it is not None, then raise QueueEmpty.
+        Must not be called from the event loop thread.
+        """
+        self._check_thread('get_sync')
+        with self._not_empty:
+            if timeout is None:
+                while not self._queue:
+                    self._not_empty.wait()
+            elif timeout < 0:
+                raise ValueError("'timeout' must be a non-negative number")
+            else:
+                endtime = time.monotonic() + timeout
+                while not self._queue:
+                    remaining = endtime - time.monotonic()
+                    if remaining <= 0.0:
+                        raise QueueEmpty
+                    self._not_empty.wait(remaining)
+            return self._get_locked()
+
+    def _get_locked(self):
+        item = self._queue.popleft()
+        self._not_full.notify()
+        self._notify_locked()
+        return item
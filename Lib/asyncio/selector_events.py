@@ -9,6 +9,8 @@
 import collections
 import errno
 import functools
+import itertools
+import os
 import selectors
 import socket
 import warnings
@@ -29,6 +31,18 @@
 from .log import logger
 
 
+def _get_iov_max():
+    try:
+        return os.sysconf('SC_IOV_MAX')
+    except (AttributeError, ValueError, OSError):
+        # POSIX guarantees at least 16 buffers per sendmsg() call
+        return 16
+
+
+_HAS_SENDMSG = hasattr(socket.socket, 'sendmsg')
+_IOV_MAX = _get_iov_max() if _HAS_SENDMSG else 16
+
+
 def _test_selector_event(selector, fd, event):
     # Test if the selector is monitoring 'event' events
     # for the file descriptor 'fd'.
@@ -758,6 +772,7 @@ class _SelectorSocketTransport(_SelectorTransport):
 
     _start_tls_compatible = True
     _sendfile_compatible = constants._SendfileMode.TRY_NATIVE
+    _write_batching = False
 
     def __init__(self, loop, sock, protocol, waiter=None,
                  extra=None, server=None):
@@ -768,6 +783,17 @@ def __init__(self, loop, sock, protocol, waiter=None,
         self._paused = False
         self._empty_waiter = None
 
+        # Write batching: self._buffer becomes a deque of bytes objects
+        # which are sent with a single sendmsg() call per flush.
+        self._write_batching = False
+        self._batch_size = 0
+        self._flush_threshold = 0
+        self._flush_delay = None
+        self._flush_handle = None
+        self._batched_writes = 0
+        self._sendmsg_calls = 0
+        self._bytes_coalesced = 0
+
         # Disable the Nagle algorithm -- small writes will be
         # sent without waiting for the TCP ACK.  This generally
         # decreases the latency (in some cases significantly.)
@@ -912,6 +938,10 @@ def write(self, data):
             self._conn_lost += 1
             return
 
+        if self._write_batching:
+            self._write_batched(data)
+            return
+
         if not self._buffer:
             # Optimization: try to send now.
             try:
@@ -964,6 +994,130 @@ def _write_ready(self):
                 elif self._eof:
                     self._sock.shutdown(socket.SHUT_WR)
 
+    def writelines(self, list_of_data):
+        if not self._write_batching:
+            super().writelines(list_of_data)
+            return
+        for data in list_of_data:
+            self.write(data)
+
+    def set_write_batching(self, enabled=True, *, flush_threshold=64 * 1024,
+                           flush_delay=None):
+        if self._buffer:
+            raise RuntimeError(
+                'cannot change write batching while data is buffered')
+        if flush_threshold < 0:
+            raise ValueError(f'flush_threshold must be >= 0, '
+                             f'got {flush_threshold!r}')
+        if flush_delay is not None and flush_delay < 0:
+            raise ValueError(f'flush_delay must be >= 0 or None, '
+                             f'got {flush_delay!r}')
+        self._write_batching = enabled
+        self._buffer = collections.deque() if enabled else bytearray()
+        self._batch_size = 0
+        self._flush_threshold = flush_threshold
+        self._flush_delay = flush_delay
+
+    def get_write_batching_stats(self):
+        return {
+            'writes': self._batched_writes,
+            'syscalls': self._sendmsg_calls,
+            'syscalls_saved': max(0,
+                                  self._batched_writes - self._sendmsg_calls),
+            'bytes_coalesced': self._bytes_coalesced,
+        }
+
+    def flush(self):
+        if self._write_batching and self._flush_handle is not None:
+            self._write_sendmsg()
+
+    def get_write_buffer_size(self):
+        if self._write_batching:
+            return self._batch_size if self._buffer else 0
+        return len(self._buffer)
+
+    def _write_batched(self, data):
+        if not isinstance(data, bytes):
+            data = bytes(data)
+        was_empty = not self._buffer
+        self._buffer.append(data)
+        self._batch_size += len(data)
+        self._batched_writes += 1
+        if was_empty:
+            # Otherwise a flush is already scheduled or the socket is not
+            # writable and the writer callback is registered.
+            if self._flush_delay is None:
+                self._flush_handle = self._loop.call_soon(
+                    self._write_sendmsg)
+            else:
+                self._flush_handle = self._loop.call_later(
+                    self._flush_delay, self._write_sendmsg)
+        if (self._flush_handle is not None and
+                self._batch_size >= self._flush_threshold):
+            self._write_sendmsg()
+        else:
+            self._maybe_pause_protocol()
+
+    def _write_sendmsg(self):
+        # Flush the batched data: called when a scheduled flush is due,
+        # when the flush threshold is reached or when the socket becomes
+        # writable again after a partial send.
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+            add_writer = True
+        else:
+            add_writer = False
+        if self._conn_lost or not self._buffer:
+            return
+        buffers = list(itertools.islice(self._buffer, _IOV_MAX))
+        try:
+            if _HAS_SENDMSG:
+                n = self._sock.sendmsg(buffers)
+            else:
+                n = self._sock.send(b''.join(buffers))
+        except (BlockingIOError, InterruptedError):
+            n = 0
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as exc:
+            if not add_writer:
+                self._loop._remove_writer(self._sock_fd)
+            self._buffer.clear()
+            self._batch_size = 0
+            self._fatal_error(exc, 'Fatal write error on socket transport')
+            if self._empty_waiter is not None:
+                self._empty_waiter.set_exception(exc)
+            return
+        self._sendmsg_calls += 1
+        if len(buffers) > 1:
+            self._bytes_coalesced += n
+        self._batch_size -= n
+        while n:
+            data = self._buffer[0]
+            if len(data) <= n:
+                n -= len(data)
+                self._buffer.popleft()
+            else:
+                self._buffer[0] = memoryview(data)[n:]
+                n = 0
+        if self._buffer:
+            # Wait until the socket is writable to send the rest.
+            if add_writer:
+                self._loop._add_writer(self._sock_fd, self._write_sendmsg)
+            self._maybe_pause_protocol()
+            return
+        if not add_writer:
+            self._loop._remove_writer(self._sock_fd)
+        self._maybe_resume_protocol()  # May append to buffer.
+        if not self._buffer:
+            if self._empty_waiter is not None:
+                self._empty_waiter.set_result(None)
+            if self._closing:
+                self._call_connection_lost(None)
+            elif self._eof:
+                self._sock.shutdown(socket.SHUT_WR)
+
     def write_eof(self):
         if self._closing or self._eof:
             return
@@ -1,5 +1,6 @@
 __all__ = (
     'StreamReader', 'StreamWriter', 'StreamReaderProtocol',
+    'BufferedStreamReader', 'BufferedStreamReaderProtocol',
     'open_connection', 'start_server')
 
 import socket
@@ -22,8 +23,14 @@
 _DEFAULT_LIMIT = 2 ** 16  # 64 KiB
 
 
+def _stream_classes(buffered):
+    if buffered:
+        return BufferedStreamReader, BufferedStreamReaderProtocol
+    return StreamReader, StreamReaderProtocol
+
+
 async def open_connection(host=None, port=None, *,
-                          limit=_DEFAULT_LIMIT, **kwds):
+                          limit=_DEFAULT_LIMIT, buffered=False, **kwds):
     """A wrapper for create_connection() returning a (reader, writer) pair.
 
     The reader returned is a StreamReader instance; the writer is a
@@ -34,16 +41,18 @@ async def open_connection(host=None, port=None, *,
     with various optional keyword arguments following.
 
     Additional optional keyword arguments are loop (to set the event loop
-    instance to use) and limit (to set the buffer limit passed to the
-    StreamReader).
+    instance to use), limit (to set the buffer limit passed to the
+    StreamReader) and buffered (to return a BufferedStreamReader, whose
+    read methods return memoryviews instead of copies).
 
     (If you want to customize the StreamReader and/or
     StreamReaderProtocol classes, just copy the code -- there's
     really nothing special here except some convenience.)
     """
     loop = events.get_running_loop()
-    reader = StreamReader(limit=limit, loop=loop)
-    protocol = StreamReaderProtocol(reader, loop=loop)
+    reader_class, protocol_class = _stream_classes(buffered)
+    reader = reader_class(limit=limit, loop=loop)
+    protocol = protocol_class(reader, loop=loop)
     transport, _ = await loop.create_connection(
         lambda: protocol, host, port, **kwds)
     writer = StreamWriter(transport, protocol, reader, loop)
@@ -51,7 +60,7 @@ async def open_connection(host=None, port=None, *,
 
 
 async def start_server(client_connected_cb, host=None, port=None, *,
-                       limit=_DEFAULT_LIMIT, **kwds):
+                       limit=_DEFAULT_LIMIT, buffered=False, **kwds):
     """Start a socket server, call back for each client connected.
 
     The first parameter, `client_connected_cb`, takes two parameters:
@@ -67,18 +76,19 @@ async def start_server(client_connected_cb, host=None, port=None, *,
     following.  The return value is the same as loop.create_server().
 
     Additional optional keyword arguments are loop (to set the event loop
-    instance to use) and limit (to set the buffer limit passed to the
-    StreamReader).
+    instance to use), limit (to set the buffer limit passed to the
+    StreamReader) and buffered (to pass a BufferedStreamReader to
+    client_connected_cb).
 
     The return value is the same as loop.create_server(), i.e. a
     Server object which can be used to stop the service.
     """
     loop = events.get_running_loop()
+    reader_class, protocol_class = _stream_classes(buffered)
 
     def factory():
-        reader = StreamReader(limit=limit, loop=loop)
-        protocol = StreamReaderProtocol(reader, client_connected_cb,
-                                        loop=loop)
+        reader = reader_class(limit=limit, loop=loop)
+        protocol = protocol_class(reader, client_connected_cb, loop=loop)
         return protocol
 
     return await loop.create_server(factory, host, port, **kwds)
@@ -88,26 +98,30 @@ def factory():
     # UNIX Domain Sockets are supported on this platform
 
     async def open_unix_connection(path=None, *,
-                                   limit=_DEFAULT_LIMIT, **kwds):
+                                   limit=_DEFAULT_LIMIT, buffered=False,
+                                   **kwds):
         """Similar to `open_connection` but works with UNIX Domain Sockets."""
         loop = events.get_running_loop()
+        reader_class, protocol_class = _stream_classes(buffered)
 
-        reader = StreamReader(limit=limit, loop=loop)
-        protocol = StreamReaderProtocol(reader, loop=loop)
+        reader = reader_class(limit=limit, loop=loop)
+        protocol = protocol_class(reader, loop=loop)
         transport, _ = await loop.create_unix_connection(
             lambda: protocol, path, **kwds)
         writer = StreamWriter(transport, protocol, reader, loop)
         return reader, writer
 
     async def start_unix_server(client_connected_cb, path=None, *,
-                                limit=_DEFAULT_LIMIT, **kwds):
+                                limit=_DEFAULT_LIMIT, buffered=False,
+                                **kwds):
         """Similar to `start_server` but works with UNIX Domain Sockets."""
         loop = events.get_running_loop()
+        reader_class, protocol_class = _stream_classes(buffered)
 
         def factory():
-            reader = StreamReader(limit=limit, loop=loop)
-            protocol = StreamReaderProtocol(reader, client_connected_cb,
-                                            loop=loop)
+            reader = reader_class(limit=limit, loop=loop)
+            protocol = protocol_class(reader, client_connected_cb,
+                                      loop=loop)
             return protocol
 
         return await loop.create_unix_server(factory, path, **kwds)
@@ -288,6 +302,28 @@ def __del__(self):
             closed.exception()
 
 
+class BufferedStreamReaderProtocol(StreamReaderProtocol,
+                                   protocols.BufferedProtocol):
+    """StreamReaderProtocol that lets the transport fill the reader buffer.
+
+    The transport receives data directly into the buffer of a
+    BufferedStreamReader, avoiding the intermediate bytes object
+    created for every data_received() call.
+    """
+
+    def get_buffer(self, sizehint):
+        reader = self._stream_reader
+        if reader is None:
+            # Nobody will read the data any more: discard it.
+            return bytearray(_DEFAULT_LIMIT)
+        return reader.get_buffer(sizehint)
+
+    def buffer_updated(self, nbytes):
+        reader = self._stream_reader
+        if reader is not None:
+            reader.buffer_updated(nbytes)
+
+
 class StreamWriter:
     """Wraps a Transport.
 
@@ -720,3 +756,288 @@ async def __anext__(self):
         if val == b'':
             raise StopAsyncIteration
         return val
+
+
+class BufferedStreamReader(StreamReader):
+    """StreamReader variant which hands out views of its buffer.
+
+    Incoming data is written by the transport straight into a
+    preallocated buffer (see BufferedStreamReaderProtocol), and
+    read(), readexactly(), readuntil() and readline() return
+    memoryview objects over that buffer instead of copying the data
+    into new bytes objects.
+
+    A memoryview returned by a read method stays valid until the next
+    read method call on the same reader; copy it with bytes() if the
+    data has to outlive that.
+    """
+
+    def __init__(self, limit=_DEFAULT_LIMIT, loop=None):
+        super().__init__(limit=limit, loop=loop)
+        self._buffer = bytearray(limit)
+        # Unread data lives in self._buffer[self._start:self._end].
+        self._start = 0
+        self._end = 0
+        # Minimum free space offered to the transport per read.
+        self._min_read = max(limit // 4, 1)
+        # True while a view returned to the caller may still refer to
+        # consumed data in self._buffer.
+        self._pinned = False
+
+    def __repr__(self):
+        info = [self.__class__.__name__]
+        if self._end > self._start:
+            info.append(f'{self._end - self._start} bytes')
+        if self._eof:
+            info.append('eof')
+        if self._limit != _DEFAULT_LIMIT:
+            info.append(f'limit={self._limit}')
+        if self._waiter:
+            info.append(f'waiter={self._waiter!r}')
+        if self._exception:
+            info.append(f'exception={self._exception!r}')
+        if self._transport:
+            info.append(f'transport={self._transport!r}')
+        if self._paused:
+            info.append('paused')
+        return '<{}>'.format(' '.join(info))
+
+    def _maybe_resume_transport(self):
+        if self._paused and self._end - self._start <= self._limit:
+            self._paused = False
+            self._transport.resume_reading()
+
+    def at_eof(self):
+        """Return True if the buffer is empty and 'feed_eof' was called."""
+        return self._eof and self._start == self._end
+
+    def get_buffer(self, sizehint):
+        """Return a writable view of the free space at the buffer end.
+
+        Callers must report how many bytes they wrote with
+        buffer_updated() before calling any other method.
+        """
+        assert not self._eof, 'get_buffer after feed_eof'
+        want = max(sizehint, self._min_read)
+        if len(self._buffer) - self._end < want:
+            self._make_room(want)
+        return memoryview(self._buffer)[self._end:]
+
+    def buffer_updated(self, nbytes):
+        """Account for nbytes written into the view from get_buffer()."""
+        assert not self._eof, 'buffer_updated after feed_eof'
+
+        if not nbytes:
+            return
+
+        self._end += nbytes
+        self._wakeup_waiter()
+
+        if (self._transport is not None and
+                not self._paused and
+                self._end - self._start > 2 * self._limit):
+            try:
+                self._transport.pause_reading()
+            except NotImplementedError:
+                # The transport can't be paused.
+                # We'll just have to buffer all data.
+                # Forget the transport so we don't keep trying.
+                self._transport = None
+            else:
+                self._paused = True
+
+    def feed_data(self, data):
+        assert not self._eof, 'feed_data after feed_eof'
+
+        if not data:
+            return
+
+        data = memoryview(data).cast('B')
+        buf = self.get_buffer(len(data))
+        buf[:len(data)] = data
+        self.buffer_updated(len(data))
+
+    def _make_room(self, want):
+        size = self._end - self._start
+        needed = size + want
+        if needed <= len(self._buffer) and not self._pinned:
+            # Slide the unread data to the front.  The bytearray keeps
+            # its size so memoryviews exported by get_buffer() are fine.
+            self._buffer[:size] = self._buffer[self._start:self._end]
+        else:
+            # Either the buffer is too small, or the caller may still
+            # hold a view of the consumed data: switch to a new buffer
+            # and leave the old one to whoever still references it.
+            capacity = len(self._buffer)
+            while capacity < needed:
+                capacity *= 2
+            buffer = bytearray(capacity)
+            buffer[:size] = self._buffer[self._start:self._end]
+            self._buffer = buffer
+            self._pinned = False
+        self._start = 0
+        self._end = size
+
+    def _release(self):
+        # Views returned by previous read calls are no longer valid.
+        self._pinned = False
+        if self._start == self._end:
+            self._start = self._end = 0
+
+    def _consume(self, n):
+        view = memoryview(self._buffer)[self._start:self._start + n]
+        self._start += n
+        self._pinned = True
+        self._maybe_resume_transport()
+        return view
+
+    def _take_all(self):
+        data = bytes(self._buffer[self._start:self._end])
+        self._start = self._end = 0
+        return data
+
+    async def readline(self):
+        """Read chunk of data from the stream until newline (b'\\n') is found.
+
+        Same as StreamReader.readline(), but return a memoryview.
+        """
+        sep = b'\n'
+        seplen = len(sep)
+        try:
+            line = await self.readuntil(sep)
+        except exceptions.IncompleteReadError as e:
+            return memoryview(e.partial)
+        except exceptions.LimitOverrunError as e:
+            if self._buffer.startswith(sep, self._start + e.consumed,
+                                       self._end):
+                self._start += e.consumed + seplen
+            else:
+                self._start = self._end
+            self._maybe_resume_transport()
+            raise ValueError(e.args[0])
+        return line
+
+    async def readuntil(self, separator=b'\n'):
+        """Read data from the stream until ``separator`` is found.
+
+        Same as StreamReader.readuntil(), but return a memoryview.
+        """
+        seplen = len(separator)
+        if seplen == 0:
+            raise ValueError('Separator should be at least one-byte string')
+
+        if self._exception is not None:
+            raise self._exception
+
+        self._release()
+
+        # See StreamReader.readuntil() for the meaning of `offset`.
+        offset = 0
+
+        while True:
+            buflen = self._end - self._start
+
+            if buflen - offset >= seplen:
+                isep = self._buffer.find(separator, self._start + offset,
+                                         self._end)
+
+                if isep != -1:
+                    isep -= self._start
+                    break
+
+                offset = buflen + 1 - seplen
+                if offset > self._limit:
+                    raise exceptions.LimitOverrunError(
+                        'Separator is not found, and chunk exceed the limit',
+                        offset)
+
+            if self._eof:
+                raise exceptions.IncompleteReadError(self._take_all(), None)
+
+            await self._wait_for_data('readuntil')
+
+        if isep > self._limit:
+            raise exceptions.LimitOverrunError(
+                'Separator is found, but chunk is longer than limit', isep)
+
+        return self._consume(isep + seplen)
+
+    async def read(self, n=-1):
+        """Read up to `n` bytes from the stream.
+
+        Same as StreamReader.read(), but return a memoryview.  With a
+        negative `n` the data read until EOF has to be joined, so the
+        view is over a new bytes object rather than the buffer.
+        """
+
+        if self._exception is not None:
+            raise self._exception
+
+        self._release()
+
+        if n == 0:
+            return memoryview(b'')
+
+        if n < 0:
+            blocks = []
+            while True:
+                block = await self.read(self._limit)
+                if not block:
+                    break
+                blocks.append(bytes(block))
+            return memoryview(b''.join(blocks))
+
+        if self._start == self._end and not self._eof:
+            await self._wait_for_data('read')
+
+        return self._consume(min(n, self._end - self._start))
+
+    async def readexactly(self, n):
+        """Read exactly `n` bytes.
+
+        Same as StreamReader.readexactly(), but return a memoryview.
+        """
+        if n < 0:
+            raise ValueError('readexactly size can not be less than zero')
+
+        if self._exception is not None:
+            raise self._exception
+
+        self._release()
+
+        if n == 0:
+            return memoryview(b'')
+
+        while self._end - self._start < n:
+            if self._eof:
+                raise exceptions.IncompleteReadError(self._take_all(), n)
+
+            await self._wait_for_data('readexactly')
+
+        return self._consume(n)
+
+    async def readinto(self, buffer):
+        """Read up to len(buffer) bytes into the writable `buffer`.
+
+        Return the number of bytes read, which is 0 only if `buffer` is
+        empty or EOF was reached with nothing left to read.  The data
+        is copied once, from the internal buffer into `buffer`.
+        """
+        if self._exception is not None:
+            raise self._exception
+
+        self._release()
+
+        with memoryview(buffer) as view, view.cast('B') as dest:
+            if not dest:
+                return 0
+
+            if self._start == self._end and not self._eof:
+                await self._wait_for_data('readinto')
+
+            n = min(len(dest), self._end - self._start)
+            with memoryview(self._buffer) as src:
+                dest[:n] = src[self._start:self._start + n]
+        self._start += n
+        self._maybe_resume_transport()
+        return n
@@ -5,10 +5,11 @@
     'FIRST_COMPLETED', 'FIRST_EXCEPTION', 'ALL_COMPLETED',
     'wait', 'wait_for', 'as_completed', 'sleep',
     'gather', 'shield', 'ensure_future', 'run_coroutine_threadsafe',
-    'current_task', 'all_tasks',
+    'current_task', 'all_tasks', 'TaskStats', 'all_task_stats',
     '_register_task', '_unregister_task', '_enter_task', '_leave_task',
 )
 
+import collections
 import concurrent.futures
 import contextvars
 import functools
@@ -61,6 +62,34 @@ def all_tasks(loop=None):
             if futures._get_loop(t) is loop and not t.done()}
 
 
+TaskStats = collections.namedtuple(
+    'TaskStats',
+    'steps run_time queue_delay max_run_time max_queue_delay')
+TaskStats.__doc__ = """Statistics collected by loop.set_task_instrumentation().
+
+steps is the number of times the task ran; run_time and max_run_time
+are the total and longest time in seconds spent running it;
+queue_delay and max_queue_delay are the total and longest time it
+waited in the ready queue before running.
+"""
+
+
+def all_task_stats(loop=None):
+    """Return a dict mapping the loop's pending tasks to their TaskStats.
+
+    Tasks without statistics are left out: the dict is empty unless
+    loop.set_task_instrumentation(True) was called.
+    """
+    if loop is None:
+        loop = events.get_running_loop()
+    result = {}
+    for task in all_tasks(loop):
+        stats = loop.get_task_stats(task)
+        if stats is not None:
+            result[task] = stats
+    return result
+
+
 def _set_task_name(task, name):
     if name is not None:
         try:
@@ -116,6 +116,34 @@ def writelines(self, list_of_data):
         data = b''.join(list_of_data)
         self.write(data)
 
+    def set_write_batching(self, enabled=True, *, flush_threshold=64 * 1024,
+                           flush_delay=None):
+        """Enable or disable write batching.
+
+        When enabled, write() only queues the data: all data written
+        during an event loop iteration is sent with a single scatter/gather
+        system call at the next iteration, or after flush_delay seconds if
+        it is not None.  The data is sent right away once flush_threshold
+        bytes are pending.  The mode cannot be changed while data is
+        buffered.
+        """
+        raise NotImplementedError
+
+    def get_write_batching_stats(self):
+        """Return a dict of counters about write batching.
+
+        The keys are 'writes' (number of batched write() calls),
+        'syscalls' (number of system calls used to send them),
+        'syscalls_saved' and 'bytes_coalesced' (number of bytes sent by
+        system calls combining several writes).
+        """
+        raise NotImplementedError
+
+    def flush(self):
+        """Send the batched data now instead of waiting for the
+        scheduled flush."""
+        raise NotImplementedError
+
     def write_eof(self):
         """Close the write end after flushing buffered data.
 
@@ -45,6 +45,8 @@
 
 __author__ = 'Brian Quinlan (brian@sweetapp.com)'
 
+import collections
+import io
 import os
 from concurrent.futures import _base
 import queue
@@ -55,7 +57,9 @@
 import weakref
 from functools import partial
 import itertools
+import pickle
 import sys
+import time
 import traceback
 
 
@@ -154,6 +158,43 @@ def __init__(self, work_id, fn, args, kwargs):
         self.args = args
         self.kwargs = kwargs
 
+class _SharedMemoryResult(object):
+    """Handle for a result whose large buffers live in shared memory.
+
+    Only this handle crosses the result queue: *kind* tells how to rebuild
+    the result, *data* is the pickled payload (or None for a plain buffer)
+    and *segments* lists the (name, size) of the shared memory segments,
+    which may be empty if the payload had no large buffer.
+    """
+    def __init__(self, kind, data, segments):
+        self.kind = kind
+        self.data = data
+        self.segments = segments
+
+    def load(self):
+        """Rebuild the result and unlink all of its segments."""
+        buffers = []
+        error = None
+        # Plain bytes are built straight from the segment; other results
+        # get a bytearray, which unpickled objects may keep a view on.
+        factory = bytes if self.kind == 'bytes' else bytearray
+        for name, size in self.segments:
+            try:
+                buffers.append(_from_shared_memory(name, size, factory))
+            except BaseException as e:
+                # Keep going so that the other segments are released too
+                error = e
+        if error is not None:
+            raise error
+        if self.data is not None:
+            return pickle.loads(self.data, buffers=buffers)
+        buf, = buffers
+        if self.kind in ('bytes', 'bytearray'):
+            return buf
+        else:
+            _, format, shape = self.kind
+            return memoryview(buf).cast(format, shape)
+
 
 class _SafeQueue(Queue):
     """Safe Queue set exception to the future object linked to a job"""
@@ -202,6 +243,109 @@ def _process_chunk(fn, chunk):
     return [fn(*args) for args in chunk]
 
 
+def _process_timed_chunk(fn, chunk):
+    """ Processes a chunk like _process_chunk() and times it.
+
+    Returns a (seconds, results) tuple.
+
+    This function is run in a separate process.
+
+    """
+    start = time.perf_counter()
+    results = [fn(*args) for args in chunk]
+    return time.perf_counter() - start, results
+
+
+def _to_shared_memory(view):
+    """Copy a contiguous memoryview to a new shared memory segment.
+
+    The segment is closed but not unlinked: the process receiving the
+    (name, size) pair is responsible for unlinking it.  It stays registered
+    with the resource tracker shared with that process, which unlinks it
+    at shutdown if it is never received.
+    """
+    from multiprocessing import shared_memory
+    size = view.nbytes
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        shm.buf[:size] = view.cast('B')
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    shm.close()
+    return shm.name, size
+
+
+def _from_shared_memory(name, size, factory=bytearray):
+    """Copy a shared memory segment with factory() and unlink it."""
+    from multiprocessing import shared_memory
+    shm = shared_memory.SharedMemory(name)
+    try:
+        with shm.buf[:size] as view:
+            return factory(view)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _export_result(result, threshold):
+    """Move the buffers of result larger than threshold to shared memory.
+
+    Returns either result itself or a _SharedMemoryResult handle. bytes,
+    bytearray and memoryview results are copied as a whole, other objects
+    are pickled with protocol 5 and their out-of-band buffers are moved.
+    The handle carries the pickled payload even when no buffer was moved,
+    so that the result is not pickled a second time by the queue.
+
+    This function is run in a separate process.
+    """
+    segments = []
+    try:
+        if type(result) in (bytes, bytearray, memoryview):
+            view = memoryview(result)
+            if view.nbytes < threshold:
+                return result
+            if isinstance(result, memoryview):
+                kind = ('memoryview', view.format, list(view.shape))
+            else:
+                kind = type(result).__name__
+            if not view.c_contiguous:
+                view = memoryview(view.tobytes())
+            segments.append(_to_shared_memory(view))
+            return _SharedMemoryResult(kind, None, segments)
+
+        def buffer_callback(buf):
+            try:
+                view = buf.raw()
+            except BufferError:
+                # Non-contiguous buffers are serialized in-band
+                return True
+            if view.nbytes < threshold:
+                return True
+            segments.append(_to_shared_memory(view))
+            return False
+
+        buf = io.BytesIO()
+        mp.reduction.ForkingPickler(
+            buf, 5, buffer_callback=buffer_callback).dump(result)
+        return _SharedMemoryResult('pickle', buf.getvalue(), segments)
+    except BaseException:
+        _unlink_segments(segments)
+        raise
+
+
+def _unlink_segments(segments):
+    from multiprocessing import shared_memory
+    for name, _ in segments:
+        try:
+            shm = shared_memory.SharedMemory(name)
+        except OSError:
+            continue
+        shm.close()
+        shm.unlink()
+
+
 def _sendback_result(result_queue, work_id, result=None, exception=None):
     """Safely send back the given result or exception"""
     try:
@@ -212,7 +356,8 @@ def _sendback_result(result_queue, work_id, result=None, exception=None):
         result_queue.put(_ResultItem(work_id, exception=exc))
 
 
-def _process_worker(call_queue, result_queue, initializer, initargs):
+def _process_worker(call_queue, result_queue, initializer, initargs,
+                    shared_memory_threshold=None):
     """Evaluates calls from call_queue and places the results in result_queue.
 
     This worker is run in a separate process.
@@ -224,6 +369,8 @@ def _process_worker(call_queue, result_queue, initializer, initargs):
             to by the worker.
         initializer: A callable initializer, or None
         initargs: A tuple of args for the initializer
+        shared_memory_threshold: The size in bytes from which result
+            buffers are sent back through shared memory, or None
     """
     if initializer is not None:
         try:
@@ -241,6 +388,8 @@ def _process_worker(call_queue, result_queue, initializer, initargs):
             return
         try:
             r = call_item.fn(*call_item.args, **call_item.kwargs)
+            if shared_memory_threshold is not None:
+                r = _export_result(r, shared_memory_threshold)
         except BaseException as e:
             exc = _ExceptionWithTraceback(e, e.__traceback__)
             _sendback_result(result_queue, call_item.work_id, exception=exc)
@@ -410,12 +559,22 @@ def process_result_item(self, result_item):
         else:
             # Received a _ResultItem so mark the future as completed.
             work_item = self.pending_work_items.pop(result_item.work_id, None)
+            exception = result_item.exception
+            result = result_item.result
+            if isinstance(result, _SharedMemoryResult):
+                # Rebuild the result even if nobody waits for it anymore:
+                # this releases its shared memory segments.
+                try:
+                    result = result.load()
+                except BaseException as e:
+                    exception = e
+                    result = None
             # work_item can be None if another process terminated (see above)
             if work_item is not None:
-                if result_item.exception:
-                    work_item.future.set_exception(result_item.exception)
+                if exception:
+                    work_item.future.set_exception(exception)
                 else:
-                    work_item.future.set_result(result_item.result)
+                    work_item.future.set_result(result)
 
     def is_shutting_down(self):
         # Check whether we should start shutting down the executor.
@@ -571,7 +730,8 @@ class BrokenProcessPool(_base.BrokenExecutor):
 
 class ProcessPoolExecutor(_base.Executor):
     def __init__(self, max_workers=None, mp_context=None,
-                 initializer=None, initargs=()):
+                 initializer=None, initargs=(), *,
+                 shared_memory_threshold=None):
         """Initializes a new ProcessPoolExecutor instance.
 
         Args:
@@ -582,6 +742,11 @@ def __init__(self, max_workers=None, mp_context=None,
                 object should provide SimpleQueue, Queue and Process.
             initializer: A callable used to initialize worker processes.
             initargs: A tuple of arguments to pass to the initializer.
+            shared_memory_threshold: If not None, bytes, bytearray and
+                memoryview results and pickle protocol 5 out-of-band buffers
+                of at least this many bytes are sent back to the parent
+                through shared memory instead of the result pipe. Ignored
+                on Windows.
         """
         _check_system_limits()
 
@@ -609,6 +774,22 @@ def __init__(self, max_workers=None, mp_context=None,
         self._initializer = initializer
         self._initargs = initargs
 
+        if shared_memory_threshold is not None:
+            if shared_memory_threshold <= 0:
+                raise ValueError("shared_memory_threshold must be greater "
+                                 "than 0")
+            if sys.platform == 'win32':
+                # Windows destroys a segment as soon as its last handle is
+                # closed, so it cannot outlive the worker's handle.
+                shared_memory_threshold = None
+            else:
+                # Start the resource tracker now, so that the workers share
+                # it with this process, which unregisters the segments they
+                # register when it unlinks them.
+                from multiprocessing import resource_tracker
+                resource_tracker.ensure_running()
+        self._shared_memory_threshold = shared_memory_threshold
+
         # Management thread
         self._executor_manager_thread = None
 
@@ -671,7 +852,8 @@ def _adjust_process_count(self):
                 args=(self._call_queue,
                       self._result_queue,
                       self._initializer,
-                      self._initargs))
+                      self._initargs,
+                      self._shared_memory_threshold))
             p.start()
             self._processes[p.pid] = p
 
@@ -710,6 +892,8 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
             chunksize: If greater than one, the iterables will be chopped into
                 chunks of size chunksize and submitted to the process pool.
                 If set to one, the items in the list will be sent one at a time.
+                If set to "auto", the size of the chunks follows the measured
+                cost of the calls and the iterables are consumed lazily.
 
         Returns:
             An iterator equivalent to: map(func, *iterables) but the calls may
@@ -720,6 +904,8 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
                 before the given timeout.
             Exception: If fn(*args) raises for any values.
         """
+        if chunksize == "auto":
+            return self._adaptive_map(fn, iterables, timeout)
         if chunksize < 1:
             raise ValueError("chunksize must be >= 1.")
 
@@ -728,6 +914,70 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
                               timeout=timeout)
         return _chain_from_iterable_of_lists(results)
 
+    def _adaptive_map(self, fn, iterables, timeout):
+        if timeout is not None:
+            end_time = timeout + time.monotonic()
+
+        chunker = mp.util._AdaptiveChunker(self._max_workers)
+        chunks = chunker.chunks(zip(*iterables))
+        window = 2 * self._max_workers
+        # Futures in submission order, and the size of the chunks of those
+        # whose completion was not accounted for yet
+        fs = collections.deque()
+        in_flight = {}
+
+        def submit_chunks():
+            while len(in_flight) < window:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    return
+                f = self.submit(_process_timed_chunk, fn, chunk)
+                fs.append(f)
+                in_flight[f] = len(chunk)
+
+        def account(f):
+            size = in_flight.pop(f)
+            if f.exception() is None:
+                chunker.record(size, f.result()[0])
+            else:
+                chunker.record(size)
+
+        # Start the work before the first result is required
+        submit_chunks()
+
+        def result_iterator():
+            try:
+                while fs:
+                    f = fs[0]
+                    # Keep the workers busy while waiting for the oldest
+                    # chunk, each completion refining the next chunk sizes.
+                    while not f.done():
+                        if timeout is None:
+                            done, _ = _base.wait(
+                                in_flight, return_when=_base.FIRST_COMPLETED)
+                        else:
+                            done, _ = _base.wait(
+                                in_flight, end_time - time.monotonic(),
+                                return_when=_base.FIRST_COMPLETED)
+                            if not done:
+                                raise _base.TimeoutError
+                        for done_f in done:
+                            account(done_f)
+                        submit_chunks()
+                    fs.popleft()
+                    if f in in_flight:
+                        account(f)
+                        submit_chunks()
+                    results = f.result()[1]
+                    del f
+                    results.reverse()
+                    while results:
+                        yield results.pop()
+            finally:
+                for f in fs:
+                    f.cancel()
+        return result_iterator()
+
     def shutdown(self, wait=True, *, cancel_futures=False):
         with self._shutdown_lock:
             self._cancel_pending_futures = cancel_futures
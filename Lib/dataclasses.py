@@ -6,8 +6,12 @@
 import keyword
 import builtins
 import functools
+import itertools
 import abc
+import array
+import marshal
 import _thread
+import collections.abc
 from types import FunctionType, GenericAlias
 
 
@@ -25,6 +29,9 @@
            'make_dataclass',
            'replace',
            'is_dataclass',
+           'save_code_cache',
+           'load_code_cache',
+           'Columns',
            ]
 
 # Conditions for adding methods.  The boxes indicate what action the
@@ -375,6 +382,48 @@ def wrapper(self):
     return wrapper
 
 
+# The compiled code of the generated functions, by source text.  The text
+# only depends on the shape of the class (the field names, which fields
+# have defaults, the flags), so classes with the same shape share it,
+# while the defaults, types and globals are bound when the code is run.
+# Entries loaded from a file are kept marshalled until they are used.
+_code_cache = {}
+_MAXCODECACHE = 10000
+
+def _code_cache_signature():
+    # The code objects depend on the version of Python.
+    return b'dataclasses.code_cache', sys.version
+
+def save_code_cache(filename):
+    """Save the compiled code of the methods generated for dataclasses to
+    a file, to be restored with load_code_cache()."""
+    entries = {txt: code if isinstance(code, bytes) else marshal.dumps(code)
+               for txt, code in list(_code_cache.items())}
+    data = marshal.dumps((_code_cache_signature(), entries))
+    with open(filename, 'wb') as file:
+        file.write(data)
+
+def load_code_cache(filename):
+    """Add the compiled code saved by save_code_cache() to the cache, and
+    return the number of entries added.  Files written by other versions
+    of Python are ignored."""
+    with open(filename, 'rb') as file:
+        data = file.read()
+    try:
+        signature, entries = marshal.loads(data)
+    except (EOFError, TypeError, ValueError):
+        raise ValueError(f'{filename!r} is not a dataclasses code cache file')
+    if signature != _code_cache_signature():
+        return 0
+    count = 0
+    for txt, code in entries.items():
+        if len(_code_cache) >= _MAXCODECACHE:
+            break
+        if txt not in _code_cache:
+            _code_cache[txt] = code
+            count += 1
+    return count
+
 def _create_fn(name, args, body, *, globals=None, locals=None,
                return_type=MISSING):
     # Note that we mutate locals when exec() is called.  Caller
@@ -397,8 +446,18 @@ def _create_fn(name, args, body, *, globals=None, locals=None,
     local_vars = ', '.join(locals.keys())
     txt = f"def __create_fn__({local_vars}):\n{txt}\n return {name}"
 
+    code = _code_cache.get(txt)
+    if code is None:
+        code = compile(txt, '<string>', 'exec')
+        # Keep the code of the first classes, usually created at import
+        # time, if there are too many shapes.
+        if len(_code_cache) < _MAXCODECACHE:
+            _code_cache[txt] = code
+    elif isinstance(code, bytes):
+        code = _code_cache[txt] = marshal.loads(code)
+
     ns = {}
-    exec(txt, globals, ns)
+    exec(code, globals, ns)
     func = ns['__create_fn__'](**locals)
     for arg, annotation in func.__annotations__.copy().items():
         func.__annotations__[arg] = locals[annotation]
@@ -416,7 +475,7 @@ def _field_assign(frozen, name, value, self_name):
     return f'{self_name}.{name}={value}'
 
 
-def _field_init(f, frozen, globals, self_name):
+def _field_init(f, frozen, globals, self_name, slots):
     # Return the text of the line in the body of __init__ that will
     # initialize this field.
 
@@ -455,6 +514,11 @@ def _field_init(f, frozen, globals, self_name):
             elif f.default is not MISSING:
                 globals[default_name] = f.default
                 value = f.name
+        elif slots and f.default is not MISSING:
+            # The class attribute holding the default is replaced by
+            # the slot, so initialize the field here.
+            globals[default_name] = f.default
+            value = default_name
         else:
             # This field does not need initialization.  Signify that
             # to the caller by returning None.
@@ -489,7 +553,7 @@ def _init_param(f):
     return f'{f.name}:_type_{f.name}{default}'
 
 
-def _init_fn(fields, frozen, has_post_init, self_name, globals):
+def _init_fn(fields, frozen, has_post_init, self_name, globals, slots):
     # fields contains both real fields and InitVar pseudo-fields.
 
     # Make sure we don't have fields without defaults following fields
@@ -515,7 +579,7 @@ def _init_fn(fields, frozen, has_post_init, self_name, globals):
 
     body_lines = []
     for f in fields:
-        line = _field_init(f, frozen, locals, self_name)
+        line = _field_init(f, frozen, locals, self_name, slots)
         # line is None means that this field doesn't require
         # initialization (it's a pseudo-field).  Just skip it.
         if line:
@@ -821,7 +885,8 @@ def _hash_exception(cls, fields, globals):
 # version of this table.
 
 
-def _process_class(cls, init, repr, eq, order, unsafe_hash, frozen):
+def _process_class(cls, init, repr, eq, order, unsafe_hash, frozen, slots,
+                   weakref_slot):
     # Now that dicts retain insertion order, there's no reason to use
     # an ordered dict.  I am leveraging that ordering here, because
     # derived class fields overwrite base class fields, but the order
@@ -948,6 +1013,7 @@ def _process_class(cls, init, repr, eq, order, unsafe_hash, frozen):
                                     '__dataclass_self__' if 'self' in fields
                                             else 'self',
                                     globals,
+                                    slots,
                           ))
 
     # Get the fields as a list, and include only real fields.  This is
@@ -1009,11 +1075,102 @@ def _process_class(cls, init, repr, eq, order, unsafe_hash, frozen):
 
     abc.update_abstractmethods(cls)
 
+    if slots:
+        cls = _add_slots(cls, frozen, weakref_slot)
+
     return cls
 
 
+def _dataclass_getstate(self):
+    return [getattr(self, f.name) for f in fields(self)]
+
+
+def _dataclass_setstate(self, state):
+    for field, value in zip(fields(self), state):
+        # Use object.__setattr__ because the dataclass may be frozen.
+        object.__setattr__(self, field.name, value)
+
+
+def _get_slots(cls):
+    # Return the names of the slots defined by cls itself.
+    slots = cls.__dict__.get('__slots__', ())
+    if isinstance(slots, str):
+        return (slots,)
+    return slots
+
+
+def _replace_class_references(value, old, new):
+    # Make the functions of the class refer to the new class in their
+    # closures: the __class__ cell used by super(), or the class used
+    # by the generated __setattr__() and __delattr__() of frozen classes.
+    if isinstance(value, (classmethod, staticmethod)):
+        funcs = (value.__func__,)
+    elif isinstance(value, property):
+        funcs = (value.fget, value.fset, value.fdel)
+    else:
+        funcs = (value,)
+    for func in funcs:
+        # Look through wrappers, such as the one used by __repr__().
+        while isinstance(func, FunctionType):
+            for cell in func.__closure__ or ():
+                try:
+                    contents = cell.cell_contents
+                except ValueError:
+                    continue
+                if contents is old:
+                    cell.cell_contents = new
+            func = getattr(func, '__wrapped__', None)
+
+
+def _add_slots(cls, is_frozen, weakref_slot):
+    # Need to create a new class, since we can't set __slots__ after a
+    # class has been created.
+
+    # Make sure __slots__ isn't already set.
+    if '__slots__' in cls.__dict__:
+        raise TypeError(f'{cls.__name__} already specifies __slots__')
+
+    # Create a new dict for our new class.
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+    if weakref_slot:
+        field_names += ('__weakref__',)
+    # Only add the slots which the base classes do not already have.
+    inherited_slots = set()
+    for base in cls.__mro__[1:-1]:
+        inherited_slots.update(_get_slots(base))
+    cls_dict['__slots__'] = tuple(name for name in field_names
+                                  if name not in inherited_slots)
+    for field_name in field_names:
+        # Remove our attributes, if present.  The defaults are still
+        # available in the fields.
+        cls_dict.pop(field_name, None)
+
+    # Remove __dict__ and __weakref__ themselves.
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+
+    # And finally create the class.
+    qualname = getattr(cls, '__qualname__', None)
+    new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    if qualname is not None:
+        new_cls.__qualname__ = qualname
+    for value in cls_dict.values():
+        _replace_class_references(value, cls, new_cls)
+
+    if is_frozen:
+        # Need this for pickling frozen classes with slots.
+        if '__getstate__' not in cls_dict:
+            new_cls.__getstate__ = _dataclass_getstate
+        if '__setstate__' not in cls_dict:
+            new_cls.__setstate__ = _dataclass_setstate
+
+    return new_cls
+
+
 def dataclass(cls=None, /, *, init=True, repr=True, eq=True, order=False,
-              unsafe_hash=False, frozen=False):
+              unsafe_hash=False, frozen=False, slots=False,
+              weakref_slot=False):
     """Returns the same class as was passed in, with dunder methods
     added based on the fields defined in the class.
 
@@ -1023,11 +1180,16 @@ def dataclass(cls=None, /, *, init=True, repr=True, eq=True, order=False,
     repr is true, a __repr__() method is added. If order is true, rich
     comparison dunder methods are added. If unsafe_hash is true, a
     __hash__() method function is added. If frozen is true, fields may
-    not be assigned to after instance creation.
+    not be assigned to after instance creation. If slots is true, a new
+    class with a __slots__ attribute is returned; if weakref_slot is also
+    true, its instances can be weakly referenced.
     """
+    if weakref_slot and not slots:
+        raise TypeError('weakref_slot is True but slots is False')
 
     def wrap(cls):
-        return _process_class(cls, init, repr, eq, order, unsafe_hash, frozen)
+        return _process_class(cls, init, repr, eq, order, unsafe_hash,
+                              frozen, slots, weakref_slot)
 
     # See if we're being called as @dataclass or @dataclass().
     if cls is None:
@@ -1186,7 +1348,7 @@ def _astuple_inner(obj, tuple_factory):
 
 def make_dataclass(cls_name, fields, *, bases=(), namespace=None, init=True,
                    repr=True, eq=True, order=False, unsafe_hash=False,
-                   frozen=False):
+                   frozen=False, slots=False, weakref_slot=False):
     """Return a new dynamically created dataclass.
 
     The dataclass name will be 'cls_name'.  'fields' is an iterable
@@ -1206,8 +1368,8 @@ class C(Base):
 
     For the bases and namespace parameters, see the builtin type() function.
 
-    The parameters init, repr, eq, order, unsafe_hash, and frozen are passed to
-    dataclass().
+    The parameters init, repr, eq, order, unsafe_hash, frozen, slots and
+    weakref_slot are passed to dataclass().
     """
 
     if namespace is None:
@@ -1247,7 +1409,8 @@ class C(Base):
     # of generic dataclassses.
     cls = types.new_class(cls_name, bases, {}, lambda ns: ns.update(namespace))
     return dataclass(cls, init=init, repr=repr, eq=eq, order=order,
-                     unsafe_hash=unsafe_hash, frozen=frozen)
+                     unsafe_hash=unsafe_hash, frozen=frozen, slots=slots,
+                     weakref_slot=weakref_slot)
 
 
 def replace(obj, /, **changes):
@@ -1299,3 +1462,180 @@ class C:
     # changes that aren't fields, this will correctly raise a
     # TypeError.
     return obj.__class__(**changes)
+
+
+# The typecodes of the array columns used by default for fields with these
+# types, as objects or as strings (with postponed evaluation of annotations).
+_COLUMN_TYPECODES = {int: 'q', 'int': 'q', float: 'd', 'float': 'd'}
+
+
+class Columns(collections.abc.MutableSequence):
+    """A mutable sequence of instances of a dataclass, stored as one column
+    per field.
+
+    Each column is an array.array if a typecode is given for the field in
+    'typecodes', or if the field is annotated as int or float, and a list
+    otherwise.  A row is converted to a new instance of the dataclass when
+    it is read, without calling __init__(); assign it back to change the
+    columns.  column() returns the column of a field.
+
+      @dataclass
+      class Point:
+          x: float
+          y: float
+          label: str = ''
+
+      points = Columns(Point, [Point(1.0, 2.0)])
+      points.append(Point(3.0, 4.0, 'b'))
+      assert points[1] == Point(3.0, 4.0, 'b')
+      assert points.column('x') == array.array('d', [1.0, 3.0])
+    """
+
+    def __init__(self, cls, rows=(), *, typecodes=None):
+        if not isinstance(cls, type) or not is_dataclass(cls):
+            raise TypeError('Columns() should be called with a dataclass')
+        flds = fields(cls)
+        if not flds:
+            raise ValueError(f'dataclass {cls.__name__} has no fields')
+        if typecodes is None:
+            typecodes = {}
+        self.cls = cls
+        self._names = tuple(f.name for f in flds)
+        for name in typecodes:
+            if name not in self._names:
+                raise ValueError(f'{name!r} is not a field of {cls.__name__}')
+        self.typecodes = {}
+        for f in flds:
+            if f.name in typecodes:
+                typecode = typecodes[f.name]
+            else:
+                try:
+                    typecode = _COLUMN_TYPECODES.get(f.type)
+                except TypeError:
+                    # An unhashable annotation.
+                    typecode = None
+            self.typecodes[f.name] = typecode
+        self._columns = tuple(array.array(typecode) if typecode else []
+                              for typecode in self.typecodes.values())
+        self.extend(rows)
+
+    def column(self, name):
+        """Return the column storing the field 'name'."""
+        try:
+            return self._columns[self._names.index(name)]
+        except ValueError:
+            raise KeyError(name) from None
+
+    def _values(self, row):
+        if not isinstance(row, self.cls):
+            raise TypeError(f'expected a {self.cls.__name__} instance, '
+                            f'not {type(row).__name__}')
+        return [getattr(row, name) for name in self._names]
+
+    def _row(self, values):
+        cls = self.cls
+        row = cls.__new__(cls)
+        for name, value in zip(self._names, values):
+            # Use object.__setattr__ because the dataclass may be frozen.
+            object.__setattr__(row, name, value)
+        return row
+
+    def __len__(self):
+        return len(self._columns[0])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            result = self.__class__.__new__(self.__class__)
+            result.cls = self.cls
+            result._names = self._names
+            result.typecodes = self.typecodes.copy()
+            result._columns = tuple(column[index] for column in self._columns)
+            return result
+        return self._row([column[index] for column in self._columns])
+
+    def __iter__(self):
+        row = self._row
+        for values in zip(*self._columns):
+            yield row(values)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            rows = [self._values(row) for row in value]
+            # Convert all the values before changing any column.
+            parts = []
+            for i, column in enumerate(self._columns):
+                part = [values[i] for values in rows]
+                if isinstance(column, array.array):
+                    part = array.array(column.typecode, part)
+                parts.append(part)
+            for column, part in zip(self._columns, parts):
+                column[index] = part
+            return
+        values = self._values(value)
+        old = [column[index] for column in self._columns]
+        try:
+            for column, value in zip(self._columns, values):
+                column[index] = value
+        except BaseException:
+            for column, value in zip(self._columns, old):
+                column[index] = value
+            raise
+
+    def __delitem__(self, index):
+        for column in self._columns:
+            del column[index]
+
+    def append(self, row):
+        values = self._values(row)
+        done = 0
+        try:
+            for column, value in zip(self._columns, values):
+                column.append(value)
+                done += 1
+        except BaseException:
+            # Keep the columns the same length.
+            for column in self._columns[:done]:
+                del column[-1]
+            raise
+
+    def extend(self, rows):
+        if rows is self:
+            rows = list(rows)
+        get_values = self._values
+        it = iter(rows)
+        while True:
+            # Convert the rows in chunks, to add them to each column with
+            # a single call without keeping another copy of all the values.
+            chunk = [get_values(row) for row in itertools.islice(it, 1024)]
+            if not chunk:
+                break
+            parts = []
+            for i, column in enumerate(self._columns):
+                part = [row[i] for row in chunk]
+                if isinstance(column, array.array):
+                    part = array.array(column.typecode, part)
+                parts.append(part)
+            for column, part in zip(self._columns, parts):
+                column.extend(part)
+
+    def insert(self, index, row):
+        values = self._values(row)
+        size = len(self)
+        if index < 0:
+            index = max(size + index, 0)
+        else:
+            index = min(index, size)
+        done = 0
+        try:
+            for column, value in zip(self._columns, values):
+                column.insert(index, value)
+                done += 1
+        except BaseException:
+            # Keep the columns the same length.
+            for column in self._columns[:done]:
+                del column[index]
+            raise
+
+    def __repr__(self):
+        return (f'{self.__class__.__name__}({self.cls.__qualname__}, '
+                f'{list(self)!r})')
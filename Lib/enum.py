@@ -177,6 +177,11 @@ def __set_name__(self, enum_class, member_name):
         if descriptor and not need_override:
             # previous enum.property found, no further action needed
             pass
+        elif (descriptor is None and not need_override
+                and not _is_descriptor(enum_member)):
+            # nothing to redirect: store the member itself in the class, so
+            # that looking it up is a plain class attribute access
+            setattr(enum_class, member_name, enum_member)
         else:
             redirect = property()
             redirect.__set_name__(enum_class, member_name)
@@ -448,6 +453,14 @@ def __call__(cls, value, names=None, *, module=None, qualname=None, type=None, s
         `type`, if set, will be mixed in as the first base class.
         """
         if names is None:  # simple value lookup
+            # fast path for existing members with a hashable value, falling
+            # back to Enum.__new__ for the other cases
+            try:
+                member = cls._value2member_map_.get(value)
+            except TypeError:
+                member = None
+            if member is not None:
+                return member
             return cls.__new__(cls, value)
         # otherwise, functional API: we're creating a new Enum type
         return cls._create_(
@@ -842,9 +855,9 @@ def __reduce_ex__(self, proto):
     # `value` attributes of enum members while keeping some measure of
     # protection from modification, while still allowing for an enumeration
     # to have members named `name` and `value`.  This works because enumeration
-    # members are not set directly on the enum class; they are kept in a
-    # separate structure, _member_map_, which is where enum.property looks for
-    # them
+    # members whose name is already used by a base class are not set directly
+    # on the enum class; they are kept in a separate structure, _member_map_,
+    # which is where enum.property looks for them
 
     @property
     def name(self):
@@ -1017,11 +1030,12 @@ def __xor__(self, other):
         return self.__class__(self._value_ ^ other._value_)
 
     def __invert__(self):
-        members, uncovered = _decompose(self.__class__, self._value_)
-        inverted = self.__class__(0)
-        for m in self.__class__:
-            if m not in members and not (m._value_ & self._value_):
-                inverted = inverted | m
+        # combine the members which do not share any bit with self
+        value = self._value_
+        inverted = 0
+        for m in self.__class__._member_map_.values():
+            if not m._value_ & value:
+                inverted |= m._value_
         return self.__class__(inverted)
 
 
@@ -1074,20 +1088,31 @@ def _create_pseudo_member_(cls, value):
         return pseudo_member
 
     def __or__(self, other):
-        if not isinstance(other, (self.__class__, int)):
+        if isinstance(other, self.__class__):
+            other = other._value_
+        elif isinstance(other, int):
+            other = self.__class__(other)._value_
+        else:
             return NotImplemented
-        result = self.__class__(self._value_ | self.__class__(other)._value_)
-        return result
+        return self.__class__(self._value_ | other)
 
     def __and__(self, other):
-        if not isinstance(other, (self.__class__, int)):
+        if isinstance(other, self.__class__):
+            other = other._value_
+        elif isinstance(other, int):
+            other = self.__class__(other)._value_
+        else:
             return NotImplemented
-        return self.__class__(self._value_ & self.__class__(other)._value_)
+        return self.__class__(self._value_ & other)
 
     def __xor__(self, other):
-        if not isinstance(other, (self.__class__, int)):
+        if isinstance(other, self.__class__):
+            other = other._value_
+        elif isinstance(other, int):
+            other = self.__class__(other)._value_
+        else:
             return NotImplemented
-        return self.__class__(self._value_ ^ self.__class__(other)._value_)
+        return self.__class__(self._value_ ^ other)
 
     __ror__ = __or__
     __rand__ = __and__
@@ -1127,23 +1152,26 @@ def _decompose(flag, value):
     not_covered = value
     negative = value < 0
     members = []
-    for member in flag:
-        member_value = member.value
+    member_map = flag._member_map_
+    value2member_map = flag._value2member_map_
+    for name in flag._member_names_:
+        member = member_map[name]
+        member_value = member._value_
         if member_value and member_value & value == member_value:
             members.append(member)
             not_covered &= ~member_value
     if not negative:
         tmp = not_covered
         while tmp:
-            flag_value = 2 ** _high_bit(tmp)
-            if flag_value in flag._value2member_map_:
-                members.append(flag._value2member_map_[flag_value])
+            flag_value = 1 << _high_bit(tmp)
+            if flag_value in value2member_map:
+                members.append(value2member_map[flag_value])
                 not_covered &= ~flag_value
             tmp &= ~flag_value
-    if not members and value in flag._value2member_map_:
-        members.append(flag._value2member_map_[value])
+    if not members and value in value2member_map:
+        members.append(value2member_map[value])
     members.sort(key=lambda m: m._value_, reverse=True)
-    if len(members) > 1 and members[0].value == value:
+    if len(members) > 1 and members[0]._value_ == value:
         # we have the breakdown, don't need the value member itself
         members.pop(0)
     return members, not_covered
@@ -0,0 +1,301 @@
+"""Import modules from an archive of compiled code objects.
+
+Importing a module from source stats the source file, opens the cached
+bytecode in ``__pycache__``, validates its header and unmarshals it.  An
+archive written by :func:`write_archive` packs the code objects of an
+application's modules into a single file with an index; once the file is
+memory-mapped, finding a module is a dict lookup and loading it is a
+:func:`marshal.loads` of a slice of the map.
+
+Build an archive with::
+
+    python -m importlib.archive ARCHIVE [-m MODULE ...] [DIRECTORY ...]
+
+or a startup image of the modules needed by some modules with::
+
+    python -m importlib.archive --image ARCHIVE -m MODULE ...
+
+"""
+import marshal
+import mmap
+import os
+import sys
+
+from . import _bootstrap
+from ._bootstrap_external import (_LoaderBasics, _path_join, MAGIC_NUMBER,
+                                  PathFinder, SourceFileLoader,
+                                  SOURCE_SUFFIXES)
+
+__all__ = ['ArchiveImporter', 'write_archive', 'write_image', 'install']
+
+_ARCHIVE_MAGIC = b'PYCA'
+# Magic, bytecode magic number, index offset and size (little endian).
+_HEADER_SIZE = 24
+
+
+def _walk_package(name, directory):
+    """Yield (name, filename, is_package) for the modules of the package
+    *name* stored in *directory*, including the package itself."""
+    yield name, _path_join(directory, '__init__.py'), True
+    for entry in sorted(os.listdir(directory)):
+        path = _path_join(directory, entry)
+        module, dot, suffix = entry.partition('.')
+        if not module.isidentifier() or module == '__init__':
+            continue
+        if not dot:
+            if os.path.isfile(_path_join(path, '__init__.py')):
+                yield from _walk_package(f'{name}.{module}', path)
+        elif dot + suffix in SOURCE_SUFFIXES:
+            yield f'{name}.{module}', path, False
+
+
+def _find_sources(directories, modules):
+    sources = {}
+    for directory in directories:
+        for entry in sorted(os.listdir(directory)):
+            path = _path_join(directory, entry)
+            module, dot, suffix = entry.partition('.')
+            if not module.isidentifier():
+                continue
+            if not dot:
+                if os.path.isfile(_path_join(path, '__init__.py')):
+                    for item in _walk_package(module, path):
+                        sources.setdefault(item[0], item)
+            elif dot + suffix in SOURCE_SUFFIXES:
+                sources.setdefault(module, (module, path, False))
+    # Only needed when building archives.
+    from .util import find_spec
+    for name in modules:
+        # This imports the parent packages of submodules.
+        spec = find_spec(name)
+        if (spec is None or spec.origin is None
+                or not spec.origin.endswith(tuple(SOURCE_SUFFIXES))):
+            raise ValueError(f'{name!r} is not a pure Python module')
+        if spec.submodule_search_locations is not None:
+            for item in _walk_package(name, os.path.dirname(spec.origin)):
+                sources[item[0]] = item
+        else:
+            sources[name] = (name, spec.origin, False)
+    return sources
+
+
+def _imported_sources(modules):
+    for name in modules:
+        __import__(name)
+    sources = {}
+    for name, module in list(sys.modules.items()):
+        spec = getattr(module, '__spec__', None)
+        # Skip aliases such as os.path, which are archived under the name
+        # of their spec.
+        if (spec is None or spec.name != name
+                or not isinstance(spec.loader, SourceFileLoader)):
+            continue
+        is_package = spec.submodule_search_locations is not None
+        sources[name] = (name, spec.origin, is_package)
+    return sources
+
+
+def write_archive(filename, directories=(), modules=(), *, optimize=-1):
+    """Compile modules and write them to the archive *filename*.
+
+    Every module and package found directly in *directories* is included
+    with its submodules, as well as the modules named in *modules* (and
+    the submodules of the packages among them), which are looked up on
+    :data:`sys.path`.  *optimize* is passed to :func:`compile`.
+    """
+    return _write(filename, _find_sources(directories, modules), optimize)
+
+
+def write_image(filename, modules, *, optimize=-1):
+    """Import *modules* and write every pure Python module which is then
+    in :data:`sys.modules` to the archive *filename*.
+
+    The archive contains the modules needed by *modules*, including those
+    imported at startup, and can be installed when Python starts with
+    :envvar:`PYTHONIMPORTARCHIVE`.  *optimize* is passed to :func:`compile`.
+    """
+    return _write(filename, _imported_sources(modules), optimize)
+
+
+def _write(filename, sources, optimize):
+    index = {}
+    chunks = []
+    offset = _HEADER_SIZE
+    for name, path, is_package in sorted(sources.values()):
+        relpath = name.replace('.', '/')
+        relpath += '/__init__.py' if is_package else '.py'
+        # The submodules of a package which are not archived are still
+        # found in its source directory.
+        source_dir = (os.path.dirname(os.path.abspath(path)) if is_package
+                      else None)
+        with open(path, 'rb') as file:
+            source = file.read()
+        code = compile(source, _path_join(os.path.abspath(filename), relpath),
+                       'exec', dont_inherit=True, optimize=optimize)
+        data = marshal.dumps(code)
+        index[name] = (offset, len(data), is_package, relpath, source_dir)
+        chunks.append(data)
+        offset += len(data)
+    data = marshal.dumps(index)
+    header = (_ARCHIVE_MAGIC + MAGIC_NUMBER + offset.to_bytes(8, 'little')
+              + len(data).to_bytes(8, 'little'))
+    tmp = f'{filename}.{os.getpid()}.tmp'
+    try:
+        with open(tmp, 'wb') as file:
+            file.write(header)
+            file.writelines(chunks)
+            file.write(data)
+        os.replace(tmp, filename)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return sorted(index)
+
+
+class ArchiveImporter(_LoaderBasics):
+
+    """Meta path finder and loader for the modules of an archive written
+    by :func:`write_archive`.
+
+    Modules found in the archive take precedence over the import path,
+    and are never checked against their sources.
+
+    """
+
+    def __init__(self, filename):
+        self.archive = os.path.abspath(filename)
+        with open(filename, 'rb') as file:
+            try:
+                self._map = mmap.mmap(file.fileno(), 0,
+                                      access=mmap.ACCESS_READ)
+            except ValueError:
+                # An empty file cannot be mapped.
+                self._map = b''
+        header = self._map[:_HEADER_SIZE]
+        if (len(header) < _HEADER_SIZE
+                or header[:4] != _ARCHIVE_MAGIC):
+            raise ImportError(f'not an archive: {filename!r}', path=filename)
+        if header[4:8] != MAGIC_NUMBER:
+            raise ImportError(f'archive {filename!r} was built by another '
+                              f'version of Python', path=filename)
+        offset = int.from_bytes(header[8:16], 'little')
+        size = int.from_bytes(header[16:24], 'little')
+        self._view = memoryview(self._map)
+        self._index = marshal.loads(self._view[offset:offset + size])
+
+    def __contains__(self, fullname):
+        return fullname in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __repr__(self):
+        return f'<{type(self).__name__} {self.archive!r}>'
+
+    def invalidate_caches(self):
+        pass
+
+    def find_spec(self, fullname, path=None, target=None):
+        """Return the spec of *fullname* if it is in the archive."""
+        try:
+            offset, size, is_package, relpath, source_dir = \
+                self._index[fullname]
+        except KeyError:
+            return None
+        spec = _bootstrap.ModuleSpec(fullname, self,
+                                     origin=_path_join(self.archive, relpath),
+                                     is_package=is_package)
+        spec.has_location = True
+        if is_package:
+            spec.submodule_search_locations = [
+                _path_join(self.archive, relpath.rpartition('/')[0]),
+                source_dir]
+        return spec
+
+    def _entry(self, fullname):
+        try:
+            return self._index[fullname]
+        except KeyError:
+            raise ImportError(f'{fullname!r} is not in archive '
+                              f'{self.archive!r}', name=fullname) from None
+
+    def get_code(self, fullname):
+        """Return the code object of *fullname*."""
+        offset, size = self._entry(fullname)[:2]
+        return marshal.loads(self._view[offset:offset + size])
+
+    def get_source(self, fullname):
+        """Return None: archives do not contain source code."""
+        self._entry(fullname)
+        return None
+
+    def get_filename(self, fullname):
+        """Return the path of *fullname* inside the archive."""
+        return _path_join(self.archive, self._entry(fullname)[3])
+
+    def is_package(self, fullname):
+        """Return True if *fullname* is a package."""
+        return self._entry(fullname)[2]
+
+
+def install(filename):
+    """Open the archive *filename* and insert an :class:`ArchiveImporter`
+    for it before :class:`~importlib.machinery.PathFinder` on
+    :data:`sys.meta_path`.  Return the importer."""
+    importer = ArchiveImporter(filename)
+    for i, entry in enumerate(sys.meta_path):
+        if entry is PathFinder:
+            sys.meta_path.insert(i, importer)
+            break
+    else:
+        sys.meta_path.append(importer)
+    return importer
+
+
+def main(args=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog='python -m importlib.archive',
+        description='Compile modules into an archive for '
+                    'importlib.archive.install().')
+    parser.add_argument('filename', help='the archive to write')
+    parser.add_argument('directories', nargs='*', metavar='directory',
+                        help='include the modules and packages found in '
+                             'this directory')
+    parser.add_argument('-m', dest='modules', action='append', default=[],
+                        metavar='module',
+                        help='include this module, or package and its '
+                             'submodules, from sys.path')
+    parser.add_argument('--image', action='store_true',
+                        help='import the -m modules and include every pure '
+                             'Python module they need instead, to build a '
+                             'startup image for PYTHONIMPORTARCHIVE')
+    parser.add_argument('-O', dest='optimize', action='count', default=0,
+                        help='optimize the code like python -O')
+    parser.add_argument('-q', dest='quiet', action='store_true',
+                        help='do not list the modules written')
+    args = parser.parse_args(args)
+    if not args.directories and not args.modules:
+        parser.error('no modules to archive')
+    if args.image:
+        if args.directories:
+            parser.error('--image does not take directories')
+        names = write_image(args.filename, args.modules,
+                            optimize=args.optimize)
+    else:
+        names = write_archive(args.filename, args.directories, args.modules,
+                              optimize=args.optimize)
+    if not args.quiet:
+        for name in names:
+            print(name)
+
+
+if __name__ == '__main__':
+    main()
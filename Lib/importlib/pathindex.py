@@ -0,0 +1,269 @@
+"""An index of the modules found on the import path.
+
+:class:`importlib.machinery.PathFinder` lists every directory on the path
+the first time it is searched, and stats the directory and the candidate
+files on every lookup.  An index built ahead of time, for example when
+packages are installed, records which modules each directory provides.
+:class:`IndexFinder` answers lookups from it, and only checks the
+modification time of each directory once.
+
+Build or refresh an index with::
+
+    python -m importlib.pathindex FILE [DIRECTORY ...]
+
+"""
+import marshal
+import os
+import sys
+
+from . import _bootstrap
+from ._bootstrap_external import (_get_supported_file_loaders, _path_join,
+                                  _path_stat, _relax_case,
+                                  spec_from_file_location, FileFinder,
+                                  PathFinder)
+
+__all__ = ['IndexFinder', 'build_index', 'write_index', 'load_index',
+           'install']
+
+_FORMAT = 1
+
+
+def _loaders():
+    """Return a dict mapping each module file suffix to its loader, in the
+    order FileFinder tries them."""
+    loaders = {}
+    for loader, suffixes in _get_supported_file_loaders():
+        for suffix in suffixes:
+            loaders[suffix] = loader
+    return loaders
+
+
+def _scan_directory(path, suffixes):
+    """Return (mtime, modules, subdirectories) for the directory *path*, or
+    None if it is not a directory.
+
+    *modules* maps each module name to the suffix of the file providing it,
+    preferring the suffixes which come first in *suffixes*.  Names without
+    a suffix are candidate (package) subdirectories.  A missing directory
+    is listed as empty.
+    """
+    try:
+        # Read the mtime first: a change while listing invalidates the entry.
+        mtime = _path_stat(path).st_mtime
+        names = os.listdir(path)
+    except FileNotFoundError:
+        return None, {}, frozenset()
+    except OSError:
+        return None
+    ranks = {suffix: rank for rank, suffix in enumerate(suffixes)}
+    modules = {}
+    subdirs = set()
+    for name in names:
+        module, dot, suffix = name.partition('.')
+        if not dot:
+            subdirs.add(name)
+            continue
+        if sys.platform.startswith('win'):
+            suffix = suffix.lower()
+        rank = ranks.get(dot + suffix)
+        if rank is None:
+            continue
+        current = modules.get(module)
+        if current is None or rank < ranks[current]:
+            modules[module] = dot + suffix
+    return mtime, modules, frozenset(subdirs)
+
+
+def build_index(path=None):
+    """Scan the directories in *path* (default: :data:`sys.path`) and the
+    package directories below them, and return the index as a dict."""
+    if path is None:
+        path = sys.path
+    suffixes = list(_loaders())
+    directories = {}
+    todo = [entry for entry in path if isinstance(entry, str) and entry]
+    while todo:
+        directory = todo.pop()
+        if directory in directories:
+            continue
+        listing = _scan_directory(directory, suffixes)
+        if listing is None:
+            continue
+        directories[directory] = listing
+        todo.extend(_path_join(directory, name) for name in listing[2]
+                    if name.isidentifier())
+    return {'format': _FORMAT,
+            'cache_tag': sys.implementation.cache_tag,
+            'suffixes': tuple(suffixes),
+            'directories': directories}
+
+
+def write_index(filename, path=None):
+    """Build the index of *path* (default: :data:`sys.path`) and write it
+    to *filename*, replacing it atomically."""
+    data = marshal.dumps(build_index(path))
+    tmp = f'{filename}.{os.getpid()}.tmp'
+    try:
+        with open(tmp, 'wb') as file:
+            file.write(data)
+        os.replace(tmp, filename)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def load_index(filename):
+    """Read an index written by :func:`write_index`.
+
+    Raise :exc:`ValueError` if the file is not an index, or was built
+    for another version of Python.
+    """
+    with open(filename, 'rb') as file:
+        data = file.read()
+    try:
+        index = marshal.loads(data)
+    except (EOFError, TypeError, ValueError):
+        index = None
+    if not isinstance(index, dict) or index.get('format') != _FORMAT:
+        raise ValueError(f'{filename!r} is not an import index')
+    if (index['cache_tag'] != sys.implementation.cache_tag
+            or index['suffixes'] != tuple(_loaders())):
+        raise ValueError(f'{filename!r} was built for another Python')
+    return index
+
+
+class IndexFinder:
+
+    """Meta path finder answering lookups from an import index.
+
+    The modification time of each indexed directory is checked the first
+    time the directory is searched; directories which are missing from
+    the index or out of date are listed once, like FileFinder does.
+    Lookups which the index cannot answer, such as those involving
+    namespace packages, zip files or other path hooks, are left to the
+    finders which follow on :data:`sys.meta_path`.
+
+    """
+
+    def __init__(self, index=None):
+        self._index = index['directories'] if index is not None else {}
+        self._loaders = _loaders()
+        self._directories = {}
+
+    def invalidate_caches(self):
+        """Check the directories again on their next lookup."""
+        self._directories.clear()
+
+    def _listing(self, directory):
+        try:
+            return self._directories[directory]
+        except KeyError:
+            pass
+        listing = self._index.get(directory)
+        if listing is not None:
+            try:
+                mtime = _path_stat(directory).st_mtime
+            except OSError:
+                mtime = None
+            if mtime != listing[0]:
+                _bootstrap._verbose_message('index out of date for {}',
+                                            directory)
+                listing = None
+        if listing is None:
+            listing = _scan_directory(directory, self._loaders)
+        self._directories[directory] = listing
+        return listing
+
+    def find_spec(self, fullname, path=None, target=None):
+        """Try to find a spec for *fullname* on *path* (default:
+        :data:`sys.path`) using the index.
+
+        Returns the matching spec, or None if the index has no answer.
+        """
+        if _relax_case():
+            return None
+        if path is None:
+            path = sys.path
+        tail = fullname.rpartition('.')[2]
+        for entry in path:
+            if not isinstance(entry, str):
+                return None
+            if entry == '':
+                # The current directory, as PathFinder resolves it.
+                try:
+                    entry = os.getcwd()
+                except FileNotFoundError:
+                    continue
+            importer = sys.path_importer_cache.get(entry)
+            if importer is not None and not isinstance(importer, FileFinder):
+                # Handled by another path hook.
+                return None
+            listing = self._listing(entry)
+            if listing is None:
+                # Not a directory: leave it to the path hooks.
+                return None
+            mtime, modules, subdirs = listing
+            is_namespace = False
+            if tail in subdirs:
+                base_path = _path_join(entry, tail)
+                package = self._listing(base_path)
+                if package is not None:
+                    suffix = package[1].get('__init__')
+                    if suffix is not None:
+                        filename = _path_join(base_path, '__init__' + suffix)
+                        return self._get_spec(fullname, filename, suffix,
+                                              [base_path])
+                    is_namespace = True
+            suffix = modules.get(tail)
+            if suffix is not None:
+                filename = _path_join(entry, tail + suffix)
+                return self._get_spec(fullname, filename, suffix, None)
+            if is_namespace:
+                # PathFinder collects the portions of namespace packages.
+                return None
+        return None
+
+    def _get_spec(self, fullname, filename, suffix, smsl):
+        _bootstrap._verbose_message('{} found in import index: {}',
+                                    fullname, filename, verbosity=2)
+        loader = self._loaders[suffix](fullname, filename)
+        return spec_from_file_location(fullname, filename, loader=loader,
+                                       submodule_search_locations=smsl)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({len(self._index)} directories)'
+
+
+def install(filename):
+    """Load the index from *filename* and insert an :class:`IndexFinder`
+    using it before :class:`~importlib.machinery.PathFinder` on
+    :data:`sys.meta_path`.  Return the finder."""
+    finder = IndexFinder(load_index(filename))
+    for i, entry in enumerate(sys.meta_path):
+        if entry is PathFinder:
+            sys.meta_path.insert(i, finder)
+            break
+    else:
+        sys.meta_path.append(finder)
+    return finder
+
+
+def main(args=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog='python -m importlib.pathindex',
+        description='Build or refresh an import index, to be used with '
+                    'PYTHONIMPORTINDEX.')
+    parser.add_argument('filename', help='the index file to write')
+    parser.add_argument('directories', nargs='*', metavar='directory',
+                        help='the directories to index (default: sys.path)')
+    args = parser.parse_args(args)
+    write_index(args.filename, args.directories or None)
+
+
+if __name__ == '__main__':
+    main()
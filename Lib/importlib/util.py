@@ -4,6 +4,7 @@
 from ._bootstrap import _resolve_name
 from ._bootstrap import spec_from_loader
 from ._bootstrap import _find_spec
+from . import _bootstrap_external
 from ._bootstrap_external import MAGIC_NUMBER
 from ._bootstrap_external import _RAW_MAGIC_NUMBER
 from ._bootstrap_external import cache_from_source
@@ -297,3 +298,108 @@ def exec_module(self, module):
         loader_state['__class__'] = module.__class__
         module.__spec__.loader_state = loader_state
         module.__class__ = _LazyModule
+
+
+class _LazyImportModule(_LazyModule):
+
+    """A lazy module created by the lazy import mode.
+
+    Looking up the module in the import system does not trigger its load,
+    so that it stays lazy when it is imported again elsewhere.
+
+    """
+
+    def __getattribute__(self, attr):
+        if attr == '__spec__' or attr == '__name__':
+            return types.ModuleType.__getattribute__(self, attr)
+        return super().__getattribute__(attr)
+
+    def __repr__(self):
+        return f'<module {self.__name__!r} (lazy)>'
+
+
+class _LazyImportLoader(LazyLoader):
+
+    def exec_module(self, module):
+        super().exec_module(module)
+        module.__class__ = _LazyImportModule
+
+
+class _LazyImportFinder:
+
+    """Meta path finder making the loaders found by the finders after it
+    lazy."""
+
+    # Loaders which create the module object themselves, like
+    # ExtensionFileLoader, are left alone.
+    _default_create_module = (_bootstrap_external._LoaderBasics.create_module,
+                              Loader.create_module)
+
+    def __init__(self, packages, exclude):
+        self.packages = packages
+        self.exclude = exclude
+
+    @staticmethod
+    def _match(fullname, names):
+        for name in names:
+            if fullname == name or fullname.startswith(name + '.'):
+                return True
+        return False
+
+    def find_spec(self, fullname, path=None, target=None):
+        if ((self.packages is not None
+                    and not self._match(fullname, self.packages))
+                or self._match(fullname, self.exclude)):
+            return None
+        try:
+            index = sys.meta_path.index(self)
+        except ValueError:
+            return None
+        for finder in sys.meta_path[index + 1:]:
+            try:
+                find_spec = finder.find_spec
+            except AttributeError:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        loader = spec.loader
+        if (hasattr(loader, 'exec_module')
+                and getattr(type(loader), 'create_module', None)
+                    in self._default_create_module):
+            spec.loader = _LazyImportLoader(loader)
+        return spec
+
+    def invalidate_caches(self):
+        pass
+
+
+def enable_lazy_imports(packages=None, *, exclude=()):
+    """Make the modules imported from now on load lazily.
+
+    Only the modules of *packages* (and their submodules) are lazy, or all
+    modules if it is None, except for those of *exclude*.  The module
+    objects are created on import and executed on first attribute access.
+    """
+    disable_lazy_imports()
+    if packages is not None:
+        packages = tuple(packages)
+    sys.meta_path.insert(0, _LazyImportFinder(packages, tuple(exclude)))
+
+
+def disable_lazy_imports():
+    """Stop making imported modules lazy.
+
+    The modules which are still lazy are loaded on first use.
+    """
+    sys.meta_path[:] = [finder for finder in sys.meta_path
+                        if not isinstance(finder, _LazyImportFinder)]
+
+
+def untouched_modules():
+    """Return the sorted names of the modules in :data:`sys.modules` which
+    were imported lazily and have not been used (nor loaded) yet."""
+    return sorted(name for name, module in list(sys.modules.items())
+                  if type(module) is _LazyImportModule)
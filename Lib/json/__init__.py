@@ -97,14 +97,14 @@
 """
 __version__ = '2.0.9'
 __all__ = [
-    'dump', 'dumps', 'load', 'loads',
-    'JSONDecoder', 'JSONDecodeError', 'JSONEncoder',
+    'dump', 'dumps', 'load', 'loads', 'iterload',
+    'JSONDecoder', 'JSONDecodeError', 'JSONEncoder', 'JSONStreamDecoder',
 ]
 
 __author__ = 'Bob Ippolito <bob@redivi.com>'
 
-from .decoder import JSONDecoder, JSONDecodeError
-from .encoder import JSONEncoder
+from .decoder import JSONDecoder, JSONDecodeError, JSONStreamDecoder
+from .encoder import JSONEncoder, _write_chunks
 import codecs
 
 _default_encoder = JSONEncoder(
@@ -119,7 +119,7 @@
 
 def dump(obj, fp, *, skipkeys=False, ensure_ascii=True, check_circular=True,
         allow_nan=True, cls=None, indent=None, separators=None,
-        default=None, sort_keys=False, **kw):
+        default=None, sort_keys=False, chunk_size=65536, **kw):
     """Serialize ``obj`` as a JSON formatted stream to ``fp`` (a
     ``.write()``-supporting file-like object).
 
@@ -156,6 +156,9 @@ def dump(obj, fp, *, skipkeys=False, ensure_ascii=True, check_circular=True,
     If *sort_keys* is true (default: ``False``), then the output of
     dictionaries will be sorted by key.
 
+    The output is passed to ``fp.write()`` in pieces of about
+    ``chunk_size`` characters.
+
     To use a custom ``JSONEncoder`` subclass (e.g. one that overrides the
     ``.default()`` method to serialize additional types), specify it with
     the ``cls`` kwarg; otherwise ``JSONEncoder`` is used.
@@ -166,18 +169,22 @@ def dump(obj, fp, *, skipkeys=False, ensure_ascii=True, check_circular=True,
         check_circular and allow_nan and
         cls is None and indent is None and separators is None and
         default is None and not sort_keys and not kw):
-        iterable = _default_encoder.iterencode(obj)
+        encoder = _default_encoder
     else:
         if cls is None:
             cls = JSONEncoder
-        iterable = cls(skipkeys=skipkeys, ensure_ascii=ensure_ascii,
+        encoder = cls(skipkeys=skipkeys, ensure_ascii=ensure_ascii,
             check_circular=check_circular, allow_nan=allow_nan, indent=indent,
             separators=separators,
-            default=default, sort_keys=sort_keys, **kw).iterencode(obj)
-    # could accelerate with writelines in some versions of Python, at
-    # a debuggability cost
-    for chunk in iterable:
-        fp.write(chunk)
+            default=default, sort_keys=sort_keys, **kw)
+    dump = getattr(encoder, 'dump', None)
+    if dump is None:
+        # cls only implements iterencode()
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        _write_chunks(encoder.iterencode(obj), fp, chunk_size)
+    else:
+        dump(obj, fp, chunk_size=chunk_size)
 
 
 def dumps(obj, *, skipkeys=False, ensure_ascii=True, check_circular=True,
@@ -340,10 +347,16 @@ def loads(s, *, cls=None, object_hook=None, parse_float=None,
                             f'not {s.__class__.__name__}')
         s = s.decode(detect_encoding(s), 'surrogatepass')
 
+    return _get_decoder(cls, object_hook, parse_float, parse_int,
+                        parse_constant, object_pairs_hook, kw).decode(s)
+
+
+def _get_decoder(cls, object_hook, parse_float, parse_int, parse_constant,
+                 object_pairs_hook, kw):
     if (cls is None and object_hook is None and
             parse_int is None and parse_float is None and
             parse_constant is None and object_pairs_hook is None and not kw):
-        return _default_decoder.decode(s)
+        return _default_decoder
     if cls is None:
         cls = JSONDecoder
     if object_hook is not None:
@@ -356,4 +369,32 @@ def loads(s, *, cls=None, object_hook=None, parse_float=None,
         kw['parse_int'] = parse_int
     if parse_constant is not None:
         kw['parse_constant'] = parse_constant
-    return cls(**kw).decode(s)
+    return cls(**kw)
+
+
+def iterload(fp, *, mode='array', chunk_size=65536, cls=None,
+        object_hook=None, parse_float=None, parse_int=None,
+        parse_constant=None, object_pairs_hook=None, **kw):
+    """Iterate over the values of a large JSON input read from ``fp`` (a
+    ``.read()``-supporting file-like object, text or binary), without
+    loading it all in memory.
+
+    If ``mode`` is ``'array'`` (the default), ``fp`` must contain a single
+    JSON array and its elements are yielded one by one.  If ``mode`` is
+    ``'lines'``, ``fp`` must contain JSON values separated by whitespace,
+    such as newline-delimited JSON, and each value is yielded.
+
+    ``fp`` is read ``chunk_size`` characters or bytes at a time.
+
+    The other arguments have the same meaning as in ``load()``.
+    """
+    stream = JSONStreamDecoder(
+        _get_decoder(cls, object_hook, parse_float, parse_int,
+                     parse_constant, object_pairs_hook, kw),
+        mode=mode)
+    while True:
+        chunk = fp.read(chunk_size)
+        if not chunk:
+            break
+        yield from stream.decode(chunk)
+    yield from stream.decode(chunk, final=True)
@@ -1,5 +1,6 @@
 """Implementation of JSONDecoder
 """
+import codecs
 import re
 
 from json import scanner
@@ -8,7 +9,7 @@
 except ImportError:
     c_scanstring = None
 
-__all__ = ['JSONDecoder', 'JSONDecodeError']
+__all__ = ['JSONDecoder', 'JSONDecodeError', 'JSONStreamDecoder']
 
 FLAGS = re.VERBOSE | re.MULTILINE | re.DOTALL
 
@@ -354,3 +355,180 @@ def raw_decode(self, s, idx=0):
         except StopIteration as err:
             raise JSONDecodeError("Expecting value", s, err.value) from None
         return obj, end
+
+
+# States of JSONStreamDecoder.
+_ARRAY_START = 0    # before the opening bracket of the top-level array
+_ARRAY_FIRST = 1    # after the opening bracket
+_ARRAY_AFTER = 2    # after an element
+_ARRAY_NEXT = 3     # after a comma
+_ARRAY_END = 4      # after the closing bracket
+_LINES = 5          # between two top-level values
+_LINES_AFTER = 6    # right after a top-level value
+
+# Characters which could extend a number at the end of a chunk.
+NUMBER_TAIL = re.compile(r'[-+.eE0-9]*', FLAGS)
+
+
+class JSONStreamDecoder(object):
+    """Incremental JSON decoder for documents too large to hold in memory.
+
+    Feed the input in chunks to ``decode()``, which returns the list of
+    values completed by that chunk.  The input is either a single JSON
+    array (``mode='array'``), whose elements are returned one by one, or
+    a sequence of JSON values separated by whitespace such as
+    newline-delimited JSON (``mode='lines'``).
+
+    Only the text of the value being decoded is kept between calls.
+    Positions reported in ``JSONDecodeError`` are relative to that
+    buffered text.
+    """
+
+    def __init__(self, decoder=None, *, mode='array'):
+        """``decoder`` is the ``JSONDecoder`` used to decode each value; a
+        default ``JSONDecoder()`` is used if it is not specified.
+        """
+        if mode not in ('array', 'lines'):
+            raise ValueError("mode must be 'array' or 'lines', not %r"
+                             % (mode,))
+        if decoder is None:
+            decoder = JSONDecoder()
+        self.decoder = decoder
+        self.mode = mode
+        self.reset()
+
+    def reset(self):
+        """Reset the decoder to its initial state, discarding any input."""
+        # Pending text: the chunks received since the last parse, starting
+        # with what that parse left, and their total size.
+        self._chunks = []
+        self._size = 0
+        self._state = _ARRAY_START if self.mode == 'array' else _LINES
+        # Size the pending text must reach before decoding is retried.
+        self._retry_size = 0
+        self._bytes_decoder = None
+        self._pending_bytes = b''
+
+    def decode(self, data, final=False):
+        """Decode the ``str``, ``bytes`` or ``bytearray`` ``data`` and
+        return the list of values it completes.
+
+        Pass ``final=True`` with the last chunk of input (possibly empty)
+        to decode what remains buffered; ``JSONDecodeError`` is then
+        raised if the input ends in the middle of a value.
+        """
+        if not isinstance(data, str):
+            data = self._decode_bytes(data, final)
+        if data:
+            self._chunks.append(data)
+            self._size += len(data)
+        if not final and self._size < self._retry_size:
+            # The value being decoded cannot be complete yet: do not even
+            # join the chunks, which would copy the pending text again.
+            return []
+        buf = ''.join(self._chunks)
+        values = []
+        try:
+            pos = self._parse(buf, values, final)
+        finally:
+            if final:
+                self.reset()
+        if not final:
+            buf = buf[pos:]
+            self._chunks = [buf] if buf else []
+            self._size = len(buf)
+        return values
+
+    def _decode_bytes(self, data, final):
+        if not isinstance(data, (bytes, bytearray)):
+            raise TypeError(f'the JSON data must be str, bytes or bytearray, '
+                            f'not {data.__class__.__name__}')
+        if self._bytes_decoder is None:
+            data = self._pending_bytes + data
+            if len(data) < 4 and not final:
+                # Not enough bytes yet to detect the encoding.
+                self._pending_bytes = data
+                return ''
+            self._pending_bytes = b''
+            # json imports this module, so it is imported late.
+            from json import detect_encoding
+            self._bytes_decoder = codecs.getincrementaldecoder(
+                detect_encoding(data))('surrogatepass')
+        return self._bytes_decoder.decode(data, final)
+
+    def _parse(self, s, values, final, _w=WHITESPACE.match,
+               _ws=WHITESPACE_STR, _number_tail=NUMBER_TAIL.fullmatch):
+        scan_once = self.decoder.scan_once
+        state = self._state
+        end = len(s)
+        pos = 0
+        while True:
+            if pos == end:
+                break
+            nextchar = s[pos]
+            if nextchar in _ws:
+                if state == _LINES_AFTER:
+                    state = _LINES
+                pos = _w(s, pos + 1).end()
+                if pos == end:
+                    break
+                nextchar = s[pos]
+            if state == _ARRAY_START:
+                if nextchar != '[':
+                    raise JSONDecodeError("Expecting '['", s, pos)
+                state = _ARRAY_FIRST
+                pos += 1
+                continue
+            elif state == _ARRAY_FIRST and nextchar == ']':
+                state = _ARRAY_END
+                pos += 1
+                continue
+            elif state == _ARRAY_AFTER:
+                if nextchar == ',':
+                    state = _ARRAY_NEXT
+                elif nextchar == ']':
+                    state = _ARRAY_END
+                else:
+                    raise JSONDecodeError("Expecting ',' delimiter", s, pos)
+                pos += 1
+                continue
+            elif state == _ARRAY_END:
+                raise JSONDecodeError("Extra data", s, pos)
+            elif state == _LINES_AFTER:
+                raise JSONDecodeError("Expecting whitespace", s, pos)
+
+            # Decode a value.  The text it starts may be incomplete;
+            # rather than rescanning it for every chunk, wait until it
+            # doubled in size, keeping the total work linear.
+            if not final and end - pos < self._retry_size:
+                break
+            try:
+                value, valend = scan_once(s, pos)
+            except StopIteration as err:
+                if final:
+                    raise JSONDecodeError("Expecting value", s,
+                                          err.value) from None
+                self._retry_size = 2 * (end - pos)
+                break
+            except JSONDecodeError:
+                if final:
+                    raise
+                self._retry_size = 2 * (end - pos)
+                break
+            if (not final and nextchar in '-0123456789' and
+                    _number_tail(s, valend)):
+                # The number could go on in the next chunk.
+                self._retry_size = 0
+                break
+            self._retry_size = 0
+            values.append(value)
+            state = _ARRAY_AFTER if state != _LINES else _LINES_AFTER
+            pos = valend
+
+        self._state = state
+        if final:
+            if state == _ARRAY_AFTER:
+                raise JSONDecodeError("Expecting ',' delimiter", s, pos)
+            elif state not in (_ARRAY_END, _LINES, _LINES_AFTER):
+                raise JSONDecodeError("Expecting value", s, pos)
+        return pos
@@ -201,6 +201,25 @@ def encode(self, o):
             chunks = list(chunks)
         return ''.join(chunks)
 
+    def _encoder_args(self):
+        # The circular reference markers and the string encoder used by
+        # both the C and the Python encoders.
+        if self.check_circular:
+            markers = {}
+        else:
+            markers = None
+        if self.ensure_ascii:
+            _encoder = encode_basestring_ascii
+        else:
+            _encoder = encode_basestring
+        return markers, _encoder
+
+    def _make_c_encoder(self, markers, _encoder):
+        return c_make_encoder(
+            markers, self.default, _encoder, self.indent,
+            self.key_separator, self.item_separator, self.sort_keys,
+            self.skipkeys, self.allow_nan)
+
     def iterencode(self, o, _one_shot=False):
         """Encode the given object and yield each string
         representation as available.
@@ -211,14 +230,7 @@ def iterencode(self, o, _one_shot=False):
                 mysocket.write(chunk)
 
         """
-        if self.check_circular:
-            markers = {}
-        else:
-            markers = None
-        if self.ensure_ascii:
-            _encoder = encode_basestring_ascii
-        else:
-            _encoder = encode_basestring
+        markers, _encoder = self._encoder_args()
 
         def floatstr(o, allow_nan=self.allow_nan,
                 _repr=float.__repr__, _inf=INFINITY, _neginf=-INFINITY):
@@ -245,10 +257,7 @@ def floatstr(o, allow_nan=self.allow_nan,
 
         if (_one_shot and c_make_encoder is not None
                 and self.indent is None):
-            _iterencode = c_make_encoder(
-                markers, self.default, _encoder, self.indent,
-                self.key_separator, self.item_separator, self.sort_keys,
-                self.skipkeys, self.allow_nan)
+            _iterencode = self._make_c_encoder(markers, _encoder)
         else:
             _iterencode = _make_iterencode(
                 markers, self.default, _encoder, self.indent, floatstr,
@@ -256,6 +265,45 @@ def floatstr(o, allow_nan=self.allow_nan,
                 self.skipkeys, _one_shot)
         return _iterencode(o, 0)
 
+    def dump(self, o, fp, *, chunk_size=65536):
+        """Serialize ``o`` as a JSON formatted stream to ``fp`` (a
+        ``.write()``-supporting file-like object).
+
+        The output is buffered and passed to ``fp.write()`` in pieces of
+        about ``chunk_size`` characters, instead of once per token.
+
+        For example::
+
+            with open('data.json', 'w') as fp:
+                JSONEncoder().dump(bigobject, fp)
+
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        if (c_make_encoder is not None and self.indent is None
+                and type(self).iterencode is JSONEncoder.iterencode):
+            _iterencode = self._make_c_encoder(*self._encoder_args())
+            # The C encoder calls fp.write() itself each time chunk_size
+            # characters are ready.
+            _iterencode(o, 0, fp.write, chunk_size)
+            return
+        _write_chunks(self.iterencode(o), fp, chunk_size)
+
+def _write_chunks(iterable, fp, chunk_size):
+    # Pass the chunks of iterable to fp.write() in pieces of about
+    # chunk_size characters.
+    chunks = []
+    size = 0
+    for chunk in iterable:
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= chunk_size:
+            fp.write(''.join(chunks))
+            chunks = []
+            size = 0
+    if chunks:
+        fp.write(''.join(chunks))
+
 def _make_iterencode(markers, _default, _encoder, _indent, _floatstr,
         _key_separator, _item_separator, _sort_keys, _skipkeys, _one_shot,
         ## HACK: hand-optimized bytecode; turn globals into locals
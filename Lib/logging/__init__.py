@@ -37,7 +37,8 @@
            'exception', 'fatal', 'getLevelName', 'getLogger', 'getLoggerClass',
            'info', 'log', 'makeLogRecord', 'setLoggerClass', 'shutdown',
            'warn', 'warning', 'getLogRecordFactory', 'setLogRecordFactory',
-           'lastResort', 'raiseExceptions']
+           'lastResort', 'raiseExceptions',
+           'JSONFormatter']
 
 import threading
 
@@ -264,6 +265,35 @@ def _after_at_fork_child_reinit_locks():
 #   The logging record
 #---------------------------------------------------------------------------
 
+#
+# The file and module names of the source files which logged something, by
+# path name. Splitting the path name is a noticeable part of the cost of
+# creating a record.
+#
+_pathnameCache = {}
+_PATHNAME_CACHE_SIZE = 1000
+
+def _splitPathname(pathname):
+    """
+    Return the file name and module name for a source path name.
+    """
+    try:
+        return _pathnameCache[pathname]
+    except KeyError:
+        pass
+    filename = os.path.basename(pathname)
+    rv = filename, os.path.splitext(filename)[0]
+    if len(_pathnameCache) >= _PATHNAME_CACHE_SIZE:
+        _pathnameCache.clear()
+    _pathnameCache[pathname] = rv
+    return rv
+
+#
+# The LogRecord attributes which are set from the caller's stack frame.
+#
+_callerFields = frozenset(('pathname', 'filename', 'module', 'lineno',
+                           'funcName'))
+
 class LogRecord(object):
     """
     A LogRecord instance represents an event being logged.
@@ -310,8 +340,7 @@ def __init__(self, name, level, pathname, lineno,
         self.levelno = level
         self.pathname = pathname
         try:
-            self.filename = os.path.basename(pathname)
-            self.module = os.path.splitext(self.filename)[0]
+            self.filename, self.module = _splitPathname(pathname)
         except (TypeError, ValueError, AttributeError):
             self.filename = pathname
             self.module = "Unknown module"
@@ -419,6 +448,9 @@ def __init__(self, fmt, *, defaults=None):
     def usesTime(self):
         return self._fmt.find(self.asctime_search) >= 0
 
+    def usesFields(self):
+        return frozenset(re.findall(r'%\((\w+)\)', self._fmt))
+
     def validate(self):
         """Validate the input format, ensure it matches the correct style"""
         if not self.validation_pattern.search(self._fmt):
@@ -451,7 +483,19 @@ def _format(self, record):
             values = defaults | record.__dict__
         else:
             values = record.__dict__
-        return self._fmt.format(**values)
+        return self._fmt.format_map(values)
+
+    def usesFields(self):
+        fields = set()
+        fmts = [self._fmt]
+        while fmts:
+            for _, fieldname, spec, _ in _str_formatter.parse(fmts.pop()):
+                if fieldname:
+                    fields.add(re.match(r'\w*', fieldname).group())
+                if spec:
+                    # Replacement fields can be nested in the format spec.
+                    fmts.append(spec)
+        return frozenset(fields)
 
     def validate(self):
         """Validate the input format, ensure it is the correct string formatting style"""
@@ -485,6 +529,14 @@ def usesTime(self):
         fmt = self._fmt
         return fmt.find('$asctime') >= 0 or fmt.find(self.asctime_format) >= 0
 
+    def usesFields(self):
+        fields = set()
+        for m in Template.pattern.finditer(self._fmt):
+            name = m.group('named') or m.group('braced')
+            if name:
+                fields.add(name)
+        return frozenset(fields)
+
     def validate(self):
         pattern = Template.pattern
         fields = set()
@@ -590,6 +642,9 @@ def __init__(self, fmt=None, datefmt=None, style='%', validate=True, *,
     default_time_format = '%Y-%m-%d %H:%M:%S'
     default_msec_format = '%s,%03d'
 
+    # The last formatted time, to format it once per second.
+    _lastTime = (None, None)
+
     def formatTime(self, record, datefmt=None):
         """
         Return the creation time of the specified LogRecord as formatted text.
@@ -608,13 +663,14 @@ def formatTime(self, record, datefmt=None):
         formatters, for example if you want all logging times to be shown in GMT,
         set the 'converter' attribute in the Formatter class.
         """
-        ct = self.converter(record.created)
-        if datefmt:
-            s = time.strftime(datefmt, ct)
-        else:
-            s = time.strftime(self.default_time_format, ct)
-            if self.default_msec_format:
-                s = self.default_msec_format % (s, record.msecs)
+        fmt = datefmt or self.default_time_format
+        key = (record.created // 1, fmt, self.converter)
+        lastkey, s = self._lastTime
+        if key != lastkey:
+            s = time.strftime(fmt, self.converter(record.created))
+            self._lastTime = (key, s)
+        if not datefmt and self.default_msec_format:
+            s = self.default_msec_format % (s, record.msecs)
         return s
 
     def formatException(self, ei):
@@ -642,6 +698,14 @@ def usesTime(self):
         """
         return self._style.usesTime()
 
+    def usesFields(self):
+        """
+        Return the set of record attributes named in the format.
+
+        Subclasses which use other attributes of the record should add them.
+        """
+        return self._style.usesFields()
+
     def formatMessage(self, record):
         return self._style.format(record)
 
@@ -695,6 +759,87 @@ def format(self, record):
 #
 _defaultFormatter = Formatter()
 
+class JSONFormatter(Formatter):
+    """
+    Formatter instances which format a record as a JSON object on a single
+    line, for JSON lines output.
+
+    The fields are given as a mapping from the keys of the object to the
+    names of the record attributes used as their values, or as a sequence of
+    attribute names which are also used as keys. The values are fetched
+    with a single attribute getter and the object is encoded in one call
+    to the json module's encoder. Exception and stack information are
+    added with the "exc_info" and "stack_info" keys when the record has
+    them.
+    """
+    default_fields = ('asctime', 'levelname', 'name', 'message')
+
+    def __init__(self, fields=None, datefmt=None, *, ensure_ascii=True,
+                 default=str):
+        """
+        Initialize the formatter with the specified fields.
+
+        The datefmt argument is used to format asctime, as for Formatter.
+        The ensure_ascii and default arguments are passed to
+        json.JSONEncoder; by default, values which cannot be serialized
+        are converted with str().
+        """
+        import json
+        from operator import attrgetter
+
+        Formatter.__init__(self, datefmt=datefmt)
+        if fields is None:
+            fields = self.default_fields
+        if not isinstance(fields, collections.abc.Mapping):
+            fields = {name: name for name in fields}
+        if not fields:
+            raise ValueError('invalid format: no fields')
+        for key in fields:
+            if not isinstance(key, str):
+                raise TypeError('keys must be str, not %s'
+                                % type(key).__name__)
+        self.fields = dict(fields)
+        self._keys = tuple(self.fields)
+        self._names = names = tuple(self.fields.values())
+        self._encode = json.JSONEncoder(ensure_ascii=ensure_ascii,
+                                        default=default).encode
+        getter = attrgetter(*names)
+        if len(names) == 1:
+            self._getter = lambda record: (getter(record),)
+        else:
+            self._getter = getter
+
+    def usesTime(self):
+        return 'asctime' in self._names
+
+    def usesFields(self):
+        return frozenset(self._names)
+
+    def format(self, record):
+        """
+        Format the specified record as a JSON object.
+
+        Missing attributes are encoded as null.
+        """
+        record.message = record.getMessage()
+        if self.usesTime():
+            record.asctime = self.formatTime(record, self.datefmt)
+        try:
+            values = self._getter(record)
+        except AttributeError:
+            values = [getattr(record, name, None) for name in self._names]
+        obj = dict(zip(self._keys, values))
+        if record.exc_info:
+            # Cache the traceback text to avoid converting it multiple times
+            # (it's constant anyway)
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            obj['exc_info'] = record.exc_text
+        if record.stack_info:
+            obj['stack_info'] = self.formatStack(record.stack_info)
+        return self._encode(obj)
+
 class BufferingFormatter(object):
     """
     A formatter suitable for formatting a number of records.
@@ -874,6 +1019,7 @@ def __init__(self, level=NOTSET):
         self._name = None
         self.level = _checkLevel(level)
         self.formatter = None
+        self._recordFields = None
         # Add the handler to the global _handlerList (for cleanup on shutdown)
         _addHandlerRef(self)
         self.createLock()
@@ -971,6 +1117,17 @@ def setFormatter(self, fmt):
         """
         self.formatter = fmt
 
+    def setFields(self, fields):
+        """
+        Declare the LogRecord attributes used by this handler.
+
+        The fields are the names of the attributes used by the handler, its
+        filters and its formatter, or None if any attribute may be used.
+        Loggers skip looking for the caller of a logging function when none
+        of the handlers which will handle the record use the caller fields.
+        """
+        self._recordFields = None if fields is None else frozenset(fields)
+
     def flush(self):
         """
         Ensure all logging output has been flushed.
@@ -1589,7 +1746,7 @@ def _log(self, level, msg, args, exc_info=None, extra=None, stack_info=False,
         all the handlers of this logger to handle the record.
         """
         sinfo = None
-        if _srcfile:
+        if _srcfile and (stack_info or self._usesCaller(level)):
             #IronPython doesn't track Python frames, so findCaller raises an
             #exception on some versions of IronPython. We trap it here so that
             #IronPython can use logging.
@@ -1597,7 +1754,7 @@ def _log(self, level, msg, args, exc_info=None, extra=None, stack_info=False,
                 fn, lno, func, sinfo = self.findCaller(stack_info, stacklevel)
             except ValueError: # pragma: no cover
                 fn, lno, func = "(unknown file)", 0, "(unknown function)"
-        else: # pragma: no cover
+        else:
             fn, lno, func = "(unknown file)", 0, "(unknown function)"
         if exc_info:
             if isinstance(exc_info, BaseException):
@@ -1608,6 +1765,33 @@ def _log(self, level, msg, args, exc_info=None, extra=None, stack_info=False,
                                  exc_info, func, extra, sinfo)
         self.handle(record)
 
+    def _usesCaller(self, level):
+        """
+        Check if the handlers which a record of the specified level would be
+        passed to may use the caller fields, as declared by setFields().
+
+        This follows the same path as callHandlers().
+        """
+        if self.filters:
+            return True
+        c = self
+        found = 0
+        while c:
+            for hdlr in c.handlers:
+                found = found + 1
+                if level >= hdlr.level:
+                    fields = getattr(hdlr, '_recordFields', None)
+                    if fields is None or not _callerFields.isdisjoint(fields):
+                        return True
+            if not c.propagate:
+                c = None    #break out
+            else:
+                c = c.parent
+        if found == 0 and lastResort and level >= lastResort.level:
+            fields = getattr(lastResort, '_recordFields', None)
+            return fields is None or not _callerFields.isdisjoint(fields)
+        return False
+
     def handle(self, record):
         """
         Call the handlers for the specified record.
@@ -492,6 +492,166 @@ def emit(self, record):
         logging.FileHandler.emit(self, record)
 
 
+class AsyncFileHandler(logging.FileHandler):
+    """
+    A handler class which writes formatted logging records to disk files
+    from a background thread.
+
+    Emitting a record only puts it on a bounded queue. The writer thread
+    formats the queued records and writes them in batches, with a single
+    write and flush per batch, so the logging thread never waits for the
+    disk. Records are formatted after emit() returns, so the arguments of
+    a logging call should not be mutated afterwards.
+
+    When the queue is full, the overflow policy decides what happens to a
+    new record: 'block' waits for room, 'drop' discards it, and 'sample'
+    keeps one record out of every sampleRate records which find the queue
+    full (waiting for room for it) and discards the others.
+
+    Records emitted after close() are discarded.
+    """
+    _sentinel = None
+
+    def __init__(self, filename, mode='a', encoding=None, delay=False,
+                 errors=None, queueSize=10000, overflow='block',
+                 sampleRate=10, batchSize=1000):
+        if overflow not in ('block', 'drop', 'sample'):
+            raise ValueError("overflow must be 'block', 'drop' or 'sample', "
+                             "not %r" % (overflow,))
+        if sampleRate < 1:
+            raise ValueError('sampleRate must be at least 1')
+        if batchSize < 1:
+            raise ValueError('batchSize must be at least 1')
+        logging.FileHandler.__init__(self, filename, mode=mode,
+                                     encoding=encoding, delay=delay,
+                                     errors=errors)
+        self.queueSize = queueSize
+        self.overflow = overflow
+        self.sampleRate = sampleRate
+        self.batchSize = batchSize
+        self.dropped = 0
+        self._overflows = 0
+        self.queue = queue.Queue(queueSize)
+        self._thread = None
+        self._closed = False
+
+    @property
+    def queueDepth(self):
+        """
+        The number of records waiting to be written.
+        """
+        return self.queue.qsize()
+
+    def _at_fork_reinit(self):
+        logging.FileHandler._at_fork_reinit(self)
+        # The writer thread does not exist in the child process, and the
+        # queued records belong to the parent.
+        self.queue = queue.Queue(self.queueSize)
+        self._thread = None
+
+    def emit(self, record):
+        """
+        Emit a record.
+
+        Put the record on the queue for the writer thread, starting the
+        thread if needed, and apply the overflow policy if the queue is
+        full.
+        """
+        if self._closed:
+            return
+        try:
+            if self._thread is None:
+                self._thread = t = threading.Thread(target=self._monitor,
+                                                    daemon=True)
+                t.start()
+            if self.overflow == 'block':
+                self.queue.put(record)
+                return
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                self._overflows += 1
+                if (self.overflow == 'sample'
+                        and self._overflows % self.sampleRate == 0):
+                    self.queue.put(record)
+                else:
+                    self.dropped += 1
+        except Exception:
+            self.handleError(record)
+
+    def _monitor(self):
+        """
+        Write the queued records in batches until the sentinel is seen.
+
+        This method runs on the writer thread.
+        """
+        q = self.queue
+        while True:
+            batch = [q.get()]
+            while len(batch) < self.batchSize:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            parts = []
+            stop = False
+            for record in batch:
+                if record is self._sentinel:
+                    # Records queued after the sentinel were emitted
+                    # while closing: drop them.
+                    stop = True
+                    break
+                try:
+                    parts.append(self.format(record) + self.terminator)
+                except Exception:
+                    self.handleError(record)
+            if parts:
+                try:
+                    if self.stream is None:
+                        self.stream = self._open()
+                    self.stream.write(''.join(parts))
+                    self.stream.flush()
+                except Exception:
+                    self.handleError(batch[0])
+            for record in batch:
+                q.task_done()
+            if stop:
+                break
+
+    def flush(self):
+        """
+        Wait until the queued records have been written. The writer thread
+        flushes the stream after each batch.
+        """
+        if self._thread is not None:
+            self.queue.join()
+
+    def close(self):
+        """
+        Write the queued records, stop the writer thread and close the
+        file.
+        """
+        self.acquire()
+        try:
+            stopping = not self._closed
+            self._closed = True
+            thread = self._thread
+        finally:
+            self.release()
+        # Wait for the writer without holding the lock: formatting the
+        # queued records may log through this handler.
+        if thread is not None:
+            if stopping:
+                self.queue.put(self._sentinel)
+            thread.join()
+        self.acquire()
+        try:
+            self._thread = None
+            logging.FileHandler.close(self)
+        finally:
+            self.release()
+
+
 class SocketHandler(logging.Handler):
     """
     A handler class which writes logging records, in pickle format, to
@@ -7,13 +7,14 @@
 # Licensed to PSF under a Contributor Agreement.
 #
 
-__all__ = ['Pool', 'ThreadPool']
+__all__ = ['Pool', 'ThreadPool', 'WarmPoolRegistry']
 
 #
 # Imports
 #
 
 import collections
+import contextlib
 import itertools
 import os
 import queue
@@ -50,6 +51,11 @@ def mapstar(args):
 def starmapstar(args):
     return list(itertools.starmap(args[0], args[1]))
 
+def timed_mapstar(args):
+    start = time.perf_counter()
+    result = list(map(*args))
+    return time.perf_counter() - start, result
+
 #
 # Hack to embed stringification of remote traceback in local traceback
 #
@@ -390,12 +396,32 @@ def _guarded_task_generation(self, result_job, func, iterable):
         except Exception as e:
             yield (result_job, i+1, _helper_reraises_exception, (e,), {})
 
+    def _adaptive_imap(self, iterator_class, func, iterable):
+        chunker = util._AdaptiveChunker(self._processes)
+        result = iterator_class(self, chunker)
+        tasks = self._guarded_task_generation(
+            result._job,
+            timed_mapstar,
+            Pool._get_adaptive_tasks(func, iterable, chunker,
+                                     2 * self._processes, self._task_handler))
+        # Generating the tasks waits for results, so they are fed from a
+        # thread of their own rather than the task handler shared by all
+        # the calls.
+        feeder = threading.Thread(target=Pool._feed_tasks,
+                                  args=(tasks, self._taskqueue,
+                                        result._set_length))
+        feeder.daemon = True
+        feeder.start()
+        return (item for chunk in result for item in chunk)
+
     def imap(self, func, iterable, chunksize=1):
         '''
         Equivalent of `map()` -- can be MUCH slower than `Pool.map()`.
         '''
         self._check_running()
-        if chunksize == 1:
+        if chunksize == "auto":
+            return self._adaptive_imap(_AdaptiveIMapIterator, func, iterable)
+        elif chunksize == 1:
             result = IMapIterator(self)
             self._taskqueue.put(
                 (
@@ -424,7 +450,10 @@ def imap_unordered(self, func, iterable, chunksize=1):
         Like `imap()` method but ordering of results is arbitrary.
         '''
         self._check_running()
-        if chunksize == 1:
+        if chunksize == "auto":
+            return self._adaptive_imap(_AdaptiveIMapUnorderedIterator,
+                                       func, iterable)
+        elif chunksize == 1:
             result = IMapUnorderedIterator(self)
             self._taskqueue.put(
                 (
@@ -636,6 +665,27 @@ def _get_tasks(func, it, size):
                 return
             yield (func, x)
 
+    @staticmethod
+    def _get_adaptive_tasks(func, it, chunker, window, task_handler):
+        # Keep at most `window` chunks in flight so that the sizes of the
+        # next chunks can follow the measured cost of the completed ones.
+        for x in chunker.chunks(it):
+            yield (func, x)
+            while not chunker.wait(window, 0.1):
+                if task_handler._state != RUN:
+                    return
+
+    @staticmethod
+    def _feed_tasks(taskseq, taskqueue, set_length):
+        # Hand the tasks over to the task handler one at a time, and the
+        # last one with set_length so that the handler sets the length.
+        last = None
+        for task in taskseq:
+            if last is not None:
+                taskqueue.put(((last,), None))
+            last = task
+        taskqueue.put(((last,) if last is not None else (), set_length))
+
     def __reduce__(self):
         raise NotImplementedError(
               'pool objects cannot be passed between processes or pickled'
@@ -911,6 +961,34 @@ def _set(self, i, obj):
                 del self._cache[self._job]
                 self._pool = None
 
+#
+# Classes whose instances are returned by `Pool.imap()` and
+# `Pool.imap_unordered()` with chunksize="auto"
+#
+
+class _AdaptiveIMapMixin:
+
+    def __init__(self, pool, chunker):
+        super().__init__(pool)
+        self._chunker = chunker
+
+    def _set(self, i, obj):
+        success, value = obj
+        if success:
+            elapsed, value = value
+            self._chunker.record(len(value), elapsed)
+            obj = (True, value)
+        else:
+            self._chunker.record(0)
+        super()._set(i, obj)
+
+class _AdaptiveIMapIterator(_AdaptiveIMapMixin, IMapIterator):
+    pass
+
+class _AdaptiveIMapUnorderedIterator(_AdaptiveIMapMixin,
+                                     IMapUnorderedIterator):
+    pass
+
 #
 #
 #
@@ -952,3 +1030,164 @@ def _help_stuff_finish(inqueue, task_handler, size):
 
     def _wait_for_updates(self, sentinels, change_notifier, timeout):
         time.sleep(timeout)
+
+#
+# Registry of named pools whose workers are kept initialized between uses
+#
+
+def _warm_initializer(preload, initializer, initargs):
+    'Pickle-able helper function used by WarmPoolRegistry.'
+    for name in preload:
+        __import__(name)
+    if initializer is not None:
+        initializer(*initargs)
+
+class WarmPoolRegistry(object):
+    '''
+    Registry of named pools whose workers stay alive between leases.
+
+    The workers of a leased pool have already imported the preloaded
+    modules and run the initializer, so that short-lived users of a pool
+    do not pay the worker startup cost again.
+    '''
+
+    def __init__(self, context=None):
+        self._ctx = context or get_context()
+        self._lock = threading.Lock()
+        self._specs = {}
+        self._idle = {}
+        self._starting = {}
+        self._leased = {}
+
+    def register(self, name, processes=None, initializer=None, initargs=(),
+                 *, preload=(), maxtasksperchild=None, max_idle=1):
+        '''
+        Register how to create the pools named `name`.
+
+        `preload` is a list of module names imported by each worker before
+        `initializer` is called.  At most `max_idle` pools are kept alive
+        when not leased.
+        '''
+        if initializer is not None and not callable(initializer):
+            raise TypeError('initializer must be a callable')
+        if max_idle < 0:
+            raise ValueError("max_idle must be at least 0")
+        with self._lock:
+            if name in self._specs:
+                raise ValueError("pool {!r} is already registered".format(
+                    name))
+            self._specs[name] = (processes,
+                                 (tuple(preload), initializer, initargs),
+                                 maxtasksperchild, max_idle)
+            self._idle[name] = []
+
+    def unregister(self, name):
+        '''Forget the pools named `name` and terminate the idle ones.'''
+        with self._lock:
+            del self._specs[name]
+            idle = self._idle.pop(name)
+        for pool in idle:
+            pool.terminate()
+
+    def _get_spec(self, name):
+        # Must be called with the lock held
+        try:
+            return self._specs[name]
+        except KeyError:
+            raise KeyError("no pool registered as {!r}".format(name)) from None
+
+    def _create(self, spec):
+        # Starting the workers takes time: never called with the lock held
+        processes, initargs, maxtasksperchild, max_idle = spec
+        return Pool(processes, _warm_initializer, initargs,
+                    maxtasksperchild, self._ctx)
+
+    def warm(self, name, count=1):
+        '''Start idle pools named `name` until `count` of them are idle.'''
+        while True:
+            with self._lock:
+                spec = self._get_spec(name)
+                starting = self._starting.get(name, 0)
+                if len(self._idle[name]) + starting >= count:
+                    return
+                self._starting[name] = starting + 1
+            pool = None
+            try:
+                pool = self._create(spec)
+            finally:
+                with self._lock:
+                    self._starting[name] -= 1
+                    if pool is not None and self._specs.get(name) is spec:
+                        self._idle[name].append(pool)
+                        pool = None
+            if pool is not None:
+                # Unregistered in the meantime
+                pool.terminate()
+
+    def acquire(self, name):
+        '''
+        Return an idle pool named `name`, or a new one if none is idle.
+
+        The pool must be given back with `release()`.
+        '''
+        stale = []
+        with self._lock:
+            spec = self._get_spec(name)
+            idle = self._idle[name]
+            while idle:
+                pool = idle.pop()
+                if pool._state == RUN:
+                    self._leased[pool] = name
+                    break
+                stale.append(pool)
+            else:
+                pool = None
+        for p in stale:
+            p.terminate()
+        if pool is None:
+            pool = self._create(spec)
+            with self._lock:
+                self._leased[pool] = name
+        return pool
+
+    def release(self, pool):
+        '''
+        Give back a pool returned by `acquire()`.
+
+        The pool is kept for the next lease unless it was closed or
+        terminated, or enough pools of its name are already idle.
+        '''
+        with self._lock:
+            name = self._leased.pop(pool)
+            spec = self._specs.get(name)
+            if (spec is not None and pool._state == RUN
+                    and len(self._idle[name]) < spec[3]):
+                self._idle[name].append(pool)
+                return
+        pool.terminate()
+
+    @contextlib.contextmanager
+    def lease(self, name):
+        '''
+        Context manager acquiring a pool named `name` and releasing it.
+        '''
+        pool = self.acquire(name)
+        try:
+            yield pool
+        finally:
+            self.release(pool)
+
+    def close(self):
+        '''Terminate all the idle pools.'''
+        with self._lock:
+            idle = [pool for pools in self._idle.values() for pool in pools]
+            for pools in self._idle.values():
+                pools.clear()
+        for pool in idle:
+            pool.terminate()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -7,6 +7,7 @@
 # Licensed to PSF under a Contributor Agreement.
 #
 
+import collections
 import os
 import itertools
 import sys
@@ -463,6 +464,89 @@ def close_fds(*fds):
     for fd in fds:
         os.close(fd)
 
+#
+# Adaptive chunking for map()-like functions
+#
+
+class _AdaptiveChunker(object):
+    '''
+    Splits an iterable into chunks sized from the measured cost of items.
+
+    Chunks start with a single item and then follow the smoothed cost per
+    item reported through `record()` so that each chunk takes about `target`
+    seconds of work, growing at most twofold from one chunk to the next.
+    Once the end of the iterable is in sight, the remaining items are split
+    evenly between the workers so that none of them is left idle.
+    '''
+
+    def __init__(self, workers, target=0.02):
+        self._workers = workers
+        self._target = target
+        self._size = 1
+        self._cost = None
+        self._in_flight = 0
+        self._cond = threading.Condition(threading.Lock())
+
+    def _next_size(self):
+        if self._cost is None:
+            return self._size
+        if self._cost > 0:
+            size = int(self._target / self._cost)
+        else:
+            size = 2 * self._size
+        return max(1, min(size, 2 * self._size))
+
+    def chunks(self, iterable):
+        '''Generate tuples of consecutive items from iterable.'''
+        it = iter(iterable)
+        items = collections.deque()
+        exhausted = False
+        error = None
+        while True:
+            size = self._next_size()
+            # Look far enough ahead to know whether the tail was reached
+            missing = size * self._workers - len(items)
+            if not exhausted and missing > 0:
+                try:
+                    items.extend(itertools.islice(it, missing))
+                except Exception as e:
+                    # Raise once the items read so far have been chunked
+                    error = e
+                    exhausted = True
+                else:
+                    exhausted = len(items) < size * self._workers
+            if not items:
+                if error is not None:
+                    raise error
+                return
+            if exhausted:
+                size = min(size, -(-len(items) // self._workers))
+            self._size = size
+            chunk = tuple([items.popleft() for i in range(size)])
+            with self._cond:
+                self._in_flight += 1
+            yield chunk
+
+    def record(self, nitems, elapsed=None):
+        '''Record that a chunk of nitems items took elapsed seconds.
+
+        elapsed is None when the chunk failed.'''
+        with self._cond:
+            self._in_flight = max(0, self._in_flight - 1)
+            if elapsed is not None and nitems:
+                cost = elapsed / nitems
+                if self._cost is None:
+                    self._cost = cost
+                else:
+                    self._cost = (self._cost + cost) / 2
+            self._cond.notify_all()
+
+    def wait(self, window, timeout=None):
+        '''Wait until less than window chunks are in flight.'''
+        with self._cond:
+            return self._cond.wait_for(lambda: self._in_flight < window,
+                                       timeout)
+
 
 def _cleanup_tests():
     """Cleanup multiprocessing resources when multiprocessing tests
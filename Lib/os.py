@@ -425,6 +425,249 @@ def _walk(top, topdown, onerror, followlinks):
 
 __all__.append("walk")
 
+def parallel_walk(top, onerror=None, followlinks=False, *, max_workers=None,
+                  max_pending=None, ordered=True):
+    """Directory tree generator scanning directories in parallel.
+
+    This behaves like walk() with topdown true, except that directories are
+    scanned by a pool of max_workers threads, which helps when each
+    os.scandir() call waits for a network or FUSE file system.  At most
+    max_pending directories (default: 16 times the number of workers) are
+    scanned ahead of the caller.  Subdirectories may be scanned before the
+    triple of their parent is generated; the scans of the subdirectories
+    removed from dirnames are discarded.
+
+    If ordered is true (the default), the triples are generated in the same
+    order as walk().  Otherwise, they are generated as the directories are
+    scanned: a directory is still generated before its subdirectories, but
+    the order of the other directories is not deterministic.
+
+    Errors and symbolic links are handled like in walk(); onerror is called
+    in the thread iterating over the generator.  Closing the generator
+    waits for the scans in progress.
+    """
+    sys.audit("os.walk", top, True, onerror, followlinks)
+    if max_workers is None:
+        max_workers = min(32, (cpu_count() or 1) + 4)
+    if max_workers <= 0:
+        raise ValueError("max_workers must be greater than 0")
+    if max_pending is None:
+        max_pending = 16 * max_workers
+    if max_pending <= 0:
+        raise ValueError("max_pending must be greater than 0")
+    walker = _parallel_walk_ordered if ordered else _parallel_walk_unordered
+    return walker(fspath(top), onerror, followlinks, max_workers, max_pending)
+
+def _walk_scan(top, followlinks, check_link):
+    # Run by the worker threads: return (dirs, nondirs), the OSError which
+    # prevented listing top, or None if top is a symlink not to walk into.
+    if check_link and not followlinks and path.islink(top):
+        return None
+    dirs = []
+    nondirs = []
+    try:
+        with scandir(top) as scandir_it:
+            for entry in scandir_it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    dirs.append(entry.name)
+                else:
+                    nondirs.append(entry.name)
+    except OSError as error:
+        return error
+    return dirs, nondirs
+
+def _parallel_walk_ordered(top, onerror, followlinks, max_workers,
+                           max_pending):
+    from concurrent.futures import Future, ThreadPoolExecutor
+    from heapq import heappush, heappop
+    from threading import Lock, Semaphore
+
+    join = path.join
+    executor = ThreadPoolExecutor(max_workers,
+                                  thread_name_prefix="os.parallel_walk")
+    # A unit is held by each scan submitted and not consumed yet.
+    budget = Semaphore(max_pending)
+    # The submitted scans, by position in walk() order: the workers always
+    # run the scan which will be needed first.
+    queue = []
+    queue_lock = Lock()
+
+    # A node is a [path, future, key] list, where key is the tuple of the
+    # indexes of the directory and its parents in their parent directory,
+    # which sort in walk() order, and future is None until the scan of the
+    # directory is submitted.
+
+    def submit(node):
+        # Submit the scan of node if the budget allows it.
+        if not budget.acquire(blocking=False):
+            return False
+        node[1] = Future()
+        with queue_lock:
+            heappush(queue, (node[2], id(node), node))
+        try:
+            executor.submit(run_next)
+        except RuntimeError:
+            # The executor was shut down by the walk being closed.
+            budget.release()
+            return False
+        return True
+
+    def run_next():
+        with queue_lock:
+            node = heappop(queue)[2]
+        future = node[1]
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = scan(node)
+        except BaseException as exc:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+    def scan(node):
+        dirpath, future, key = node
+        result = _walk_scan(dirpath, followlinks, len(key) > 1)
+        if isinstance(result, tuple):
+            # Start scanning the subdirectories as soon as they are known.
+            dirs, nondirs = result
+            children = [[join(dirpath, dirname), None, key + (i,)]
+                        for i, dirname in enumerate(dirs)]
+            for child in children:
+                if not submit(child):
+                    break
+            result = dirs, nondirs, children
+        return result
+
+    def discard(node):
+        # Release the budget held by a subtree which will not be visited.
+        future = node[1]
+        if future is not None:
+            if future.cancel():
+                budget.release()
+            else:
+                future.add_done_callback(discard_result)
+
+    def discard_result(future):
+        budget.release()
+        if future.exception() is None:
+            result = future.result()
+            if isinstance(result, tuple):
+                for node in result[2]:
+                    discard(node)
+
+    try:
+        # levels[i] is [nodes, head, start]: the nodes of the directories at
+        # depth i in walk() order, of which the ones before head have been
+        # visited and the ones before start have been submitted.
+        levels = [[[[top, None, (0,)]], 0, 0]]
+
+        def submit_more():
+            # Submit the scans of the directories which will be visited
+            # first, the next ones at the deepest level, until the budget
+            # is exhausted.
+            depth = len(levels) - 1
+            while depth >= 0:
+                level = levels[depth]
+                nodes, head, start = level
+                start = max(start, head)
+                while start < len(nodes) and nodes[start][1] is not None:
+                    start += 1
+                level[2] = start
+                if start < len(nodes):
+                    if not submit(nodes[start]):
+                        return
+                else:
+                    depth -= 1
+
+        while levels:
+            level = levels[-1]
+            nodes, head, start = level
+            if head == len(nodes):
+                levels.pop()
+                continue
+            level[1] = head + 1
+            node = nodes[head]
+            future = node[1]
+            if future is not None and future.cancel():
+                # Not started yet: scan it now.
+                budget.release()
+                future = None
+            if future is None:
+                result = scan(node)
+            else:
+                result = future.result()
+                budget.release()
+            if result is None or isinstance(result, OSError):
+                submit_more()
+                if result is not None and onerror is not None:
+                    onerror(result)
+                continue
+            dirpath = node[0]
+            dirs, nondirs, children = result
+            names = dirs[:]
+            levels.append([children, 0, 0])
+            submit_more()
+            yield dirpath, dirs, nondirs
+            if dirs != names:
+                # The caller pruned or reordered dirnames: keep the scans of
+                # the subdirectories which are still listed.
+                nodes = dict(zip(names, children))
+                key = node[2]
+                children = [nodes.pop(dirname, None)
+                            or [join(dirpath, dirname), None, key + (i,)]
+                            for i, dirname in enumerate(dirs)]
+                for child in nodes.values():
+                    discard(child)
+                levels[-1] = [children, 0, 0]
+                submit_more()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+def _parallel_walk_unordered(top, onerror, followlinks, max_workers,
+                             max_pending):
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+    join = path.join
+    executor = ThreadPoolExecutor(max_workers,
+                                  thread_name_prefix="os.parallel_walk")
+    try:
+        running = {executor.submit(_walk_scan, top, followlinks, False): top}
+        todo = deque()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                dirpath = running.pop(future)
+                result = future.result()
+                if result is None:
+                    continue
+                if isinstance(result, OSError):
+                    if onerror is not None:
+                        onerror(result)
+                    continue
+                dirs, nondirs = result
+                yield dirpath, dirs, nondirs
+                # Visit the most recently found directories first, to keep
+                # todo short.
+                todo.extend(join(dirpath, dirname)
+                            for dirname in reversed(dirs))
+            # Refill even when every completed scan was a symlink or an
+            # error, so that no queued directory is left behind.
+            while todo and len(running) < max_pending:
+                new_path = todo.pop()
+                future = executor.submit(_walk_scan, new_path,
+                                         followlinks, True)
+                running[future] = new_path
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+__all__.append("parallel_walk")
+
 if {open, stat} <= supports_dir_fd and {scandir, stat} <= supports_fd:
 
     def fwalk(top=".", topdown=True, onerror=None, *, follow_symlinks=False, dir_fd=None):
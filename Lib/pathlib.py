@@ -491,7 +491,14 @@ def _make_selector(pattern_parts, flavour):
 
 class _Selector:
     """A selector matches a specific glob pattern part against the children
-    of a given path."""
+    of a given path.
+
+    Selectors work on the string form of the paths and on the os.DirEntry
+    objects returned by scandir(), and yield (parts, entry) pairs, where
+    parts is the tuple of the parts of the matching path relative to the
+    starting path, and entry its DirEntry if it was found by scanning its
+    parent directory, else None.  Path objects are only created for the
+    results, by select_from()."""
 
     def __init__(self, child_parts, flavour):
         self.child_parts = child_parts
@@ -502,22 +509,36 @@ def __init__(self, child_parts, flavour):
             self.successor = _TerminatingSelector()
             self.dironly = False
 
-    def select_from(self, parent_path):
+    def select_from(self, parent_path, entries=False):
         """Iterate over all child paths of `parent_path` matched by this
-        selector.  This can contain parent_path itself."""
-        path_cls = type(parent_path)
-        is_dir = path_cls.is_dir
-        exists = path_cls.exists
-        scandir = parent_path._accessor.scandir
-        if not is_dir(parent_path):
+        selector.  This can contain parent_path itself.  If `entries` is
+        true, iterate over (path, entry) pairs instead."""
+        if not type(parent_path).is_dir(parent_path):
             return iter([])
-        return self._select_from(parent_path, is_dir, exists, scandir)
+        results = self._select_from(str(parent_path), (), None,
+                                    parent_path._accessor, None)
+        return _make_paths(parent_path, results, entries)
+
+
+def _make_paths(parent_path, results, entries):
+    drv, root, base_parts = (parent_path._drv, parent_path._root,
+                             parent_path._parts)
+    from_parsed_parts = parent_path._from_parsed_parts
+    for parts, entry in results:
+        if parts:
+            path = from_parsed_parts(drv, root, base_parts + list(parts))
+        else:
+            path = parent_path
+        if entries:
+            yield path, entry
+        else:
+            yield path
 
 
 class _TerminatingSelector:
 
-    def _select_from(self, parent_path, is_dir, exists, scandir):
-        yield parent_path
+    def _select_from(self, path, parts, entry, accessor, scanned):
+        yield parts, entry
 
 
 class _PreciseSelector(_Selector):
@@ -526,12 +547,23 @@ def __init__(self, name, child_parts, flavour):
         self.name = name
         _Selector.__init__(self, child_parts, flavour)
 
-    def _select_from(self, parent_path, is_dir, exists, scandir):
+    def _select_from(self, path, parts, entry, accessor, scanned):
         try:
-            path = parent_path._make_child_relpath(self.name)
-            if (is_dir if self.dironly else exists)(path):
-                for p in self.successor._select_from(path, is_dir, exists, scandir):
-                    yield p
+            name = self.name
+            path = os.path.join(path, name)
+            # Like Path.is_dir() and Path.exists()
+            try:
+                st = accessor.stat(path)
+            except OSError as e:
+                if not _ignore_error(e):
+                    raise
+                return
+            except ValueError:
+                return
+            if self.dironly and not S_ISDIR(st.st_mode):
+                return
+            yield from self.successor._select_from(
+                path, parts + (name,), None, accessor, None)
         except PermissionError:
             return
 
@@ -542,11 +574,15 @@ def __init__(self, pat, child_parts, flavour):
         self.match = flavour.compile_pattern(pat)
         _Selector.__init__(self, child_parts, flavour)
 
-    def _select_from(self, parent_path, is_dir, exists, scandir):
+    def _select_from(self, path, parts, entry, accessor, scanned):
         try:
-            with scandir(parent_path) as scandir_it:
-                entries = list(scandir_it)
-            for entry in entries:
+            if scanned is None:
+                with accessor.scandir(path) as scandir_it:
+                    scanned = list(scandir_it)
+            match = self.match
+            successor_select = self.successor._select_from
+            terminating = isinstance(self.successor, _TerminatingSelector)
+            for entry in scanned:
                 if self.dironly:
                     try:
                         # "entry.is_dir()" can raise PermissionError
@@ -559,10 +595,12 @@ def _select_from(self, parent_path, is_dir, exists, scandir):
                             raise
                         continue
                 name = entry.name
-                if self.match(name):
-                    path = parent_path._make_child_relpath(name)
-                    for p in self.successor._select_from(path, is_dir, exists, scandir):
-                        yield p
+                if match(name):
+                    if terminating:
+                        yield parts + (name,), entry
+                    else:
+                        yield from successor_select(
+                            entry.path, parts + (name,), entry, accessor, None)
         except PermissionError:
             return
 
@@ -571,36 +609,66 @@ class _RecursiveWildcardSelector(_Selector):
 
     def __init__(self, pat, child_parts, flavour):
         _Selector.__init__(self, child_parts, flavour)
+        self.casefold_parts = flavour.casefold_parts
+        # The same path can only be selected from two starting points if
+        # the rest of the pattern contains '..' or another '**'.
+        self.unique = True
+        successor = self.successor
+        while not isinstance(successor, _TerminatingSelector):
+            if (isinstance(successor, _RecursiveWildcardSelector)
+                    or getattr(successor, 'name', None) == '..'):
+                self.unique = False
+            successor = successor.successor
+
+    def _iterate_directories(self, path, parts, entry, accessor):
+        # Yield each directory, depth first, with the list of its entries,
+        # which the successor reuses instead of scanning the directory again.
+        stack = [(path, parts, entry)]
+        while stack:
+            path, parts, entry = stack.pop()
+            try:
+                with accessor.scandir(path) as scandir_it:
+                    entries = list(scandir_it)
+            except PermissionError:
+                yield path, parts, entry, None
+                continue
+            yield path, parts, entry, entries
+            subdirs = []
+            try:
+                for entry in entries:
+                    entry_is_dir = False
+                    try:
+                        entry_is_dir = entry.is_dir()
+                    except OSError as e:
+                        if not _ignore_error(e):
+                            raise
+                    if entry_is_dir and not entry.is_symlink():
+                        subdirs.append(
+                            (entry.path, parts + (entry.name,), entry))
+            except PermissionError:
+                pass
+            stack.extend(reversed(subdirs))
 
-    def _iterate_directories(self, parent_path, is_dir, scandir):
-        yield parent_path
-        try:
-            with scandir(parent_path) as scandir_it:
-                entries = list(scandir_it)
-            for entry in entries:
-                entry_is_dir = False
-                try:
-                    entry_is_dir = entry.is_dir()
-                except OSError as e:
-                    if not _ignore_error(e):
-                        raise
-                if entry_is_dir and not entry.is_symlink():
-                    path = parent_path._make_child_relpath(entry.name)
-                    for p in self._iterate_directories(path, is_dir, scandir):
-                        yield p
-        except PermissionError:
-            return
-
-    def _select_from(self, parent_path, is_dir, exists, scandir):
+    def _select_from(self, path, parts, entry, accessor, scanned):
         try:
+            successor_select = self.successor._select_from
+            directories = self._iterate_directories(path, parts, entry,
+                                                    accessor)
+            if self.unique:
+                for path, parts, entry, entries in directories:
+                    yield from successor_select(path, parts, entry, accessor,
+                                                entries)
+                return
             yielded = set()
+            casefold_parts = self.casefold_parts
             try:
-                successor_select = self.successor._select_from
-                for starting_point in self._iterate_directories(parent_path, is_dir, scandir):
-                    for p in successor_select(starting_point, is_dir, exists, scandir):
-                        if p not in yielded:
-                            yield p
-                            yielded.add(p)
+                for path, parts, entry, entries in directories:
+                    for result in successor_select(path, parts, entry,
+                                                   accessor, entries):
+                        key = tuple(casefold_parts(result[0]))
+                        if key not in yielded:
+                            yield result
+                            yielded.add(key)
             finally:
                 yielded.clear()
         except PermissionError:
@@ -1155,9 +1223,13 @@ def iterdir(self):
                 continue
             yield self._make_child_relpath(name)
 
-    def glob(self, pattern):
+    def glob(self, pattern, *, entries=False):
         """Iterate over this subtree and yield all existing files (of any
         kind, including directories) matching the given relative pattern.
+
+        If entries is true, yield (path, entry) pairs, where entry is the
+        os.DirEntry found when scanning the parent directory of path, or
+        None if the path was not found by scanning its parent directory.
         """
         sys.audit("pathlib.Path.glob", self, pattern)
         if not pattern:
@@ -1166,21 +1238,19 @@ def glob(self, pattern):
         if drv or root:
             raise NotImplementedError("Non-relative patterns are unsupported")
         selector = _make_selector(tuple(pattern_parts), self._flavour)
-        for p in selector.select_from(self):
-            yield p
+        yield from selector.select_from(self, entries)
 
-    def rglob(self, pattern):
+    def rglob(self, pattern, *, entries=False):
         """Recursively yield all existing files (of any kind, including
         directories) matching the given relative pattern, anywhere in
-        this subtree.
+        this subtree.  See glob() for the meaning of entries.
         """
         sys.audit("pathlib.Path.rglob", self, pattern)
         drv, root, pattern_parts = self._flavour.parse_parts((pattern,))
         if drv or root:
             raise NotImplementedError("Non-relative patterns are unsupported")
         selector = _make_selector(("**",) + tuple(pattern_parts), self._flavour)
-        for p in selector.select_from(self):
-            yield p
+        yield from selector.select_from(self, entries)
 
     def absolute(self):
         """Return an absolute version of this path.  This function works
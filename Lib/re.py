@@ -125,6 +125,9 @@
 import sre_compile
 import sre_parse
 import functools
+import marshal
+import sys
+import _sre
 try:
     import _locale
 except ImportError:
@@ -135,9 +138,10 @@
 __all__ = [
     "match", "fullmatch", "search", "sub", "subn", "split",
     "findall", "finditer", "compile", "purge", "template", "escape",
+    "cache_info", "set_cache_size", "save_cache", "load_cache", "RegexSet",
     "error", "Pattern", "Match", "A", "I", "L", "M", "S", "X", "U",
     "ASCII", "IGNORECASE", "LOCALE", "MULTILINE", "DOTALL", "VERBOSE",
-    "UNICODE",
+    "UNICODE", "LINEAR",
 ]
 
 __version__ = "2.2.1"
@@ -150,6 +154,7 @@ class RegexFlag(enum.IntFlag):
     MULTILINE = M = sre_compile.SRE_FLAG_MULTILINE # make anchors look for newline
     DOTALL = S = sre_compile.SRE_FLAG_DOTALL # make dot match newline
     VERBOSE = X = sre_compile.SRE_FLAG_VERBOSE # ignore whitespace and comments
+    LINEAR = sre_compile.SRE_FLAG_LINEAR # match in linear time
     # sre extensions (experimental, don't rely on these)
     TEMPLATE = T = sre_compile.SRE_FLAG_TEMPLATE # disable backtracking
     DEBUG = sre_compile.SRE_FLAG_DEBUG # dump pattern after compilation
@@ -254,8 +259,68 @@ def compile(pattern, flags=0):
 def purge():
     "Clear the regular expression caches"
     _cache.clear()
+    _cache2.clear()
+    _cache_stats[:] = [0, 0]
     _compile_repl.cache_clear()
 
+def cache_info():
+    "Return the statistics of the compiled pattern cache"
+    hits, misses = _cache_stats
+    return functools._CacheInfo(hits, misses, _MAXCACHE, len(_cache))
+
+def set_cache_size(maxsize):
+    """Set the maximum number of compiled patterns kept in the cache,
+    dropping the least recently used ones if needed."""
+    global _MAXCACHE, _MAXCACHE2
+    if not isinstance(maxsize, int):
+        raise TypeError("maxsize must be an integer")
+    if maxsize < 0:
+        raise ValueError("maxsize must not be negative")
+    _MAXCACHE = maxsize
+    _MAXCACHE2 = maxsize // 2
+    _cache2.clear()
+    _trim_cache(maxsize)
+
+def save_cache(filename):
+    """Save the compiled patterns of the cache to a file, to be restored
+    with load_cache()"""
+    entries = []
+    for pattern_type, pattern, flags in list(_cache):
+        if pattern_type is not str and pattern_type is not bytes:
+            continue
+        if flags & LINEAR:
+            continue
+        p = sre_parse.parse(pattern, flags)
+        args = sre_compile._compile_args(pattern, p, flags)
+        # The opcodes are int subclasses, which marshal does not support.
+        code = list(map(int, args[2]))
+        entries.append((flags, args[:2] + (code,) + args[3:]))
+    data = marshal.dumps((_cache_signature(), entries))
+    with open(filename, 'wb') as file:
+        file.write(data)
+
+def load_cache(filename):
+    """Add the compiled patterns saved by save_cache() to the cache, and
+    return their number.  Files written by other versions are ignored."""
+    with open(filename, 'rb') as file:
+        data = file.read()
+    try:
+        signature, entries = marshal.loads(data)
+    except (EOFError, TypeError, ValueError):
+        raise ValueError(f"{filename!r} is not a pattern cache file")
+    if signature != _cache_signature():
+        return 0
+    count = 0
+    for flags, args in entries:
+        pattern = args[0]
+        key = type(pattern), pattern, flags
+        if key in _cache or not _MAXCACHE:
+            continue
+        _trim_cache(_MAXCACHE - 1)
+        _cache[key] = _sre.compile(*args)
+        count += 1
+    return count
+
 def template(pattern, flags=0):
     "Compile a template pattern, returning a Pattern object"
     return _compile(pattern, flags|T)
@@ -283,35 +348,76 @@ def escape(pattern):
 # --------------------------------------------------------------------
 # internals
 
-_cache = {}  # ordered!
+_cache = {}  # ordered, least recently used first!
+# The most recently used patterns, oldest first.  They are looked up there
+# first, so that a hit does not need to update the order of _cache.
+_cache2 = {}
+# Hits and misses (not globals, whose updates slow down every lookup)
+_cache_stats = [0, 0]
 
 _MAXCACHE = 512
+_MAXCACHE2 = 256
 def _compile(pattern, flags):
     # internal: compile pattern
     if isinstance(flags, RegexFlag):
         flags = flags.value
     try:
-        return _cache[type(pattern), pattern, flags]
+        p = _cache2[type(pattern), pattern, flags]
+        _cache_stats[0] += 1
+        return p
     except KeyError:
         pass
-    if isinstance(pattern, Pattern):
-        if flags:
-            raise ValueError(
-                "cannot process flags argument with a compiled pattern")
-        return pattern
-    if not sre_compile.isstring(pattern):
-        raise TypeError("first argument must be string or compiled pattern")
-    p = sre_compile.compile(pattern, flags)
-    if not (flags & DEBUG):
-        if len(_cache) >= _MAXCACHE:
-            # Drop the oldest item
+    key = type(pattern), pattern, flags
+    # Move the pattern to the end
+    p = _cache.pop(key, None)
+    if p is None:
+        if not sre_compile.isstring(pattern):
+            if not isinstance(pattern, Pattern):
+                # LINEAR patterns; sre_linear is only imported when needed
+                import sre_linear
+                if not isinstance(pattern, sre_linear.Pattern):
+                    raise TypeError(
+                        "first argument must be string or compiled pattern")
+            if flags:
+                raise ValueError(
+                    "cannot process flags argument with a compiled pattern")
+            return pattern
+        if flags & LINEAR:
+            import sre_linear
+            p = sre_linear.compile(pattern, flags)
+        else:
+            p = sre_compile.compile(pattern, flags)
+        if flags & DEBUG:
+            return p
+        _cache_stats[1] += 1
+        if not _MAXCACHE:
+            return p
+        _trim_cache(_MAXCACHE - 1)
+    else:
+        _cache_stats[0] += 1
+    _cache[key] = p
+    if _MAXCACHE2:
+        if len(_cache2) >= _MAXCACHE2:
+            # Drop the oldest pattern
             try:
-                del _cache[next(iter(_cache))]
+                del _cache2[next(iter(_cache2))]
             except (StopIteration, RuntimeError, KeyError):
                 pass
-        _cache[type(pattern), pattern, flags] = p
+        _cache2[key] = p
     return p
 
+def _trim_cache(maxsize):
+    # internal: drop the least recently used patterns
+    while len(_cache) > maxsize:
+        try:
+            del _cache[next(iter(_cache))]
+        except (StopIteration, RuntimeError, KeyError):
+            pass
+
+def _cache_signature():
+    # internal: the compiled code depends on the version of sre and Python
+    return b're.cache', sre_compile.MAGIC, _sre.CODESIZE, sys.version
+
 @functools.lru_cache(_MAXCACHE)
 def _compile_repl(repl, pattern):
     # internal: compile replacement pattern
@@ -382,3 +488,161 @@ def scan(self, string):
                 append(action)
             i = j
         return result, string[i:]
+
+# --------------------------------------------------------------------
+# pattern sets
+
+# Longer literal prefixes only make the prefilter bigger.
+_MAXPREFIX = 64
+
+def _literal_prefixes(p, flags):
+    # internal: return the literal prefixes (lists of character codes) one
+    # of which starts every match of the parsed pattern p, or None
+    from sre_constants import AT, BRANCH
+    flags |= p.state.flags
+    if flags & IGNORECASE and flags & LOCALE:
+        return None
+    data = p.data
+    i = 0
+    # anchors do not consume characters
+    while i < len(data) and data[i][0] is AT:
+        i += 1
+    if i < len(data) and data[i][0] is BRANCH:
+        alternatives = data[i][1][1]
+    else:
+        alternatives = [sre_parse.SubPattern(p.state, data[i:])]
+    prefixes = []
+    for alternative in alternatives:
+        prefix = sre_compile._get_literal_prefix(alternative, flags)[0]
+        if not prefix:
+            return None
+        prefixes.append(prefix[:_MAXPREFIX])
+    return prefixes
+
+def _compile_prefilter(literals, empty):
+    # internal: compile a pattern matching the longest of the literals
+    # which starts at the current position.  The literals are stored in a
+    # trie, so the pattern branches on one character at a time.
+    from sre_constants import BRANCH, LITERAL
+    trie = {}
+    for literal in literals:
+        node = trie
+        for c in literal:
+            node = node.setdefault(c, {})
+        node[None] = None
+    state = sre_parse.State()
+    def build(node):
+        data = []
+        while len(node) == 1 and None not in node:
+            (c, node), = node.items()
+            data.append((LITERAL, c))
+        alternatives = [
+            sre_parse.SubPattern(state, [(LITERAL, c)] + build(child))
+            for c, child in node.items() if c is not None
+        ]
+        if alternatives:
+            if None in node:
+                # or stop here
+                alternatives.append(sre_parse.SubPattern(state))
+            data.append((BRANCH, (None, alternatives)))
+        return data
+    p = sre_parse.SubPattern(state, build(trie))
+    # the empty pattern makes the prefilter reject the other string type
+    return _sre.compile(*sre_compile._compile_args(empty, p, 0))
+
+class RegexSet:
+    """A set of regular expressions, matched together against a string.
+
+    The match(), fullmatch() and search() methods return the indices of
+    the patterns which match, in increasing order.  A prefilter built
+    from the literal prefixes of the patterns finds, in one scan of the
+    string, the only patterns which may match; the others are skipped.
+    """
+
+    def __init__(self, patterns, flags=0):
+        import warnings
+        self.patterns = tuple(_compile(pattern, flags) for pattern in patterns)
+        self._prefixed = {}
+        self._unprefixed = []
+        empty = None
+        for i, pattern in enumerate(self.patterns):
+            if empty is None:
+                empty = pattern.pattern[:0]
+            elif type(pattern.pattern) is not type(empty):
+                raise TypeError("cannot mix str and bytes patterns")
+            with warnings.catch_warnings():
+                # already reported when compiling the pattern
+                warnings.simplefilter("ignore")
+                p = sre_parse.parse(pattern.pattern, pattern.flags)
+            prefixes = _literal_prefixes(p, pattern.flags)
+            if prefixes is None:
+                self._unprefixed.append(i)
+                continue
+            for prefix in prefixes:
+                if isinstance(empty, str):
+                    prefix = "".join(map(chr, prefix))
+                else:
+                    prefix = bytes(prefix)
+                self._prefixed.setdefault(prefix, set()).add(i)
+        # the patterns which may match where each literal is the longest
+        # one found: those of the literal and of its prefixes
+        self._candidates = {}
+        for literal in self._prefixed:
+            candidates = set()
+            for j in range(1, len(literal) + 1):
+                candidates.update(self._prefixed.get(literal[:j], ()))
+            self._candidates[literal] = candidates
+        if self._prefixed:
+            self._prefilter = _compile_prefilter(
+                [list(literal) if isinstance(literal, bytes)
+                 else list(map(ord, literal))
+                 for literal in self._prefixed],
+                empty)
+        else:
+            self._prefilter = None
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def __repr__(self):
+        return "re.RegexSet(%r)" % (list(self.patterns),)
+
+    def _anchored(self, string, pos, endpos):
+        candidates = set(self._unprefixed)
+        if self._prefilter is not None:
+            m = self._prefilter.match(string, pos, endpos)
+            if m is not None:
+                candidates.update(self._candidates[m[0]])
+        return sorted(candidates)
+
+    def match(self, string, pos=0, endpos=sys.maxsize):
+        """Return the indices of the patterns matching at the beginning
+        of the string."""
+        patterns = self.patterns
+        return [i for i in self._anchored(string, pos, endpos)
+                if patterns[i].match(string, pos, endpos)]
+
+    def fullmatch(self, string, pos=0, endpos=sys.maxsize):
+        """Return the indices of the patterns matching all of the
+        string."""
+        patterns = self.patterns
+        return [i for i in self._anchored(string, pos, endpos)
+                if patterns[i].fullmatch(string, pos, endpos)]
+
+    def search(self, string, pos=0, endpos=sys.maxsize):
+        """Return the indices of the patterns matching anywhere in the
+        string."""
+        candidates = set(self._unprefixed)
+        if self._prefilter is not None:
+            search = self._prefilter.search
+            found = self._candidates
+            start = pos
+            while True:
+                m = search(string, start, endpos)
+                if m is None:
+                    break
+                candidates.update(found[m[0]])
+                start = m.start() + 1
+        patterns = self.patterns
+        return [i for i in sorted(candidates)
+                if patterns[i].search(string, pos, endpos)]
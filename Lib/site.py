@@ -580,6 +580,66 @@ def execusercustomize():
                 (err.__class__.__name__, err))
 
 
+def enableimportarchive():
+    """Install the archive named by PYTHONIMPORTARCHIVE, if any."""
+    if sys.flags.ignore_environment:
+        return
+    filename = os.environ.get('PYTHONIMPORTARCHIVE')
+    if not filename:
+        return
+    _trace(f"Using import archive: {filename!r}")
+    try:
+        from importlib import archive
+        archive.install(filename)
+    except (OSError, ImportError) as err:
+        # Imports still work without the archive, only slower.
+        _trace(f"Cannot use import archive: {err}")
+
+
+def enableimportindex():
+    """Install the import index named by PYTHONIMPORTINDEX, if any."""
+    if sys.flags.ignore_environment:
+        return
+    filename = os.environ.get('PYTHONIMPORTINDEX')
+    if not filename:
+        return
+    _trace(f"Using import index: {filename!r}")
+    try:
+        from importlib import pathindex
+        pathindex.install(filename)
+    except (OSError, ValueError) as err:
+        # Imports still work without the index, only slower.
+        _trace(f"Cannot use import index: {err}")
+
+
+def enablelazyimports():
+    """Enable the lazy import mode requested by -X lazy_imports or
+    PYTHONLAZYIMPORTS, if any."""
+    value = sys._xoptions.get('lazy_imports')
+    if value is None and not sys.flags.ignore_environment:
+        value = os.environ.get('PYTHONLAZYIMPORTS')
+    if not value:
+        return
+    if value is True or value == 'all':
+        packages = None
+    else:
+        packages = [name.strip() for name in value.split(',') if name.strip()]
+    _trace(f"Enabling lazy imports: {value!r}")
+    import importlib.util
+    importlib.util.enable_lazy_imports(packages)
+    if sys._xoptions.get('importtime'):
+        import atexit
+        atexit.register(_report_untouched_modules)
+
+
+def _report_untouched_modules():
+    import importlib.util
+    names = importlib.util.untouched_modules()
+    sys.stderr.write(f"lazy imports: {len(names)} modules never used\n")
+    for name in names:
+        sys.stderr.write(f"lazy imports: {name}\n")
+
+
 def main():
     """Add standard site-specific directories to the module search path.
 
@@ -588,6 +648,7 @@ def main():
     """
     global ENABLE_USER_SITE
 
+    enableimportarchive()
     orig_path = sys.path[:]
     known_paths = removeduppaths()
     if orig_path != sys.path:
@@ -600,6 +661,7 @@ def main():
         ENABLE_USER_SITE = check_enableusersite()
     known_paths = addusersitepackages(known_paths)
     known_paths = addsitepackages(known_paths)
+    enableimportindex()
     setquit()
     setcopyright()
     sethelper()
@@ -608,6 +670,8 @@ def main():
     execsitecustomize()
     if ENABLE_USER_SITE:
         execusercustomize()
+    # After the customization hooks, which must run when imported.
+    enablelazyimports()
 
 # Prevent extending of sys.path when python was started with -S and
 # site is imported later.
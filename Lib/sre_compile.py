@@ -765,6 +765,11 @@ def compile(p, flags=0):
     else:
         pattern = None
 
+    return _sre.compile(*_compile_args(pattern, p, flags))
+
+def _compile_args(pattern, p, flags):
+    # internal: return the arguments of _sre.compile() for a parsed pattern
+
     code = _code(p, flags)
 
     if flags & SRE_FLAG_DEBUG:
@@ -777,8 +782,6 @@ def compile(p, flags=0):
     for k, i in groupindex.items():
         indexgroup[i] = k
 
-    return _sre.compile(
-        pattern, flags | p.state.flags, code,
-        p.state.groups-1,
-        groupindex, tuple(indexgroup)
-        )
+    return (pattern, flags | p.state.flags, code,
+            p.state.groups-1,
+            groupindex, tuple(indexgroup))
@@ -208,6 +208,7 @@ def _makecodes(names):
 SRE_FLAG_VERBOSE = 64 # ignore whitespace and comments
 SRE_FLAG_DEBUG = 128 # debugging
 SRE_FLAG_ASCII = 256 # use ascii "locale"
+SRE_FLAG_LINEAR = 512 # match in linear time (no backtracking)
 
 # flags for INFO primitive
 SRE_INFO_PREFIX = 1 # has prefix
@@ -251,6 +252,7 @@ def dump(f, d, prefix):
         f.write("#define SRE_FLAG_VERBOSE %d\n" % SRE_FLAG_VERBOSE)
         f.write("#define SRE_FLAG_DEBUG %d\n" % SRE_FLAG_DEBUG)
         f.write("#define SRE_FLAG_ASCII %d\n" % SRE_FLAG_ASCII)
+        f.write("#define SRE_FLAG_LINEAR %d\n" % SRE_FLAG_LINEAR)
 
         f.write("#define SRE_INFO_PREFIX %d\n" % SRE_INFO_PREFIX)
         f.write("#define SRE_INFO_LITERAL %d\n" % SRE_INFO_LITERAL)
@@ -0,0 +1,711 @@
+#
+# Secret Labs' Regular Expression Engine
+#
+# linear-time matching of regular expressions
+#
+# See the sre.py file for information on usage and redistribution.
+#
+
+"""Internal support module for sre: linear-time matching
+
+Patterns compiled with the LINEAR flag are parsed by sre_parse as usual,
+then compiled into a nondeterministic automaton, which is simulated
+without backtracking: every thread of the automaton advances over the
+string in lockstep.  The threads are kept in priority order, so the
+matches found are the same as those of the backtracking engine, but
+matching takes a time proportional to the length of the string times the
+size of the pattern, whatever the pattern and the string.
+
+The steps of the simulation only depend on the threads alive, the
+current character and its neighbours: they are cached, so the automaton
+turns into a deterministic one lazily as the strings are scanned.
+
+Backreferences, conditional groups and lookaround assertions cannot be
+matched this way and are rejected.
+"""
+
+import sys
+import sre_compile
+import sre_parse
+from sre_constants import *
+
+# The maximal size of a program, once the repeats are expanded.
+_MAXPROGRAM = 10000
+# The maximal number of cached steps of a pattern.
+_MAXCACHE = 10000
+
+# instructions
+_CHAR = 0       # (test), consume a character which passes the test
+_SPLIT = 1      # (first, second), try first, then second
+_JUMP = 2       # (target)
+_SAVE = 3       # (slot), record the current position
+_ASSERT = 4     # (test), check the characters around the position
+_MATCH = 5
+_MARK = 6       # (exit), start an iteration of the repeat ending at exit
+_LOOP = 7       # (body, exit), greedy split of a repeat
+_LAZYLOOP = 8   # (body, exit), lazy split of a repeat
+_EXIT = 9       # end of a repeat
+
+# modes
+_MATCHMODE = 0
+_FULLMATCHMODE = 1
+_SEARCHMODE = 2
+
+_FLAGNAMES = [
+    (SRE_FLAG_TEMPLATE, "re.TEMPLATE"),
+    (SRE_FLAG_IGNORECASE, "re.IGNORECASE"),
+    (SRE_FLAG_LOCALE, "re.LOCALE"),
+    (SRE_FLAG_MULTILINE, "re.MULTILINE"),
+    (SRE_FLAG_DOTALL, "re.DOTALL"),
+    (SRE_FLAG_UNICODE, "re.UNICODE"),
+    (SRE_FLAG_VERBOSE, "re.VERBOSE"),
+    (SRE_FLAG_DEBUG, "re.DEBUG"),
+    (SRE_FLAG_ASCII, "re.ASCII"),
+    (SRE_FLAG_LINEAR, "re.LINEAR"),
+]
+
+class _Compiler:
+    # convert a parsed pattern to a program
+
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.program = []
+        self.tests = []
+        self.testindex = {}
+        self.asserts = []
+        self.state = sre_parse.State()
+
+    def emit(self, op, a=None, b=None):
+        if len(self.program) >= _MAXPROGRAM:
+            raise error("pattern too large for linear matching",
+                        self.pattern)
+        self.program.append([op, a, b])
+        return len(self.program) - 1
+
+    def test(self, op, av, flags):
+        # return the index of a test matching one character like the
+        # code (op, av) does, using a one character sre pattern
+        flags &= ~(SRE_FLAG_LINEAR | SRE_FLAG_DEBUG)
+        key = op, repr(av), flags
+        try:
+            return self.testindex[key]
+        except KeyError:
+            pass
+        p = sre_parse.SubPattern(self.state, [(op, av)])
+        self.tests.append(sre_compile.compile(p, flags).match)
+        index = self.testindex[key] = len(self.tests) - 1
+        return index
+
+    def assertion(self, code, flags):
+        # return the index of a test of the characters around a
+        # position, given as (previous, next, next is the last one)
+        if code in (AT_BEGINNING, AT_BEGINNING_STRING):
+            if code is AT_BEGINNING and flags & SRE_FLAG_MULTILINE:
+                test = _at_beginning_line
+            else:
+                test = _at_beginning
+        elif code is AT_END:
+            if flags & SRE_FLAG_MULTILINE:
+                test = _at_end_line
+            else:
+                test = _at_end
+        elif code is AT_END_STRING:
+            test = _at_end_string
+        elif code in (AT_BOUNDARY, AT_NON_BOUNDARY):
+            word = self.tests[self.test(IN, [(CATEGORY, CATEGORY_WORD)],
+                                        flags)]
+            if code is AT_BOUNDARY:
+                def test(prev, next, last):
+                    if not prev and not next:
+                        return False
+                    return bool(prev and word(prev)) != \
+                           bool(next and word(next))
+            else:
+                def test(prev, next, last):
+                    if not prev and not next:
+                        return False
+                    return bool(prev and word(prev)) == \
+                           bool(next and word(next))
+        else:
+            raise error("unsupported position %r" % (code,), self.pattern)
+        self.asserts.append(test)
+        return len(self.asserts) - 1
+
+    def compile(self, data, flags):
+        emit = self.emit
+        program = self.program
+        for op, av in data:
+            if op in (LITERAL, NOT_LITERAL, ANY, IN):
+                emit(_CHAR, self.test(op, av, flags))
+            elif op is AT:
+                emit(_ASSERT, self.assertion(av, flags))
+            elif op is SUBPATTERN:
+                group, add_flags, del_flags, p = av
+                flags1 = sre_compile._combine_flags(flags, add_flags,
+                                                    del_flags)
+                if group:
+                    emit(_SAVE, 2 * group)
+                    self.compile(p.data, flags1)
+                    emit(_SAVE, 2 * group + 1)
+                else:
+                    self.compile(p.data, flags1)
+            elif op is BRANCH:
+                jumps = []
+                for p in av[1][:-1]:
+                    split = emit(_SPLIT, len(program) + 1)
+                    self.compile(p.data, flags)
+                    jumps.append(emit(_JUMP))
+                    program[split][2] = len(program)
+                self.compile(av[1][-1].data, flags)
+                for jump in jumps:
+                    program[jump][1] = len(program)
+            elif op in (MAX_REPEAT, MIN_REPEAT):
+                lo, hi, p = av
+                # like sre, stop repeating after an optional iteration
+                # which matched an empty string: the optional iterations
+                # of repeats which can do that are marked
+                nullable = p.getwidth()[0] == 0
+                marks = []
+                splits = []
+                def iteration():
+                    if nullable:
+                        marks.append(emit(_MARK))
+                    self.compile(p.data, flags)
+                for i in range(lo):
+                    self.compile(p.data, flags)
+                if hi == MAXREPEAT:
+                    splits.append(emit(_SPLIT))
+                    iteration()
+                    emit(_JUMP, splits[0])
+                else:
+                    for i in range(hi - lo):
+                        splits.append(emit(_SPLIT))
+                        iteration()
+                end = len(program)
+                if nullable:
+                    emit(_EXIT)
+                for mark in marks:
+                    program[mark][1] = end
+                for split in splits:
+                    if nullable:
+                        program[split][0] = (_LOOP if op is MAX_REPEAT
+                                             else _LAZYLOOP)
+                        program[split][1:] = split + 1, end
+                    elif op is MAX_REPEAT:
+                        program[split][1:] = split + 1, end
+                    else:
+                        program[split][1:] = end, split + 1
+            elif op is GROUPREF:
+                raise error("backreferences are not supported "
+                            "by linear matching", self.pattern)
+            elif op is GROUPREF_EXISTS:
+                raise error("conditional groups are not supported "
+                            "by linear matching", self.pattern)
+            elif op in (ASSERT, ASSERT_NOT):
+                raise error("lookahead and lookbehind assertions are not "
+                            "supported by linear matching", self.pattern)
+            else:
+                raise error("internal: unsupported operand type %r" % (op,))
+
+def _at_beginning(prev, next, last):
+    return not prev
+
+def _at_beginning_line(prev, next, last):
+    return not prev or prev in ("\n", b"\n")
+
+def _at_end(prev, next, last):
+    return not next or (last and next in ("\n", b"\n"))
+
+def _at_end_line(prev, next, last):
+    return not next or next in ("\n", b"\n")
+
+def _at_end_string(prev, next, last):
+    return not next
+
+def compile(p, flags=0):
+    """Compile a pattern for linear matching."""
+    pattern = p
+    p = sre_parse.parse(pattern, flags)
+    flags |= p.state.flags
+    compiler = _Compiler(pattern)
+    compiler.emit(_SAVE, 0)
+    compiler.compile(p.data, flags)
+    compiler.emit(_MATCH)
+    if flags & SRE_FLAG_IGNORECASE and flags & SRE_FLAG_LOCALE:
+        prefix = []
+    else:
+        prefix = sre_compile._get_literal_prefix(p, flags)[0]
+    if isinstance(pattern, str):
+        prefix = "".join(map(chr, prefix))
+    else:
+        prefix = bytes(prefix)
+    return Pattern(pattern, flags, p.state.groups - 1, p.state.groupdict,
+                   compiler, prefix)
+
+class Pattern:
+    """Compiled regular expression object, matched in linear time."""
+
+    def __init__(self, pattern, flags, groups, groupindex, compiler, prefix):
+        self.pattern = pattern
+        self.flags = flags
+        self.groups = groups
+        self.groupindex = groupindex
+        self._program = [tuple(instruction)
+                         for instruction in compiler.program]
+        self._tests = compiler.tests
+        self._asserts = compiler.asserts
+        self._prefix = prefix
+        # the slots of a thread: the start of the match in slot 0, the
+        # bounds of group g in slots 2*g and 2*g+1, then lastindex
+        self._nocaps = (None,) * (2 * groups + 3)
+        # the states of the simulation, by (mode, program counters,
+        # whether a match may still start)
+        self._states = {}
+        self._size = 0
+
+    def __repr__(self):
+        flags = self.flags
+        if isinstance(self.pattern, str):
+            flags &= ~SRE_FLAG_UNICODE
+        names = []
+        for flag, name in _FLAGNAMES:
+            if flags & flag:
+                names.append(name)
+                flags &= ~flag
+        if flags:
+            names.append(hex(flags))
+        if names:
+            return "re.compile(%r, %s)" % (self.pattern, "|".join(names))
+        return "re.compile(%r)" % (self.pattern,)
+
+    def __eq__(self, other):
+        if not isinstance(other, Pattern):
+            return NotImplemented
+        return (type(self.pattern) is type(other.pattern) and
+                self.pattern == other.pattern and self.flags == other.flags)
+
+    def __hash__(self):
+        return hash((self.pattern, self.flags))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def _string(self, string):
+        # return the string to scan
+        if isinstance(self.pattern, str):
+            if not isinstance(string, str):
+                if isinstance(string, (bytes, bytearray, memoryview)):
+                    raise TypeError("cannot use a string pattern on a "
+                                    "bytes-like object")
+                raise TypeError("expected string or bytes-like object")
+            return string
+        if isinstance(string, str):
+            raise TypeError("cannot use a bytes pattern on a string-like "
+                            "object")
+        if not isinstance(string, bytes):
+            try:
+                string = bytes(memoryview(string))
+            except TypeError:
+                raise TypeError("expected string or bytes-like object")
+        return string
+
+    def _state(self, mode, pcs, inject):
+        key = mode, pcs, inject
+        try:
+            return self._states[key]
+        except KeyError:
+            state = self._states[key] = _State(mode, pcs, inject)
+            return state
+
+    def _step(self, state, key, prev, next, last, advance):
+        # compute a step of the simulation from state, and add it to its
+        # steps under key
+        if self._size >= _MAXCACHE:
+            # the states in use stay valid
+            self._states.clear()
+            self._size = 0
+        self._size += 1
+        pcs = state.pcs
+        newpcs, moves, match = self._follow(state.mode, pcs, state.inject,
+                                            prev, next, last, advance)
+        # after a match, only the threads of higher priority go on
+        newstate = self._state(state.mode, newpcs,
+                               state.inject and match is None)
+        same = moves == tuple((source, ()) for source in range(len(pcs)))
+        entry = state.steps[key] = newstate, moves, match, same
+        return entry
+
+    def _follow(self, mode, pcs, inject, prev, next, last, advance):
+        # follow the threads at the program counters pcs, and a new thread
+        # if inject is true, up to the instructions consuming the next
+        # character, and run them.  Return the program counters of the
+        # threads which go on, the source thread (-1 for the new one) and
+        # saved slots of each, and the source thread and saved slots of
+        # the match found.
+        # While following a thread, the repeats whose current iteration
+        # has not consumed any character yet are kept in empty.
+        program = self._program
+        tests = self._tests
+        asserts = self._asserts
+        newpcs = []
+        moves = []
+        seen = set()
+        sources = list(enumerate(pcs))
+        if inject:
+            sources.append((-1, 0))
+        noempty = frozenset()
+        for source, pc in sources:
+            stack = [(pc, (), noempty)]
+            while stack:
+                pc, saves, empty = stack.pop()
+                op, a, b = program[pc]
+                key = pc if op == _CHAR or op == _MATCH else (pc, empty)
+                if key in seen:
+                    continue
+                seen.add(key)
+                if op == _CHAR:
+                    if next and tests[a](next) is not None:
+                        newpcs.append(pc + 1)
+                        moves.append((source, saves))
+                elif op == _SPLIT:
+                    stack.append((b, saves, empty))
+                    stack.append((a, saves, empty))
+                elif op == _JUMP:
+                    stack.append((a, saves, empty))
+                elif op == _SAVE:
+                    stack.append((pc + 1, saves + (a,), empty))
+                elif op == _ASSERT:
+                    if asserts[a](prev, next, last):
+                        stack.append((pc + 1, saves, empty))
+                elif op == _MARK:
+                    stack.append((pc + 1, saves, empty | {a}))
+                elif op == _LOOP or op == _LAZYLOOP:
+                    if b in empty:
+                        # the last iteration matched an empty string
+                        stack.append((b, saves, empty))
+                    elif op == _LOOP:
+                        stack.append((b, saves, empty))
+                        stack.append((a, saves, empty))
+                    else:
+                        stack.append((a, saves, empty))
+                        stack.append((b, saves, empty))
+                elif op == _EXIT:
+                    stack.append((pc + 1, saves, empty - {pc}))
+                elif op == _MATCH:
+                    if (mode == _FULLMATCHMODE and next) or advance:
+                        # not at the end, or an empty match where the
+                        # last one ended
+                        continue
+                    # the threads of lower priority are dropped
+                    return tuple(newpcs), tuple(moves), (source, saves)
+        return tuple(newpcs), tuple(moves), None
+
+    def _match(self, string, pos, endpos, mode, advance=False):
+        # return the end and the slots of the first match, or None
+        if endpos < pos:
+            return None
+        asserts = bool(self._asserts)
+        prefix = self._prefix
+        nocaps = self._nocaps
+        # the threads are given by their program counters and slots
+        if mode == _SEARCHMODE:
+            state = self._state(mode, (), True)
+            caps = []
+        else:
+            state = self._state(mode, (0,), False)
+            caps = [nocaps]
+        pcs = state.pcs
+        inject = state.inject
+        found = None
+        i = pos
+        prev = string[i - 1:i]
+        while True:
+            if not pcs and inject and prefix:
+                # skip to the next possible start
+                j = string.find(prefix, i, endpos)
+                if j < 0:
+                    break
+                if j != i:
+                    i = j
+                    prev = string[i - 1:i]
+            next = string[i:i + 1] if i < endpos else string[:0]
+            # the step only depends on the characters around the
+            # position if the pattern has assertions
+            if asserts:
+                key = prev, next, i + 1 == endpos, advance and i == pos
+            elif advance and i == pos:
+                key = next, True
+            else:
+                key = next
+            try:
+                state, moves, match, same = state.steps[key]
+            except KeyError:
+                state, moves, match, same = self._step(
+                    state, key, prev, next,
+                    asserts and i + 1 == endpos, advance and i == pos)
+            if match is not None:
+                source, saves = match
+                found = caps[source] if source >= 0 else nocaps
+                if saves:
+                    found = _save(found, saves, i)
+                found = i, found
+            if i >= endpos:
+                break
+            if not same:
+                newcaps = []
+                for source, saves in moves:
+                    c = caps[source] if source >= 0 else nocaps
+                    if saves:
+                        c = _save(c, saves, i)
+                    newcaps.append(c)
+                caps = newcaps
+            pcs = state.pcs
+            inject = state.inject
+            if not pcs and not inject:
+                break
+            i += 1
+            prev = next
+        return found
+
+    def _new_match(self, string, pos, endpos, found):
+        end, caps = found
+        regs = [(caps[0], end)]
+        for g in range(1, self.groups + 1):
+            start = caps[2 * g]
+            end = caps[2 * g + 1]
+            if start is None or end is None:
+                regs.append((-1, -1))
+            else:
+                regs.append((start, end))
+        return Match(self, string, pos, endpos, tuple(regs), caps[-1])
+
+    def _run(self, string, pos, endpos, mode):
+        scanned = self._string(string)
+        n = len(scanned)
+        pos = min(max(pos, 0), n)
+        endpos = min(max(endpos, 0), n)
+        found = self._match(scanned, pos, endpos, mode)
+        if found is None:
+            return None
+        return self._new_match(string, pos, endpos, found)
+
+    def match(self, string, pos=0, endpos=sys.maxsize):
+        """Matches zero or more characters at the beginning of the string."""
+        return self._run(string, pos, endpos, _MATCHMODE)
+
+    def fullmatch(self, string, pos=0, endpos=sys.maxsize):
+        """Matches against all of the string."""
+        return self._run(string, pos, endpos, _FULLMATCHMODE)
+
+    def search(self, string, pos=0, endpos=sys.maxsize):
+        """Scan through string looking for a match, and return a
+        corresponding match object instance.
+
+        Return None if no position in the string matches."""
+        return self._run(string, pos, endpos, _SEARCHMODE)
+
+    def finditer(self, string, pos=0, endpos=sys.maxsize):
+        """Return an iterator over all non-overlapping matches for the
+        pattern in string.  For each match, the iterator returns a match
+        object."""
+        scanned = self._string(string)
+        n = len(scanned)
+        pos = min(max(pos, 0), n)
+        endpos = min(max(endpos, 0), n)
+        advance = False
+        start = pos
+        while True:
+            found = self._match(scanned, start, endpos, _SEARCHMODE, advance)
+            if found is None:
+                return
+            yield self._new_match(string, pos, endpos, found)
+            # an empty match cannot be followed by an empty match at the
+            # same position
+            start = found[0]
+            advance = start == found[1][0]
+
+    def findall(self, string, pos=0, endpos=sys.maxsize):
+        """Return a list of all non-overlapping matches of pattern in
+        string."""
+        result = []
+        for m in self.finditer(string, pos, endpos):
+            if self.groups == 0:
+                result.append(m.group())
+            elif self.groups == 1:
+                result.append(m.group(1) or m.string[:0])
+            else:
+                result.append(m.groups(m.string[:0]))
+        return result
+
+    def split(self, string, maxsplit=0):
+        """Split string by the occurrences of pattern."""
+        result = []
+        last = 0
+        for n, m in enumerate(self.finditer(string)):
+            if maxsplit and n >= maxsplit:
+                break
+            result.append(string[last:m.start()])
+            result.extend(m.groups())
+            last = m.end()
+        result.append(string[last:])
+        return result
+
+    def subn(self, repl, string, count=0):
+        """Return the tuple (new_string, number_of_subs_made) found by
+        replacing the leftmost non-overlapping occurrences of pattern with
+        the replacement repl."""
+        if callable(repl):
+            filter = repl
+        else:
+            template = sre_parse.parse_template(repl, self)
+            if not template[0] and len(template[1]) == 1:
+                literal = template[1][0]
+                filter = lambda match: literal
+            else:
+                filter = lambda match: sre_parse.expand_template(template,
+                                                                 match)
+        pieces = []
+        last = 0
+        n = 0
+        for m in self.finditer(string):
+            if count and n >= count:
+                break
+            start, end = m.span()
+            pieces.append(string[last:start])
+            item = filter(m)
+            if item is not None:
+                pieces.append(item)
+            last = end
+            n += 1
+        pieces.append(string[last:])
+        return self._string(string)[:0].join(pieces), n
+
+    def sub(self, repl, string, count=0):
+        """Return the string obtained by replacing the leftmost
+        non-overlapping occurrences of pattern in string by the
+        replacement repl."""
+        return self.subn(repl, string, count)[0]
+
+class _State:
+    # a state of the simulation, and the steps computed from it
+    __slots__ = 'mode', 'pcs', 'inject', 'steps'
+
+    def __init__(self, mode, pcs, inject):
+        self.mode = mode
+        self.pcs = pcs
+        self.inject = inject
+        self.steps = {}
+
+def _save(caps, saves, i):
+    # record the position i in the slots saves, and the last group closed
+    caps = list(caps)
+    for slot in saves:
+        caps[slot] = i
+        if slot & 1:
+            caps[-1] = slot // 2
+    return tuple(caps)
+
+class Match:
+    """The result of re.match() and re.search() for patterns compiled
+    with the LINEAR flag."""
+
+    def __init__(self, re, string, pos, endpos, regs, lastindex):
+        self.re = re
+        self.string = string
+        self.pos = pos
+        self.endpos = endpos
+        self.regs = regs
+        self.lastindex = lastindex
+
+    @property
+    def lastgroup(self):
+        if self.lastindex is None:
+            return None
+        for name, index in self.re.groupindex.items():
+            if index == self.lastindex:
+                return name
+        return None
+
+    def _index(self, group):
+        if isinstance(group, int) or hasattr(type(group), '__index__'):
+            try:
+                index = group.__index__()
+            except (AttributeError, TypeError):
+                index = -1
+            if 0 <= index < len(self.regs):
+                return index
+        else:
+            try:
+                return self.re.groupindex[group]
+            except (KeyError, TypeError):
+                pass
+        raise IndexError("no such group")
+
+    def _group(self, group, default=None):
+        start, end = self.regs[self._index(group)]
+        if start < 0:
+            return default
+        return self.string[start:end]
+
+    def group(self, *groups):
+        """Return subgroup(s) of the match by indices or names.
+        For 0 returns the entire match."""
+        if not groups:
+            return self._group(0)
+        if len(groups) == 1:
+            return self._group(groups[0])
+        return tuple(self._group(group) for group in groups)
+
+    def __getitem__(self, group):
+        return self._group(group)
+
+    def groups(self, default=None):
+        """Return a tuple containing all the subgroups of the match, from
+        1."""
+        return tuple(self._group(g, default)
+                     for g in range(1, len(self.regs)))
+
+    def groupdict(self, default=None):
+        """Return a dictionary containing all the named subgroups of the
+        match, keyed by the subgroup name."""
+        return {name: self._group(name, default)
+                for name in self.re.groupindex}
+
+    def start(self, group=0):
+        """Return index of the start of the substring matched by group."""
+        return self.regs[self._index(group)][0]
+
+    def end(self, group=0):
+        """Return index of the end of the substring matched by group."""
+        return self.regs[self._index(group)][1]
+
+    def span(self, group=0):
+        """For match object m, return the 2-tuple (m.start(group),
+        m.end(group))."""
+        return self.regs[self._index(group)]
+
+    def expand(self, template):
+        """Return the string obtained by doing backslash substitution on
+        the string template, as done by the sub() method."""
+        template = sre_parse.parse_template(template, self.re)
+        return sre_parse.expand_template(template, self)
+
+    def __repr__(self):
+        return "<sre_linear.Match object; span=%r, match=%r>" % (
+            self.span(), self.group())
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+# register the pattern type with copyreg; re does not import this module
+# until a LINEAR pattern is compiled
+import copyreg
+import re
+copyreg.pickle(Pattern, re._pickle, re._compile)
@@ -2460,6 +2460,46 @@ def test_imap(self):
             self.assertEqual(next(it), i*i)
         self.assertRaises(StopIteration, it.__next__)
 
+    def test_imap_auto_chunksize(self):
+        it = self.pool.imap(sqr, list(range(1000)), chunksize="auto")
+        for i in range(1000):
+            self.assertEqual(next(it), i*i)
+        self.assertRaises(StopIteration, it.__next__)
+
+        it = self.pool.imap(sqr, [], chunksize="auto")
+        self.assertRaises(StopIteration, it.__next__)
+
+        it = self.pool.imap_unordered(sqr, iter(range(1000)), chunksize="auto")
+        self.assertEqual(sorted(it), list(map(sqr, list(range(1000)))))
+
+        if self.TYPE != 'manager':
+            it = self.pool.imap(sqr, exception_throwing_generator(20, 7),
+                                chunksize="auto")
+            with self.assertRaises(SayWhenError):
+                for i in range(20):
+                    self.assertEqual(next(it), i*i)
+            self.assertEqual(i, 7)
+
+    def test_imap_auto_chunksize_interleaved(self):
+        if self.TYPE == 'manager':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        # An auto-chunked imap waiting for its input must not hold up the
+        # tasks of other calls.
+        event = threading.Event()
+        def gen():
+            yield 1
+            event.wait(support.LONG_TIMEOUT)
+            yield 2
+        it = self.pool.imap(sqr, gen(), chunksize="auto")
+        res = self.pool.apply_async(sqr, (3,))
+        try:
+            self.assertEqual(res.get(timeout=support.SHORT_TIMEOUT), 9)
+            self.assertEqual(self.pool.map(sqr, [4, 5]), [16, 25])
+        finally:
+            event.set()
+        self.assertEqual(list(it), [1, 4])
+
     def test_imap_handle_iterable_exception(self):
         if self.TYPE == 'manager':
             self.skipTest('test not appropriate for {}'.format(self.TYPE))
@@ -2804,6 +2844,70 @@ def test():
         rc, out, err = test.support.script_helper.assert_python_ok('-c', cmd)
         self.assertEqual(rc, 0)
 
+#
+# Test of WarmPoolRegistry
+#
+
+_warm_status = 'cold'
+
+def _warm_init(status):
+    global _warm_status
+    _warm_status = status
+
+def _get_warm_status(arg=None):
+    return _warm_status, os.getpid(), 'colorsys' in sys.modules
+
+class _TestWarmPoolRegistry(BaseTestCase):
+
+    ALLOWED_TYPES = ('processes', )
+
+    def test_lease(self):
+        registry = multiprocessing.pool.WarmPoolRegistry()
+        self.addCleanup(registry.close)
+        registry.register('x', 1, _warm_init, ('warm',), preload=['colorsys'])
+        with self.assertRaises(ValueError):
+            registry.register('x', 1)
+        with self.assertRaisesRegex(KeyError, 'no pool registered'):
+            registry.acquire('y')
+        with self.assertRaisesRegex(KeyError, 'no pool registered'):
+            registry.warm('y')
+
+        # Pools are started without holding the registry lock
+        create = registry._create
+        def check_create(spec):
+            self.assertFalse(registry._lock.locked())
+            return create(spec)
+        registry._create = check_create
+        registry.warm('x')
+        idle, = registry._idle['x']
+        with registry.lease('x') as pool:
+            self.assertIs(pool, idle)
+            self.assertEqual(registry._idle['x'], [])
+            status, pid, preloaded = pool.apply(_get_warm_status)
+        self.assertEqual(status, 'warm')
+        self.assertTrue(preloaded)
+
+        # The same workers serve the next lease
+        with registry.lease('x') as pool2:
+            self.assertIs(pool2, pool)
+            self.assertEqual(pool2.apply(_get_warm_status)[1], pid)
+
+            # A concurrent lease gets its own pool
+            with registry.lease('x') as pool3:
+                self.assertIsNot(pool3, pool2)
+        # Only max_idle pools are kept
+        self.assertEqual(registry._idle['x'], [pool3])
+
+        # Closed pools are not reused
+        with registry.lease('x') as pool4:
+            pool4.close()
+        self.assertEqual(registry._idle['x'], [])
+        pool4.join()
+
+        registry.unregister('x')
+        with self.assertRaises(KeyError):
+            registry.acquire('x')
+
 #
 # Test of creating a customized manager class
 #
@@ -5264,6 +5368,45 @@ def test_resource_tracker_reused(self):
         self.assertTrue(is_resource_tracker_reused)
 
 
+class TestAdaptiveChunker(unittest.TestCase):
+
+    def test_chunks(self):
+        chunker = util._AdaptiveChunker(4, target=1.0)
+        sizes = []
+        items = []
+        for chunk in chunker.chunks(range(1000)):
+            sizes.append(len(chunk))
+            items.extend(chunk)
+            # each item costs a millisecond: aim at 1000 items per chunk
+            chunker.record(len(chunk), len(chunk) * 0.001)
+        self.assertEqual(items, list(range(1000)))
+        # chunks grow at most twofold from one chunk to the next
+        self.assertEqual(sizes[:5], [1, 2, 4, 8, 16])
+        # the tail is split between the workers
+        self.assertEqual(sizes[-1], 1)
+        self.assertLessEqual(max(sizes), 1000 // 4)
+
+    def test_shrink(self):
+        chunker = util._AdaptiveChunker(1, target=1.0)
+        chunks = chunker.chunks(range(1000))
+        for i in range(5):
+            chunker.record(len(next(chunks)), 0.0)
+        self.assertEqual(len(next(chunks)), 32)
+        # items suddenly get expensive
+        chunker.record(32, 32.0)
+        self.assertEqual(len(next(chunks)), 2)
+
+    def test_wait(self):
+        chunker = util._AdaptiveChunker(2)
+        chunks = chunker.chunks(range(10))
+        next(chunks)
+        next(chunks)
+        self.assertTrue(chunker.wait(3, 0))
+        self.assertFalse(chunker.wait(2, 0))
+        chunker.record(1)
+        self.assertTrue(chunker.wait(2, 0))
+
+
 class TestSimpleQueue(unittest.TestCase):
 
     @classmethod
@@ -2475,6 +2475,12 @@ def test_not_implemented(self):
             NotImplementedError, loop.default_exception_handler, f)
         self.assertRaises(
             NotImplementedError, loop.call_exception_handler, f)
+        self.assertRaises(
+            NotImplementedError, loop.set_task_instrumentation, True)
+        self.assertRaises(
+            NotImplementedError, loop.get_task_instrumentation)
+        self.assertRaises(
+            NotImplementedError, loop.get_task_stats, f)
         self.assertRaises(
             NotImplementedError, loop.get_debug)
         self.assertRaises(
@@ -1,5 +1,6 @@
 """Tests for queues.py"""
 
+import threading
 import unittest
 from unittest import mock
 
@@ -573,6 +574,271 @@ def gen():
             loop.run_until_complete(put_task)
 
 
+class QueueBatchTests(_QueueTestBase):
+
+    def test_put_many_nowait(self):
+        q = asyncio.Queue()
+        q.put_many_nowait(iter([1, 2, 3]))
+        self.assertEqual(3, q.qsize())
+        self.assertEqual(3, q._unfinished_tasks)
+        self.assertEqual([1, 2, 3], q.get_many_nowait(10))
+        q.put_many_nowait([])
+        self.assertTrue(q.empty())
+
+    def test_put_many_nowait_full(self):
+        q = asyncio.Queue(maxsize=2)
+        q.put_nowait(1)
+        self.assertRaises(asyncio.QueueFull, q.put_many_nowait, [2, 3])
+        self.assertEqual(1, q.qsize())
+        q.put_many_nowait([2])
+        self.assertTrue(q.full())
+
+    def test_get_many_nowait(self):
+        q = asyncio.Queue()
+        self.assertRaises(asyncio.QueueEmpty, q.get_many_nowait, 2)
+        self.assertRaises(ValueError, q.get_many_nowait, 0)
+        q.put_many_nowait(range(5))
+        self.assertEqual([0, 1], q.get_many_nowait(2))
+        self.assertEqual([2, 3, 4], q.get_many_nowait(5))
+
+    def test_get_many_priority(self):
+        q = asyncio.PriorityQueue()
+        q.put_many_nowait([3, 1, 2])
+        self.assertEqual([1, 2, 3], q.get_many_nowait(3))
+
+    def test_put_many_wakes_getters(self):
+        q = asyncio.Queue()
+
+        async def getter():
+            return await q.get()
+
+        async def test():
+            tasks = [self.loop.create_task(getter()) for _ in range(3)]
+            await asyncio.sleep(0)
+            self.assertEqual(3, len(q._getters))
+            await q.put_many([1, 2])
+            await asyncio.sleep(0)
+            self.assertEqual({1, 2}, {t.result() for t in tasks if t.done()})
+            self.assertEqual(1, len(q._getters))
+            q.put_nowait(3)
+            return await asyncio.gather(*tasks)
+
+        res = self.loop.run_until_complete(test())
+        self.assertEqual([1, 2, 3], sorted(res))
+
+    def test_put_many_blocks_when_full(self):
+        q = asyncio.Queue(maxsize=2)
+
+        async def test():
+            putter = self.loop.create_task(q.put_many(range(5)))
+            await asyncio.sleep(0)
+            self.assertFalse(putter.done())
+            self.assertEqual(2, q.qsize())
+            self.assertEqual([0, 1], await q.get_many(10))
+            await asyncio.sleep(0)
+            self.assertEqual([2, 3], await q.get_many(10))
+            await asyncio.sleep(0)
+            self.assertTrue(putter.done())
+            self.assertEqual([4], await q.get_many(10))
+
+        self.loop.run_until_complete(test())
+        self.assertEqual(5, q._unfinished_tasks)
+
+    def test_put_many_cancelled(self):
+        q = asyncio.Queue(maxsize=1)
+
+        async def test():
+            putter = self.loop.create_task(q.put_many([1, 2]))
+            await asyncio.sleep(0)
+            putter.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await putter
+            self.assertEqual(1, q.qsize())
+            self.assertEqual(1, q._unfinished_tasks)
+            self.assertFalse(q._putters)
+
+        self.loop.run_until_complete(test())
+
+    def test_get_many_waits(self):
+        q = asyncio.Queue()
+
+        async def test():
+            getter = self.loop.create_task(q.get_many(3))
+            await asyncio.sleep(0)
+            self.assertFalse(getter.done())
+            q.put_many_nowait([1, 2, 3, 4])
+            self.assertEqual([1, 2, 3], await getter)
+            self.assertEqual([4], await q.get_many(3))
+
+        self.loop.run_until_complete(test())
+
+    def test_get_many_timeout(self):
+
+        def gen():
+            when = yield
+            self.assertAlmostEqual(0.5, when)
+            yield 0.5
+
+        loop = self.new_test_loop(gen)
+        q = asyncio.Queue()
+
+        async def test():
+            self.assertEqual([], await q.get_many(3, timeout=0))
+            self.assertEqual([], await q.get_many(3, timeout=0.5))
+            self.assertFalse(q._getters)
+
+        loop.run_until_complete(test())
+        self.assertAlmostEqual(0.5, loop.time())
+
+    def test_get_many_cancelled(self):
+        q = asyncio.Queue()
+
+        async def test():
+            getter = self.loop.create_task(q.get_many(3))
+            await asyncio.sleep(0)
+            getter.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await getter
+            self.assertFalse(q._getters)
+
+        self.loop.run_until_complete(test())
+
+
+class ThreadSafeQueueTests(test_utils.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+        self.set_event_loop(self.loop)
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.loop.shutdown_default_executor())
+        self.loop.close()
+        super().tearDown()
+
+    def run_in_thread(self, func, *args):
+        thread = threading.Thread(target=func, args=args)
+        thread.start()
+        self.addCleanup(thread.join)
+        return thread
+
+    def test_nowait(self):
+        q = asyncio.ThreadSafeQueue(maxsize=1)
+        self.assertTrue(q.empty())
+        q.put_nowait(1)
+        self.assertTrue(q.full())
+        self.assertEqual(1, q.qsize())
+        self.assertRaises(asyncio.QueueFull, q.put_nowait, 2)
+        self.assertEqual(1, q.get_nowait())
+        self.assertRaises(asyncio.QueueEmpty, q.get_nowait)
+
+    def test_sync_timeout(self):
+        q = asyncio.ThreadSafeQueue(maxsize=1)
+        self.assertRaises(asyncio.QueueEmpty, q.get_sync, timeout=0.01)
+        q.put_sync(1)
+        self.assertRaises(asyncio.QueueFull, q.put_sync, 2, timeout=0.01)
+        self.assertRaises(ValueError, q.put_sync, 2, timeout=-1)
+        self.assertEqual(1, q.get_sync(timeout=0.01))
+
+    def test_sync_from_loop_thread(self):
+        q = asyncio.ThreadSafeQueue()
+
+        async def test():
+            await q.put(1)
+            with self.assertRaisesRegex(RuntimeError, 'await get'):
+                q.get_sync()
+            with self.assertRaisesRegex(RuntimeError, 'await put'):
+                q.put_sync(2)
+            return await q.get()
+
+        self.assertEqual(1, self.loop.run_until_complete(test()))
+
+    def test_thread_to_loop(self):
+        q = asyncio.ThreadSafeQueue(maxsize=10)
+
+        def producer():
+            for i in range(100):
+                q.put_sync(i)
+            q.put_sync(None)
+
+        async def consumer():
+            self.run_in_thread(producer)
+            result = []
+            while True:
+                items = await q.get_many(50)
+                if items[-1] is None:
+                    return result + items[:-1]
+                result.extend(items)
+
+        self.assertEqual(list(range(100)),
+                         self.loop.run_until_complete(consumer()))
+
+    def test_loop_to_thread(self):
+        q = asyncio.ThreadSafeQueue(maxsize=2)
+        result = []
+
+        def consumer():
+            while (item := q.get_sync()) is not None:
+                result.append(item)
+
+        async def producer():
+            thread = self.run_in_thread(consumer)
+            for i in range(100):
+                await q.put(i)
+            await q.put(None)
+            await self.loop.run_in_executor(None, thread.join)
+
+        self.loop.run_until_complete(producer())
+        self.assertEqual(list(range(100)), result)
+
+    def test_wakeups_coalesced(self):
+        q = asyncio.ThreadSafeQueue()
+        getter = self.loop.create_task(q.get_many(10))
+        test_utils.run_briefly(self.loop)
+        self.assertFalse(getter.done())
+
+        with mock.patch.object(self.loop, 'call_soon_threadsafe',
+                               wraps=self.loop.call_soon_threadsafe) as m:
+            thread = self.run_in_thread(
+                lambda: [q.put_nowait(i) for i in range(5)])
+            thread.join()
+            self.assertEqual(1, m.call_count)
+        self.assertEqual(list(range(5)),
+                         self.loop.run_until_complete(getter))
+
+    def test_get_cancelled(self):
+        q = asyncio.ThreadSafeQueue()
+
+        async def test():
+            getter1 = self.loop.create_task(q.get())
+            getter2 = self.loop.create_task(q.get())
+            await asyncio.sleep(0)
+            getter1.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await getter1
+            self.assertEqual(1, len(q._getters))
+            q.put_nowait(1)
+            self.assertEqual(1, await getter2)
+            self.assertFalse(q._getters)
+
+        self.loop.run_until_complete(test())
+
+    def test_put_blocks_until_thread_gets(self):
+        q = asyncio.ThreadSafeQueue(maxsize=1)
+
+        async def test():
+            await q.put(1)
+            putter = self.loop.create_task(q.put(2))
+            await asyncio.sleep(0)
+            self.assertFalse(putter.done())
+            item = await self.loop.run_in_executor(None, q.get_sync)
+            self.assertEqual(1, item)
+            await putter
+            self.assertEqual(2, q.get_nowait())
+
+        self.loop.run_until_complete(test())
+
+
 class LifoQueueTests(_QueueTestBase):
 
     def test_order(self):
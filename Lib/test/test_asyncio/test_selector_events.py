@@ -890,6 +890,118 @@ def test_transport_close_remove_writer(self, m_log):
         transport.close()
         remove_writer.assert_called_with(self.sock_fd)
 
+    def batching_transport(self, **kwargs):
+        transport = self.socket_transport()
+        transport.set_write_batching(**kwargs)
+        self.sock.sendmsg.side_effect = lambda buffers: sum(map(len, buffers))
+        return transport
+
+    def test_write_batching(self):
+        transport = self.batching_transport()
+        transport.write(b'data1')
+        transport.write(bytearray(b'data2'))
+        transport.writelines([b'data3', memoryview(b'data4')])
+        self.assertFalse(self.sock.send.called)
+        self.assertFalse(self.sock.sendmsg.called)
+        self.assertEqual(transport.get_write_buffer_size(), 20)
+
+        test_utils.run_briefly(self.loop)
+        self.sock.sendmsg.assert_called_once_with(
+            [b'data1', b'data2', b'data3', b'data4'])
+        self.assertFalse(transport._buffer)
+        self.assertEqual(transport.get_write_buffer_size(), 0)
+        self.assertFalse(self.loop.writers)
+        self.assertEqual(transport.get_write_batching_stats(),
+                         {'writes': 4, 'syscalls': 1, 'syscalls_saved': 3,
+                          'bytes_coalesced': 20})
+
+    def test_write_batching_threshold(self):
+        transport = self.batching_transport(flush_threshold=8)
+        transport.write(b'data1')
+        self.assertFalse(self.sock.sendmsg.called)
+        transport.write(b'data2')
+        self.sock.sendmsg.assert_called_once_with([b'data1', b'data2'])
+        self.assertIsNone(transport._flush_handle)
+
+    def test_write_batching_flush(self):
+        transport = self.batching_transport()
+        transport.flush()
+        transport.write(b'data')
+        transport.flush()
+        self.sock.sendmsg.assert_called_once_with([b'data'])
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(self.sock.sendmsg.call_count, 1)
+
+    def test_write_batching_delay(self):
+        transport = self.batching_transport(flush_delay=0.01)
+        transport.write(b'data')
+        handle = transport._flush_handle
+        self.assertIsInstance(handle, asyncio.TimerHandle)
+        self.assertEqual(handle.when(), self.loop.time() + 0.01)
+        self.assertFalse(self.sock.sendmsg.called)
+        handle._run()
+        self.sock.sendmsg.assert_called_once_with([b'data'])
+
+    def test_write_batching_partial(self):
+        transport = self.batching_transport()
+        transport.write(b'data1')
+        transport.write(b'data2')
+        self.sock.sendmsg.side_effect = lambda buffers: 7
+        test_utils.run_briefly(self.loop)
+        self.loop.assert_writer(7, transport._write_sendmsg)
+        self.assertEqual([bytes(b) for b in transport._buffer], [b'ta2'])
+        self.assertEqual(transport.get_write_buffer_size(), 3)
+
+        # Writes while the socket is not writable are only queued
+        transport.write(b'data3')
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(self.sock.sendmsg.call_count, 1)
+
+        self.sock.sendmsg.side_effect = BlockingIOError
+        transport._write_sendmsg()
+        self.loop.assert_writer(7, transport._write_sendmsg)
+
+        self.sock.sendmsg.side_effect = lambda buffers: sum(map(len, buffers))
+        transport._write_sendmsg()
+        self.assertFalse(self.loop.writers)
+        self.assertFalse(transport._buffer)
+        self.assertEqual(transport.get_write_batching_stats()['syscalls'], 3)
+
+    def test_write_batching_close(self):
+        transport = self.batching_transport()
+        transport.write(b'data')
+        transport.write_eof()
+        transport.close()
+        self.assertFalse(self.protocol.connection_lost.called)
+        self.assertFalse(self.sock.shutdown.called)
+        test_utils.run_briefly(self.loop)
+        self.sock.sendmsg.assert_called_once_with([b'data'])
+        self.protocol.connection_lost.assert_called_with(None)
+
+    def test_write_batching_exception(self):
+        transport = self.batching_transport()
+        transport._fatal_error = mock.Mock()
+        err = self.sock.sendmsg.side_effect = OSError()
+        transport.write(b'data')
+        test_utils.run_briefly(self.loop)
+        transport._fatal_error.assert_called_with(
+                                   err,
+                                   'Fatal write error on socket transport')
+        self.assertFalse(transport._buffer)
+        self.assertEqual(transport.get_write_buffer_size(), 0)
+
+    def test_set_write_batching(self):
+        transport = self.socket_transport()
+        with self.assertRaises(ValueError):
+            transport.set_write_batching(flush_threshold=-1)
+        with self.assertRaises(ValueError):
+            transport.set_write_batching(flush_delay=-1)
+        transport.set_write_batching()
+        self.sock.sendmsg.side_effect = BlockingIOError
+        transport.write(b'data')
+        with self.assertRaises(RuntimeError):
+            transport.set_write_batching(False)
+
 
 class SelectorSocketTransportBufferedProtocolTests(test_utils.TestCase):
 
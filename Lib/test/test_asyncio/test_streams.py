@@ -964,5 +964,204 @@ def test_eof_feed_when_closing_writer(self):
         self.assertEqual(messages, [])
 
 
+class BufferedStreamTests(test_utils.TestCase):
+
+    DATA = b'line1\nline2\nline3\n'
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+        self.set_event_loop(self.loop)
+
+    def tearDown(self):
+        test_utils.run_briefly(self.loop)
+
+        self.loop.close()
+        gc.collect()
+        super().tearDown()
+
+    def test_readexactly_returns_view(self):
+        stream = asyncio.BufferedStreamReader(loop=self.loop)
+        stream.feed_data(self.DATA)
+        data = self.loop.run_until_complete(stream.readexactly(6))
+        self.assertIsInstance(data, memoryview)
+        self.assertEqual(data, b'line1\n')
+        self.assertTrue(data.obj is stream._buffer)
+
+        data = self.loop.run_until_complete(stream.readexactly(12))
+        self.assertEqual(data, b'line2\nline3\n')
+        self.assertFalse(stream.at_eof())
+        stream.feed_eof()
+        self.assertTrue(stream.at_eof())
+
+    def test_readexactly_waits(self):
+        stream = asyncio.BufferedStreamReader(loop=self.loop)
+        n = 2 * len(self.DATA)
+        read_task = self.loop.create_task(stream.readexactly(n))
+
+        def cb():
+            stream.feed_data(self.DATA)
+            stream.feed_data(self.DATA)
+            stream.feed_data(self.DATA)
+        self.loop.call_soon(cb)
+
+        data = self.loop.run_until_complete(read_task)
+        self.assertEqual(self.DATA + self.DATA, data)
+        data = self.loop.run_until_complete(stream.readexactly(len(self.DATA)))
+        self.assertEqual(self.DATA, data)
+
+    def test_readexactly_eof(self):
+        stream = asyncio.BufferedStreamReader(loop=self.loop)
+        stream.feed_data(self.DATA)
+        stream.feed_eof()
+        with self.assertRaises(asyncio.IncompleteReadError) as cm:
+            self.loop.run_until_complete(stream.readexactly(100))
+        self.assertEqual(cm.exception.partial, self.DATA)
+        self.assertEqual(cm.exception.expected, 100)
+        self.assertTrue(stream.at_eof())
+
+    def test_readuntil(self):
+        stream = asyncio.BufferedStreamReader(loop=self.loop)
+        stream.feed_data(b'lineAAA')
+        stream.feed_data(b'lineAAA')
+        data = self.loop.run_until_complete(stream.readuntil(b'AAA'))
+        self.assertIsInstance(data, memoryview)
+        self.assertEqual(data, b'lineAAA')
+
+        read_task = self.loop.create_task(stream.readuntil(b'AAA'))
+        self.loop.call_soon(stream.feed_data, b'BBBAAA')
+        data = self.loop.run_until_complete(read_task)
+        self.assertEqual(data, b'lineAAA')
+
+    def test_readuntil_limit(self):
+        stream = asyncio.BufferedStreamReader(limit=3, loop=self.loop)
+        stream.feed_data(b'some dataAA')
+        with self.assertRaisesRegex(asyncio.LimitOverrunError, 'not found'):
+            self.loop.run_until_complete(stream.readuntil(b'AAA'))
+        self.assertEqual(bytes(stream._buffer[stream._start:stream._end]),
+                         b'some dataAA')
+
+    def test_readline(self):
+        stream = asyncio.BufferedStreamReader(limit=7, loop=self.loop)
+        stream.feed_data(b'1234567890\nabc\ndef')
+        with self.assertRaises(ValueError):
+            self.loop.run_until_complete(stream.readline())
+        data = self.loop.run_until_complete(stream.readline())
+        self.assertEqual(data, b'abc\n')
+        stream.feed_eof()
+        data = self.loop.run_until_complete(stream.readline())
+        self.assertEqual(data, b'def')
+        data = self.loop.run_until_complete(stream.readline())
+        self.assertEqual(data, b'')
+
+    def test_read(self):
+        stream = asyncio.BufferedStreamReader(loop=self.loop)
+        stream.feed_data(self.DATA)
+        data = self.loop.run_until_complete(stream.read(5))
+        self.assertIsInstance(data, memoryview)
+        self.assertEqual(data, b'line1')
+        stream.feed_eof()
+        data = self.loop.run_until_complete(stream.read())
+        self.assertEqual(data, b'\nline2\nline3\n')
+        data = self.loop.run_until_complete(stream.read())
+        self.assertEqual(data, b'')
+
+    def test_readinto(self):
+        stream = asyncio.BufferedStreamReader(loop=self.loop)
+        buf = bytearray(8)
+        read_task = self.loop.create_task(stream.readinto(buf))
+        self.loop.call_soon(stream.feed_data, self.DATA)
+        n = self.loop.run_until_complete(read_task)
+        self.assertEqual(n, 8)
+        self.assertEqual(buf, self.DATA[:8])
+
+        buf = bytearray(100)
+        n = self.loop.run_until_complete(stream.readinto(buf))
+        self.assertEqual(n, len(self.DATA) - 8)
+        self.assertEqual(buf[:n], self.DATA[8:])
+
+        stream.feed_eof()
+        n = self.loop.run_until_complete(stream.readinto(buf))
+        self.assertEqual(n, 0)
+
+    def test_view_survives_until_next_read(self):
+        stream = asyncio.BufferedStreamReader(limit=16, loop=self.loop)
+        stream.feed_data(b'a' * 12)
+        first = self.loop.run_until_complete(stream.readexactly(10))
+        # Not enough room at the end of the buffer: the unread data is
+        # moved, but not over the bytes still visible through `first`.
+        stream.feed_data(b'b' * 12)
+        self.assertEqual(first, b'a' * 10)
+        second = self.loop.run_until_complete(stream.readexactly(14))
+        self.assertEqual(second, b'aa' + b'b' * 12)
+
+    def test_buffer_grows(self):
+        stream = asyncio.BufferedStreamReader(limit=4, loop=self.loop)
+        stream.feed_data(b'x' * 100)
+        data = self.loop.run_until_complete(stream.readexactly(100))
+        self.assertEqual(data, b'x' * 100)
+
+    def test_pause_reading(self):
+        stream = asyncio.BufferedStreamReader(limit=4, loop=self.loop)
+        transport = mock.Mock()
+        stream.set_transport(transport)
+        buf = stream.get_buffer(9)
+        buf[:9] = b'123456789'
+        stream.buffer_updated(9)
+        self.assertTrue(transport.pause_reading.called)
+        self.loop.run_until_complete(stream.readexactly(5))
+        self.assertTrue(transport.resume_reading.called)
+
+    def test___repr__(self):
+        stream = asyncio.BufferedStreamReader(loop=self.loop)
+        stream.feed_data(b'data')
+        self.assertEqual('<BufferedStreamReader 4 bytes>', repr(stream))
+
+    def test_open_connection(self):
+        async def inner(httpd):
+            rd, wr = await asyncio.open_connection(*httpd.address,
+                                                   buffered=True)
+            self.assertIsInstance(rd, asyncio.BufferedStreamReader)
+            wr.write(b'GET / HTTP/1.0\r\n\r\n')
+            data = await rd.readline()
+            self.assertEqual(data, b'HTTP/1.0 200 OK\r\n')
+            data = await rd.read()
+            self.assertTrue(bytes(data).endswith(b'\r\n\r\nTest message'))
+            wr.close()
+            await wr.wait_closed()
+
+        messages = []
+        self.loop.set_exception_handler(lambda loop, ctx: messages.append(ctx))
+
+        with test_utils.run_test_server() as httpd:
+            self.loop.run_until_complete(inner(httpd))
+
+        self.assertEqual(messages, [])
+
+    def test_start_server(self):
+        async def handle_client(client_reader, client_writer):
+            self.assertIsInstance(client_reader, asyncio.BufferedStreamReader)
+            data = await client_reader.readexactly(5)
+            client_writer.write(data)
+            await client_writer.drain()
+            client_writer.close()
+            await client_writer.wait_closed()
+
+        async def inner():
+            server = await asyncio.start_server(
+                handle_client, '127.0.0.1', 0, buffered=True)
+            addr = server.sockets[0].getsockname()
+            rd, wr = await asyncio.open_connection(*addr)
+            wr.write(b'hello')
+            data = await rd.read()
+            wr.close()
+            await wr.wait_closed()
+            server.close()
+            await server.wait_closed()
+            return data
+
+        self.assertEqual(self.loop.run_until_complete(inner()), b'hello')
+
+
 if __name__ == '__main__':
     unittest.main()
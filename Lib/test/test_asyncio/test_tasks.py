@@ -2023,6 +2023,43 @@ async def coro(loop):
         self.loop.run_until_complete(task)
         self.assertIsNone(asyncio.current_task(loop=self.loop))
 
+    def test_task_instrumentation(self):
+        self.assertFalse(self.loop.get_task_instrumentation())
+        fut = self.new_future(self.loop)
+
+        async def coro(fut):
+            await fut
+            return asyncio.all_task_stats()
+
+        task = self.new_task(self.loop, coro(fut))
+        test_utils.run_briefly(self.loop)
+        self.assertIsNone(self.loop.get_task_stats(task))
+
+        self.loop.set_task_instrumentation(True)
+        self.assertTrue(self.loop.get_task_instrumentation())
+        self.loop.call_soon(fut.set_result, None)
+        live = self.loop.run_until_complete(task)
+        # The step currently running is not accounted yet.
+        self.assertEqual(live, {})
+
+        stats = self.loop.get_task_stats(task)
+        self.assertIsInstance(stats, asyncio.TaskStats)
+        self.assertEqual(stats.steps, 1)
+        self.assertGreaterEqual(stats.run_time, 0)
+        self.assertGreaterEqual(stats.max_run_time, 0)
+        self.assertGreaterEqual(stats.queue_delay, 0)
+        self.assertGreaterEqual(stats.max_queue_delay, 0)
+
+        fut = self.new_future(self.loop)
+        task2 = self.new_task(self.loop, coro(fut))
+        self.loop.call_soon(fut.set_result, None)
+        live = self.loop.run_until_complete(task2)
+        self.assertEqual(live[task2].steps, 1)
+        self.assertEqual(self.loop.get_task_stats(task2).steps, 2)
+
+        self.loop.set_task_instrumentation(False)
+        self.assertIsNone(self.loop.get_task_stats(task))
+
     def test_current_task_with_interleaving_tasks(self):
         self.assertIsNone(asyncio.current_task(loop=self.loop))
 
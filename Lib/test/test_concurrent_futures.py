@@ -67,6 +67,12 @@ def sleep_and_print(t, msg):
     print(msg)
     sys.stdout.flush()
 
+def make_buffers(size):
+    return [bytearray(b'x' * size), bytearray(b'y' * 10), 42]
+
+def make_memoryview(size):
+    return memoryview(bytearray(range(256)) * size).cast('i', [size, 64])
+
 def init(x):
     global INITIALIZER_STATUS
     INITIALIZER_STATUS = x
@@ -929,6 +935,39 @@ def bad_map():
             ref)
         self.assertRaises(ValueError, bad_map)
 
+    def test_map_auto_chunksize(self):
+        ref = list(map(pow, range(500), range(500)))
+        self.assertEqual(
+            list(self.executor.map(pow, range(500), range(500),
+                                   chunksize="auto")),
+            ref)
+        self.assertEqual(
+            list(self.executor.map(pow, iter(range(500)), range(500),
+                                   chunksize="auto",
+                                   timeout=support.SHORT_TIMEOUT)),
+            ref)
+        self.assertEqual(list(self.executor.map(pow, [], chunksize="auto")),
+                         [])
+
+        i = self.executor.map(divmod, [1, 1, 1, 1], [2, 3, 0, 5],
+                              chunksize="auto")
+        self.assertEqual(i.__next__(), (0, 1))
+        self.assertEqual(i.__next__(), (0, 1))
+        self.assertRaises(ZeroDivisionError, i.__next__)
+
+    def test_map_auto_chunksize_timeout(self):
+        results = []
+        try:
+            for i in self.executor.map(time.sleep, [0, 0, 6],
+                                       timeout=5, chunksize="auto"):
+                results.append(i)
+        except futures.TimeoutError:
+            pass
+        else:
+            self.fail('expected TimeoutError')
+
+        self.assertEqual([None, None], results)
+
     @classmethod
     def _test_traceback(cls):
         raise RuntimeError(123) # some comment
@@ -1005,6 +1044,49 @@ def test_idle_process_reuse_multiple(self):
         self.assertLessEqual(len(executor._processes), 2)
         executor.shutdown()
 
+    def test_shared_memory_threshold_invalid(self):
+        with self.assertRaises(ValueError):
+            self.executor_type(1, shared_memory_threshold=0)
+
+    @unittest.skipIf(sys.platform == 'win32', 'not used on Windows')
+    def test_shared_memory_results(self):
+        executor = self.executor_type(
+            2, mp_context=self.get_context(), shared_memory_threshold=1024)
+        with executor:
+            self.assertEqual(executor.submit(bytes, 10).result(), bytes(10))
+            self.assertEqual(executor.submit(bytes, 4096).result(),
+                             bytes(4096))
+            r = executor.submit(bytearray, 4096).result()
+            self.assertIs(type(r), bytearray)
+            self.assertEqual(r, bytearray(4096))
+            self.assertEqual(executor.submit(make_buffers, 4096).result(),
+                             make_buffers(4096))
+            r = executor.submit(make_memoryview, 8).result()
+            self.assertEqual(r.format, 'i')
+            self.assertEqual(r.shape, (8, 64))
+            self.assertEqual(r.tolist(), make_memoryview(8).tolist())
+            self.assertEqual(
+                list(executor.map(bytes, [10, 2000, 5000], chunksize=2)),
+                [bytes(10), bytes(2000), bytes(5000)])
+
+    @unittest.skipIf(sys.platform == 'win32', 'not used on Windows')
+    def test_shared_memory_segments_released(self):
+        from concurrent.futures import process
+        from multiprocessing import shared_memory
+
+        self.assertEqual(process._export_result(b'abc', 10), b'abc')
+        # The pickled payload is sent even without large buffers.
+        handle = process._export_result([1, 2], 10)
+        self.assertEqual(handle.segments, [])
+        self.assertEqual(handle.load(), [1, 2])
+        handle = process._export_result(b'abc' * 10, 10)
+        self.assertIsInstance(handle, process._SharedMemoryResult)
+        (name, size), = handle.segments
+        self.assertEqual(size, 30)
+        self.assertEqual(handle.load(), b'abc' * 10)
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name)
+
 create_executor_tests(ProcessPoolExecutorTest,
                       executor_mixins=(ProcessPoolForkMixin,
                                        ProcessPoolForkserverMixin,
@@ -5,16 +5,21 @@
 from dataclasses import *
 
 import abc
+import copy
+import marshal
+import array
 import pickle
 import inspect
 import builtins
 import unittest
+import weakref
 from textwrap import dedent
 from unittest.mock import Mock
 from typing import ClassVar, Any, List, Union, Tuple, Dict, Generic, TypeVar, Optional
 from typing import get_type_hints
 from collections import deque, OrderedDict, namedtuple
 from functools import total_ordering
+from test.support import os_helper
 
 import typing       # Needed for the string "typing.ClassVar[int]" to work as an annotation.
 import dataclasses  # Needed for the string "dataclasses.InitVar[int]" to work as an annotation.
@@ -2757,6 +2762,101 @@ class Derived(Base):
         # We can add a new field to the derived instance.
         d.z = 10
 
+    def test_generated_slots(self):
+        @dataclass(slots=True)
+        class C:
+            x: int
+            y: int = 0
+            z: int = field(default=3, init=False)
+
+        self.assertEqual(C.__slots__, ('x', 'y', 'z'))
+        self.assertFalse(hasattr(C(1), '__dict__'))
+        c = C(1)
+        self.assertEqual((c.x, c.y, c.z), (1, 0, 3))
+        self.assertEqual(repr(c), 'TestSlots.test_generated_slots.<locals>.C(x=1, y=0, z=3)')
+        self.assertEqual(C(1, 2), C(1, 2))
+        with self.assertRaisesRegex(AttributeError, "'C' object has no attribute 'w'"):
+            c.w = 5
+        with self.assertRaisesRegex(TypeError, 'already specifies __slots__'):
+            @dataclass(slots=True)
+            class D:
+                __slots__ = ('x',)
+                x: int
+
+    def test_generated_slots_inheritance(self):
+        @dataclass(slots=True)
+        class Base:
+            x: int
+
+            def total(self):
+                return self.x
+
+        @dataclass(slots=True)
+        class Derived(Base):
+            y: int
+
+            def total(self):
+                # super() uses the class created for the slots.
+                return super().total() + self.y
+
+        self.assertEqual(Derived.__slots__, ('y',))
+        d = Derived(1, 2)
+        self.assertFalse(hasattr(d, '__dict__'))
+        self.assertEqual(d.total(), 3)
+
+    def test_frozen_pickle(self):
+        for cls in FrozenSlotsClass, FrozenWithoutSlotsClass:
+            obj = cls('a', 1)
+            for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+                with self.subTest(cls=cls, proto=proto):
+                    p = pickle.loads(pickle.dumps(obj, protocol=proto))
+                    self.assertIsNot(p, obj)
+                    self.assertEqual(p, obj)
+        obj = FrozenSlotsClass('a', 1)
+        with self.assertRaises(FrozenInstanceError):
+            obj.foo = 'b'
+        self.assertEqual(copy.copy(obj), obj)
+
+    def test_weakref_slot(self):
+        with self.assertRaisesRegex(TypeError,
+                                    'weakref_slot is True but slots is False'):
+            @dataclass(weakref_slot=True)
+            class A:
+                a: int
+
+        @dataclass(slots=True, weakref_slot=True)
+        class A:
+            a: int
+
+        self.assertIn('__weakref__', A.__slots__)
+        a = A(1)
+        self.assertIs(weakref.ref(a)(), a)
+        # Without weakref_slot, instances cannot be weakly referenced.
+        @dataclass(slots=True)
+        class B:
+            a: int
+        with self.assertRaises(TypeError):
+            weakref.ref(B(1))
+
+    def test_make_dataclass_slots(self):
+        C = make_dataclass('C', ['x', ('y', int, field(default=5))],
+                           slots=True)
+        self.assertEqual(C.__slots__, ('x', 'y'))
+        self.assertEqual(astuple(C(1)), (1, 5))
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenSlotsClass:
+    foo: str
+    bar: int
+
+
+@dataclass(frozen=True)
+class FrozenWithoutSlotsClass:
+    foo: str
+    bar: int
+
+
 class TestDescriptors(unittest.TestCase):
     def test_set_name(self):
         # See bpo-33141.
@@ -3375,5 +3475,159 @@ class Date(A):
         self.assertRaisesRegex(TypeError, msg, Date)
 
 
+class TestCodeCache(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        # Start from an empty cache and restore the original one.
+        cache = dataclasses._code_cache
+        dataclasses._code_cache = {}
+        self.addCleanup(setattr, dataclasses, '_code_cache', cache)
+
+    def make_class(self, default, frozen=False):
+        @dataclass(frozen=frozen)
+        class C:
+            x: int
+            y: list = field(default_factory=default)
+        return C
+
+    def test_shared_code(self):
+        C1 = self.make_class(list)
+        C2 = self.make_class(lambda: [2])
+        C3 = self.make_class(list, frozen=True)
+        self.assertIs(C1.__init__.__code__, C2.__init__.__code__)
+        self.assertIs(C1.__eq__.__code__, C2.__eq__.__code__)
+        self.assertIsNot(C1.__init__.__code__, C3.__init__.__code__)
+        self.assertEqual(C1(1), C1(1, []))
+        self.assertEqual(C2(1), C2(1, [2]))
+        self.assertEqual(C2.__init__.__qualname__,
+                         'TestCodeCache.make_class.<locals>.C.__init__')
+
+    def test_save_and_load(self):
+        self.make_class(list)
+        count = len(dataclasses._code_cache)
+        dataclasses.save_code_cache(os_helper.TESTFN)
+        dataclasses._code_cache.clear()
+        self.assertEqual(dataclasses.load_code_cache(os_helper.TESTFN), count)
+        self.assertEqual(dataclasses.load_code_cache(os_helper.TESTFN), 0)
+        C = self.make_class(lambda: [3])
+        self.assertEqual(repr(C(1)), 'TestCodeCache.make_class.<locals>.'
+                                     'C(x=1, y=[3])')
+        self.assertEqual(len(dataclasses._code_cache), count)
+        # Entries which were not used are saved again.
+        dataclasses.save_code_cache(os_helper.TESTFN)
+        dataclasses._code_cache.clear()
+        self.assertEqual(dataclasses.load_code_cache(os_helper.TESTFN), count)
+
+    def test_invalid_file(self):
+        with open(os_helper.TESTFN, 'wb') as file:
+            file.write(b'garbage')
+        with self.assertRaises(ValueError):
+            dataclasses.load_code_cache(os_helper.TESTFN)
+        with open(os_helper.TESTFN, 'wb') as file:
+            file.write(marshal.dumps(((b'dataclasses.code_cache', '0.0'),
+                                      {'txt': b''})))
+        self.assertEqual(dataclasses.load_code_cache(os_helper.TESTFN), 0)
+        self.assertEqual(dataclasses._code_cache, {})
+
+
+class TestColumns(unittest.TestCase):
+    def test_columns(self):
+        @dataclass
+        class Point:
+            x: int
+            y: float
+            label: str = ''
+
+        points = Columns(Point, [Point(1, 2.0), Point(3, 4.0, 'b')])
+        self.assertEqual(len(points), 2)
+        self.assertEqual(points.typecodes, {'x': 'q', 'y': 'd', 'label': None})
+        self.assertEqual(points.column('x'), array.array('q', [1, 3]))
+        self.assertEqual(points.column('y'), array.array('d', [2.0, 4.0]))
+        self.assertEqual(points.column('label'), ['', 'b'])
+        self.assertRaises(KeyError, points.column, 'z')
+        self.assertEqual(points[1], Point(3, 4.0, 'b'))
+        self.assertEqual(points[-2], Point(1, 2.0))
+        self.assertEqual(list(points), [Point(1, 2.0), Point(3, 4.0, 'b')])
+        self.assertEqual(list(points[::-1]), [Point(3, 4.0, 'b'), Point(1, 2.0)])
+        self.assertEqual(points.index(Point(3, 4.0, 'b')), 1)
+        self.assertIn(Point(1, 2.0), points)
+        self.assertEqual(repr(points),
+                         "Columns(TestColumns.test_columns.<locals>.Point, "
+                         "[TestColumns.test_columns.<locals>.Point(x=1, y=2.0, label=''), "
+                         "TestColumns.test_columns.<locals>.Point(x=3, y=4.0, label='b')])")
+
+        # A row is a copy: assign it back to change the columns.
+        p = points[0]
+        p.x = 10
+        self.assertEqual(points[0].x, 1)
+        points[0] = p
+        self.assertEqual(points[0].x, 10)
+        points[1:] = [Point(5, 6.0), Point(7, 8.0)]
+        points.insert(0, Point(0, 0.0))
+        self.assertEqual([p.x for p in points], [0, 10, 5, 7])
+        del points[1:3]
+        points.append(Point(9, 9.0))
+        points.extend([Point(11, 11.0)])
+        self.assertEqual(list(points.column('x')), [0, 7, 9, 11])
+        self.assertEqual(points.pop(), Point(11, 11.0))
+        self.assertEqual(len(points), 3)
+
+    def test_frozen_and_slots(self):
+        for kwargs in {'frozen': True}, {'slots': True}:
+            with self.subTest(**kwargs):
+                @dataclass(**kwargs)
+                class C:
+                    x: int
+                    y: List[int] = field(default_factory=list)
+
+                columns = Columns(C, [C(1, [2])])
+                self.assertEqual(columns[0], C(1, [2]))
+                self.assertEqual(columns.typecodes, {'x': 'q', 'y': None})
+
+    def test_typecodes(self):
+        @dataclass
+        class C:
+            x: int
+            y: Any
+
+        columns = Columns(C, [C(1, 2)], typecodes={'x': None, 'y': 'b'})
+        self.assertEqual(columns.column('x'), [1])
+        self.assertEqual(columns.column('y'), array.array('b', [2]))
+        with self.assertRaisesRegex(ValueError, "'z' is not a field of C"):
+            Columns(C, typecodes={'z': 'q'})
+
+    def test_errors(self):
+        @dataclass
+        class C:
+            x: int
+            y: str = ''
+
+        class D:
+            x: int
+
+        self.assertRaises(TypeError, Columns, D)
+        self.assertRaises(TypeError, Columns, C(1))
+        self.assertRaises(ValueError, Columns, make_dataclass('E', []))
+        columns = Columns(C, [C(1)])
+        self.assertRaises(TypeError, columns.append, (1, ''))
+        # A value which does not fit in its column leaves the columns
+        # unchanged.
+        calls = {'append': (C(2**70),),
+                 'extend': ([C(2), C(2**70)],),
+                 'insert': (0, C(2**70))}
+        for name, args in calls.items():
+            with self.subTest(method=name):
+                with self.assertRaises(OverflowError):
+                    getattr(columns, name)(*args)
+                self.assertEqual(len(columns.column('y')),
+                                 len(columns.column('x')))
+        with self.assertRaises(TypeError):
+            columns[0] = C('x', 'y')
+        self.assertEqual(columns[0], C(1))
+        with self.assertRaises(TypeError):
+            columns[:] = [C(2), C('x')]
+        self.assertEqual(list(columns), [C(1)])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -297,6 +297,49 @@ class Empty(Enum):
             pass
         self.assertTrue(bool(Empty))
 
+    def test_members_in_class_dict(self):
+        class Color(Enum):
+            red = 1
+            name = 2
+            value = 3
+        # members are stored in the class, unless a base class already
+        # defines an attribute with their name
+        self.assertIs(Color.__dict__['red'], Color.red)
+        self.assertNotIn('name', Color.__dict__)
+        self.assertIs(Color.name, Color(2))
+        self.assertEqual(Color.value.name, 'value')
+        self.assertEqual(Color.red.value, 1)
+        with self.assertRaises(AttributeError):
+            Color.red = 4
+        # other members are found through a member like any class attribute
+        self.assertIs(Color.red.red, Color.red)
+
+    def test_member_named_like_mixin_attribute(self):
+        class Mixin:
+            size = 'mixin'
+        class Sizes(Mixin, Enum):
+            size = 1
+            other = 2
+        # the name is used by the mixin: the member is redirected to
+        self.assertNotIsInstance(Sizes.__dict__['size'], Sizes)
+        self.assertIs(Sizes.size, Sizes(1))
+        self.assertIs(Sizes.__dict__['other'], Sizes.other)
+
+    def test_value_lookup(self):
+        class Shape(Enum):
+            square = 1
+            points = [1, 2]
+        self.assertIs(Shape(1), Shape.square)
+        self.assertIs(Shape(1.0), Shape.square)
+        self.assertIs(Shape(Shape.square), Shape.square)
+        # unhashable values are looked up linearly
+        self.assertIs(Shape([1, 2]), Shape.points)
+        with self.assertRaisesRegex(ValueError, 'is not a valid'):
+            Shape([1])
+        with self.assertRaisesRegex(ValueError, 'is not a valid') as cm:
+            Shape(2)
+        self.assertIsNone(cm.exception.__context__)
+
     def test_bool_of_member(self):
         class Count(Enum):
             zero = 0
@@ -2386,6 +2429,18 @@ def test_invert(self):
         self.assertIs(Open.WO & ~Open.WO, Open.RO)
         self.assertIs((Open.WO|Open.CE) & ~Open.WO, Open.CE)
 
+    def test_invert_multi_bit_members(self):
+        Open = self.Open
+        # the inverse combines the members which share no bit with the value
+        self.assertIs(~Open.AC, Open.CE)
+        self.assertIs(~Open.WO, Open.RW | Open.CE)
+        self.assertIs(~(Open.RW | Open.CE), Open.WO)
+        self.assertIs(~Open.RO, Open.AC | Open.CE)
+        Color = self.Color
+        self.assertIs(~Color.RED, Color.GREEN | Color.BLUE)
+        self.assertIs(~Color.GREEN, Color.PURPLE)
+        self.assertIs(~Color.BLACK, Color.PURPLE | Color.GREEN)
+
     def test_bool(self):
         Perm = self.Perm
         for f in Perm:
@@ -0,0 +1,178 @@
+from importlib import _bootstrap_external
+from importlib import archive
+from importlib import machinery
+import os
+import sys
+import tempfile
+import unittest
+
+from test.support import os_helper
+from test.support import script_helper
+from . import util as test_util
+
+
+class ArchiveTests(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(os_helper.rmtree, self.root)
+        self.src = os.path.join(self.root, 'src')
+        self.create('mod.py', 'value = 1\n')
+        self.create('pkg/__init__.py', 'value = 2\n')
+        self.create('pkg/sub.py', 'from . import value\nvalue += 1\n')
+        self.create('pkg/inner/__init__.py', '')
+        self.create('pkg/inner/leaf.py', 'def f():\n    return __name__\n')
+        self.create('pkg/data/not_a_package.py', '')
+        self.create('notes.txt', '')
+        self.filename = os.path.join(self.root, 'app.pyca')
+
+    def create(self, name, content):
+        filename = os.path.join(self.src, *name.split('/'))
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        with open(filename, 'w') as file:
+            file.write(content)
+
+    def test_write_archive(self):
+        names = archive.write_archive(self.filename, [self.src])
+        self.assertEqual(names, ['mod', 'pkg', 'pkg.inner', 'pkg.inner.leaf',
+                                 'pkg.sub'])
+        importer = archive.ArchiveImporter(self.filename)
+        self.assertEqual(sorted(importer), names)
+        self.assertIn('pkg.sub', importer)
+        self.assertNotIn('pkg.data', importer)
+        self.assertTrue(importer.is_package('pkg'))
+        self.assertFalse(importer.is_package('pkg.sub'))
+        self.assertIsNone(importer.get_source('mod'))
+        self.assertEqual(importer.get_filename('pkg.inner'),
+                         os.path.join(self.filename, 'pkg', 'inner',
+                                      '__init__.py'))
+        self.assertRaises(ImportError, importer.get_code, 'missing')
+
+    def test_find_spec(self):
+        archive.write_archive(self.filename, [self.src])
+        importer = archive.ArchiveImporter(self.filename)
+        self.assertIsNone(importer.find_spec('missing'))
+        spec = importer.find_spec('pkg')
+        self.assertIs(spec.loader, importer)
+        self.assertEqual(spec.origin,
+                         os.path.join(self.filename, 'pkg', '__init__.py'))
+        self.assertEqual(spec.submodule_search_locations,
+                         [os.path.join(self.filename, 'pkg'),
+                          os.path.join(self.src, 'pkg')])
+        self.assertTrue(spec.has_location)
+        spec = importer.find_spec('pkg.sub', spec.submodule_search_locations)
+        self.assertIsNone(spec.submodule_search_locations)
+
+    def test_import(self):
+        archive.write_archive(self.filename, [self.src])
+        # The sources are not needed any more.
+        os_helper.rmtree(self.src)
+        meta_path = [machinery.BuiltinImporter]
+        with test_util.import_state(meta_path=meta_path), \
+                test_util.uncache('mod', 'pkg', 'pkg.sub', 'pkg.inner',
+                                  'pkg.inner.leaf'):
+            importer = archive.install(self.filename)
+            self.assertIs(sys.meta_path[-1], importer)
+            import mod, pkg.sub
+            from pkg.inner import leaf
+            self.assertEqual(mod.value, 1)
+            self.assertEqual(pkg.sub.value, 3)
+            self.assertEqual(leaf.f(), 'pkg.inner.leaf')
+            self.assertEqual(leaf.__file__, os.path.join(
+                self.filename, 'pkg', 'inner', 'leaf.py'))
+            self.assertEqual(leaf.f.__code__.co_filename, leaf.__file__)
+
+    def test_modules(self):
+        sys.path.insert(0, self.src)
+        self.addCleanup(sys.path.remove, self.src)
+        with test_util.uncache('pkg', 'pkg.inner'):
+            names = archive.write_archive(self.filename,
+                                          modules=['mod', 'pkg.inner'])
+        self.assertEqual(names, ['mod', 'pkg.inner', 'pkg.inner.leaf'])
+        self.assertRaises(ValueError, archive.write_archive, self.filename,
+                          modules=['sys'])
+        self.assertRaises(ValueError, archive.write_archive, self.filename,
+                          modules=['missing_module'])
+
+    def test_write_image(self):
+        sys.path.insert(0, self.src)
+        self.addCleanup(sys.path.remove, self.src)
+        with test_util.uncache('pkg', 'pkg.sub'):
+            names = archive.write_image(self.filename, ['pkg.sub'])
+        self.assertIn('pkg', names)
+        self.assertIn('pkg.sub', names)
+        self.assertNotIn('pkg.inner', names)
+        # Modules imported at startup are included too.
+        self.assertIn('os', names)
+        self.assertIn('posixpath' if os.name == 'posix' else 'ntpath', names)
+        # Aliases are not archived twice.
+        self.assertNotIn('os.path', names)
+        self.assertNotIn('sys', names)
+        self.assertNotIn('__main__', names)
+
+    def test_submodule_not_in_image(self):
+        sys.path.insert(0, self.src)
+        self.addCleanup(sys.path.remove, self.src)
+        with test_util.uncache('pkg', 'pkg.sub'):
+            names = archive.write_image(self.filename, ['pkg.sub'])
+        self.assertNotIn('pkg.inner', names)
+        meta_path = [machinery.BuiltinImporter, machinery.PathFinder]
+        loaders = _bootstrap_external._get_supported_file_loaders()
+        path_hooks = [machinery.FileFinder.path_hook(*loaders)]
+        with test_util.import_state(meta_path=meta_path,
+                                    path_hooks=path_hooks), \
+                test_util.uncache('pkg', 'pkg.sub', 'pkg.inner',
+                                  'pkg.inner.leaf'):
+            importer = archive.install(self.filename)
+            import pkg.inner.leaf
+            self.assertIs(pkg.__loader__, importer)
+            # Found in the source directory of pkg.
+            self.assertEqual(pkg.inner.leaf.__file__, os.path.join(
+                self.src, 'pkg', 'inner', 'leaf.py'))
+
+    def test_optimize(self):
+        self.create('mod.py', 'assert False\n')
+        archive.write_archive(self.filename, [self.src], optimize=1)
+        importer = archive.ArchiveImporter(self.filename)
+        exec(importer.get_code('mod'), {})
+
+    def test_invalid_archive(self):
+        for data in b'', b'PYCA', b'PK\x03\x04' + bytes(100):
+            with open(self.filename, 'wb') as file:
+                file.write(data)
+            with self.subTest(data=data):
+                self.assertRaises(ImportError, archive.ArchiveImporter,
+                                  self.filename)
+        archive.write_archive(self.filename, [self.src])
+        with open(self.filename, 'r+b') as file:
+            file.seek(4)
+            file.write(b'\0\0\0\0')
+        with self.assertRaisesRegex(ImportError, 'another version'):
+            archive.ArchiveImporter(self.filename)
+
+    def test_command_line(self):
+        res = script_helper.assert_python_ok('-m', 'importlib.archive',
+                                             self.filename, self.src)
+        self.assertEqual(res.out.split(),
+                         [b'mod', b'pkg', b'pkg.inner', b'pkg.inner.leaf',
+                          b'pkg.sub'])
+        code = ('import importlib.archive as a; a.install(%r); '
+                'import pkg.sub; print(pkg.sub.value)' % self.filename)
+        res = script_helper.assert_python_ok('-c', code)
+        self.assertEqual(res.out.strip(), b'3')
+
+    def test_startup_image(self):
+        script_helper.assert_python_ok('-m', 'importlib.archive', '-q',
+                                       '--image', self.filename, '-m', 'json')
+        code = 'import json; print(type(json.__loader__).__name__)'
+        res = script_helper.assert_python_ok(
+            '-c', code, PYTHONIMPORTARCHIVE=self.filename)
+        self.assertEqual(res.out.strip(), b'ArchiveImporter')
+        # A missing archive is ignored.
+        res = script_helper.assert_python_ok(
+            '-c', code, PYTHONIMPORTARCHIVE=self.filename + '.missing')
+        self.assertEqual(res.out.strip(), b'SourceFileLoader')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,15 @@
 import importlib
 from importlib import abc
 from importlib import util
+import os
 import sys
+import tempfile
 import types
 import unittest
 
+from test.support import import_helper
+from test.support import os_helper
+from test.support import script_helper
 from . import util as test_util
 
 
@@ -141,5 +146,102 @@ def test_module_already_in_sys(self):
             module.__name__
 
 
+class LazyImportModeTests(unittest.TestCase):
+
+    modules = {
+        'lazypkg/__init__.py': 'value = 1\n',
+        'lazypkg/mod.py': 'value = 2\n',
+        'lazypkg/other.py': 'from . import mod\n',
+        'lazypkg/sub/__init__.py': '',
+        'lazypkg/sub/leaf.py': 'value = 3\n',
+        'eagermod.py': 'value = 4\n',
+    }
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(os_helper.rmtree, self.root)
+        for name, content in self.modules.items():
+            filename = os.path.join(self.root, *name.split('/'))
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            with open(filename, 'w') as file:
+                file.write(content)
+        path = import_helper.DirsOnSysPath(self.root)
+        path.__enter__()
+        self.addCleanup(path.__exit__)
+        names = ['lazypkg', 'lazypkg.mod', 'lazypkg.other', 'lazypkg.sub',
+                 'lazypkg.sub.leaf', 'eagermod']
+        uncache = test_util.uncache(*names)
+        uncache.__enter__()
+        self.addCleanup(uncache.__exit__, None, None, None)
+        importlib.invalidate_caches()
+        self.addCleanup(util.disable_lazy_imports)
+
+    def test_lazy_modules(self):
+        util.enable_lazy_imports(['lazypkg'])
+        import lazypkg.mod
+        import eagermod
+        # Importing a submodule uses the package's __path__.
+        self.assertIs(type(lazypkg), types.ModuleType)
+        self.assertEqual(util.untouched_modules(), ['lazypkg.mod'])
+        self.assertEqual(repr(lazypkg.mod), "<module 'lazypkg.mod' (lazy)>")
+        # Importing the module again does not load it.
+        import lazypkg.mod
+        self.assertIs(importlib.import_module('lazypkg.mod'), lazypkg.mod)
+        self.assertEqual(lazypkg.mod.__name__, 'lazypkg.mod')
+        self.assertEqual(util.untouched_modules(), ['lazypkg.mod'])
+        self.assertEqual(lazypkg.mod.value, 2)
+        self.assertEqual(util.untouched_modules(), [])
+        self.assertIs(type(eagermod), types.ModuleType)
+
+    def test_from_import(self):
+        util.enable_lazy_imports(['lazypkg'])
+        # Submodules bound by from-imports stay lazy.
+        from lazypkg import other, sub
+        self.assertEqual(util.untouched_modules(),
+                         ['lazypkg.other', 'lazypkg.sub'])
+        from lazypkg.sub import leaf
+        self.assertEqual(util.untouched_modules(),
+                         ['lazypkg.other', 'lazypkg.sub.leaf'])
+        # Other names are resolved, which loads the module.
+        from lazypkg.sub.leaf import value
+        self.assertEqual(value, 3)
+        self.assertIs(other.mod, sys.modules['lazypkg.mod'])
+        self.assertEqual(util.untouched_modules(), ['lazypkg.mod'])
+
+    def test_all_and_exclude(self):
+        util.enable_lazy_imports(exclude=['lazypkg.sub'])
+        import eagermod, lazypkg.sub.leaf, lazypkg.mod
+        self.assertEqual(util.untouched_modules(),
+                         ['eagermod', 'lazypkg.mod'])
+        util.disable_lazy_imports()
+        import lazypkg.other
+        self.assertEqual(util.untouched_modules(),
+                         ['eagermod', 'lazypkg.mod'])
+        self.assertEqual(lazypkg.other.mod.value, 2)
+
+    def test_eager_loaders(self):
+        # Loaders creating the module object themselves are not made lazy.
+        util.enable_lazy_imports()
+        with test_util.uncache('_testmultiphase'):
+            try:
+                import _testmultiphase
+            except ImportError:
+                self.skipTest('requires _testmultiphase')
+            self.assertIsNot(type(_testmultiphase), util._LazyImportModule)
+
+    def test_command_line(self):
+        code = 'import lazypkg.mod, eagermod; print(eagermod.value)'
+        for args, env in [(['-X', 'lazy_imports=lazypkg'], {}),
+                          ([], {'PYTHONLAZYIMPORTS': 'lazypkg'}),
+                          (['-X', 'lazy_imports'], {})]:
+            with self.subTest(args=args, env=env):
+                res = script_helper.assert_python_ok(
+                    *args, '-X', 'importtime', '-c', code, __isolated=False,
+                    PYTHONPATH=self.root, **env)
+                self.assertEqual(res.out.strip(), b'4')
+                self.assertIn(b'lazy imports: lazypkg.mod\n', res.err)
+                self.assertNotIn(b'lazy imports: eagermod', res.err)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,152 @@
+from importlib import _bootstrap_external
+from importlib import machinery
+from importlib import pathindex
+import os
+import sys
+import tempfile
+import unittest
+
+from test.support import os_helper
+from test.support import script_helper
+from . import util as test_util
+
+
+class PathIndexTests(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(os_helper.rmtree, self.root)
+        self.create('mod.py')
+        self.create('both.py')
+        self.create('both/__init__.py')
+        self.create('pkg/__init__.py')
+        self.create('pkg/sub.py')
+        self.create('pkg/inner/__init__.py')
+        self.create('ns/portion.py')
+        self.create('notes.txt')
+        self.other = tempfile.mkdtemp()
+        self.addCleanup(os_helper.rmtree, self.other)
+        self.create('mod.py', self.other)
+        self.create('late.py', self.other)
+        self.path = [self.root, self.other]
+        self.filename = os.path.join(tempfile.mkdtemp(), 'test.index')
+        self.addCleanup(os_helper.rmtree, os.path.dirname(self.filename))
+
+    def create(self, name, root=None):
+        filename = os.path.join(root or self.root, *name.split('/'))
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        with open(filename, 'w') as file:
+            file.write(f'name = {name!r}\n')
+        return filename
+
+    def finder(self, path=None):
+        return pathindex.IndexFinder(pathindex.build_index(path or self.path))
+
+    def assertSameSpec(self, spec, expected):
+        self.assertIsNotNone(spec)
+        self.assertEqual(spec.name, expected.name)
+        self.assertEqual(spec.origin, expected.origin)
+        self.assertEqual(spec.cached, expected.cached)
+        self.assertEqual(spec.submodule_search_locations,
+                         expected.submodule_search_locations)
+        self.assertIs(type(spec.loader), type(expected.loader))
+
+    def test_find_spec(self):
+        finder = self.finder()
+        loaders = _bootstrap_external._get_supported_file_loaders()
+        path_hooks = [machinery.FileFinder.path_hook(*loaders)]
+        with test_util.import_state(path=self.path, path_hooks=path_hooks):
+            for name in 'mod', 'both', 'pkg', 'late':
+                with self.subTest(name=name):
+                    self.assertSameSpec(finder.find_spec(name),
+                                        machinery.PathFinder.find_spec(name))
+            path = [os.path.join(self.root, 'pkg')]
+            for name in 'pkg.sub', 'pkg.inner':
+                with self.subTest(name=name):
+                    self.assertSameSpec(
+                        finder.find_spec(name, path),
+                        machinery.PathFinder.find_spec(name, path))
+            self.assertIsNone(finder.find_spec('missing'))
+            self.assertIsNone(finder.find_spec('notes'))
+            self.assertIsNone(finder.find_spec('pkg.missing', path))
+            # Namespace packages are left to PathFinder.
+            self.assertIsNone(finder.find_spec('ns'))
+
+    def test_missing_and_stale_directories(self):
+        index = pathindex.build_index([self.root])
+        self.create('new.py')
+        # Make sure the directory mtime changes despite its resolution.
+        mtime = os.stat(self.root).st_mtime
+        os.utime(self.root, (mtime + 10, mtime + 10))
+        finder = pathindex.IndexFinder(index)
+        self.assertIsNotNone(finder.find_spec('new', [self.root]))
+        # Directories missing from the index are listed once.
+        self.assertEqual(finder.find_spec('late', [self.other]).origin,
+                         os.path.join(self.other, 'late.py'))
+        self.create('later.py', self.other)
+        mtime = os.stat(self.other).st_mtime
+        os.utime(self.other, (mtime + 10, mtime + 10))
+        self.assertIsNone(finder.find_spec('later', [self.other]))
+        finder.invalidate_caches()
+        self.assertIsNotNone(finder.find_spec('later', [self.other]))
+        # Missing directories are skipped.
+        missing = os.path.join(self.root, 'missing')
+        self.assertEqual(finder.find_spec('mod', [missing, self.other]).origin,
+                         os.path.join(self.other, 'mod.py'))
+
+    def test_current_directory(self):
+        finder = self.finder([self.root, self.other])
+        with os_helper.change_cwd(self.root):
+            spec = finder.find_spec('mod', [''])
+            self.assertEqual(spec.origin, os.path.join(self.root, 'mod.py'))
+            self.assertTrue(os.path.isabs(spec.origin))
+        with os_helper.change_cwd(self.other):
+            self.assertEqual(finder.find_spec('late', ['']).origin,
+                             os.path.join(self.other, 'late.py'))
+            self.assertIsNone(finder.find_spec('both', ['']))
+
+    def test_other_path_entries(self):
+        finder = self.finder()
+        zipfile = self.create('archive.zip')
+        self.assertIsNone(finder.find_spec('mod', [zipfile, self.root]))
+        self.assertIsNone(finder.find_spec('mod', [os.fsencode(self.root)]))
+        with test_util.import_state(
+                path_importer_cache={self.root: object()}):
+            self.assertIsNone(finder.find_spec('mod', [self.root]))
+
+    def test_write_and_load(self):
+        filename = self.filename
+        pathindex.write_index(filename, self.path)
+        index = pathindex.load_index(filename)
+        self.assertEqual(index, pathindex.build_index(self.path))
+        with open(filename, 'wb') as file:
+            file.write(b'garbage')
+        self.assertRaises(ValueError, pathindex.load_index, filename)
+
+    def test_install(self):
+        filename = self.filename
+        pathindex.write_index(filename, self.path)
+        meta_path = [machinery.BuiltinImporter, machinery.PathFinder]
+        with test_util.import_state(meta_path=meta_path, path=self.path), \
+                test_util.uncache('pkg', 'pkg.sub'):
+            finder = pathindex.install(filename)
+            self.assertIs(sys.meta_path[1], finder)
+            import pkg.sub
+            self.assertEqual(pkg.sub.name, 'pkg/sub.py')
+            self.assertIs(pkg.sub.__spec__.loader.__class__,
+                          machinery.SourceFileLoader)
+
+    def test_command_line(self):
+        filename = self.filename
+        script_helper.assert_python_ok('-m', 'importlib.pathindex',
+                                       filename, *self.path)
+        self.assertEqual(pathindex.load_index(filename),
+                         pathindex.build_index(self.path))
+        code = 'import sys, mod; print(type(sys.meta_path[-2]).__name__)'
+        res = script_helper.assert_python_ok(
+            '-c', code, PYTHONIMPORTINDEX=filename, PYTHONPATH=self.root)
+        self.assertEqual(res.out.strip(), b'IndexFinder')
+
+
+if __name__ == '__main__':
+    unittest.main()
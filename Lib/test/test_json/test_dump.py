@@ -9,6 +9,79 @@ def test_dump(self):
         self.json.dump({}, sio)
         self.assertEqual(sio.getvalue(), '{}')
 
+    def test_dump_chunk_size(self):
+        class Writer:
+            def __init__(self):
+                self.chunks = []
+            def write(self, chunk):
+                self.chunks.append(chunk)
+
+        obj = [{'key': i, 'value': 'x' * (i % 7)} for i in range(500)]
+        expected = self.dumps(obj)
+        for chunk_size in (1, 100, 1000, len(expected) + 1):
+            with self.subTest(chunk_size=chunk_size):
+                fp = Writer()
+                self.json.dump(obj, fp, chunk_size=chunk_size)
+                self.assertEqual(''.join(fp.chunks), expected)
+                # Every piece but the last one reaches chunk_size, and
+                # none of them is much larger than that.
+                for chunk in fp.chunks[:-1]:
+                    self.assertGreaterEqual(len(chunk), chunk_size)
+                    self.assertLess(len(chunk), chunk_size + 20)
+        self.assertRaises(ValueError, self.json.dump, obj, Writer(),
+                          chunk_size=0)
+
+    def test_dump_write_mutates(self):
+        # fp.write() may mutate the object being encoded.
+        obj = [{'key': [i, 'x' * i]} for i in range(10)]
+        chunks = []
+        def write(chunk):
+            chunks.append(chunk)
+            if len(chunks) == 2:
+                obj.clear()
+        class Writer:
+            pass
+        fp = Writer()
+        fp.write = write
+        self.json.dump(obj, fp, chunk_size=1)
+        self.assertEqual(obj, [])
+        self.assertTrue(''.join(chunks).startswith('[{"key": [0, ""]}'))
+
+    def test_dump_encoder_subclass(self):
+        class Encoder(self.json.JSONEncoder):
+            def default(self, o):
+                if isinstance(o, set):
+                    return sorted(o)
+                return super().default(o)
+
+        class UpperEncoder(self.json.JSONEncoder):
+            def iterencode(self, o, _one_shot=False):
+                for chunk in super().iterencode(o, _one_shot):
+                    yield chunk.upper()
+
+        obj = {'a': [{1, 2}, 'b']}
+        sio = StringIO()
+        self.json.dump(obj, sio, cls=Encoder, chunk_size=4)
+        self.assertEqual(sio.getvalue(), '{"a": [[1, 2], "b"]}')
+        sio = StringIO()
+        self.json.dump(['a', 'b'], sio, cls=UpperEncoder, chunk_size=4)
+        self.assertEqual(sio.getvalue(), '["A", "B"]')
+        sio = StringIO()
+        self.json.dump([1, [2]], sio, indent=1, chunk_size=3)
+        self.assertEqual(sio.getvalue(), '[\n 1,\n [\n  2\n ]\n]')
+
+    def test_dump_encoder_without_dump(self):
+        # cls only needs to implement iterencode().
+        class Encoder:
+            def __init__(self, **kwargs):
+                self.indent = kwargs['indent']
+            def iterencode(self, o):
+                yield from ('[', repr(o), ', ', repr(self.indent), ']')
+
+        sio = StringIO()
+        self.json.dump(1, sio, cls=Encoder, indent=2, chunk_size=2)
+        self.assertEqual(sio.getvalue(), '[1, 2]')
+
     def test_dumps(self):
         self.assertEqual(self.dumps({}), '{}')
 
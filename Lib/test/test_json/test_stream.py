@@ -0,0 +1,122 @@
+import decimal
+from io import BytesIO, StringIO
+from test.test_json import PyTest, CTest
+
+
+ARRAY = '[1, -2.5e3, "a\\"b", {"k": [true, false, null]}, [], {}, 1234567]'
+LINES = '{"a": 1}\n{"b": [2, 3]}\n"x"\n42\n\n  -7  \n'
+
+
+class TestStream:
+    def iterload(self, data, chunk_size, **kw):
+        fp = BytesIO(data) if isinstance(data, bytes) else StringIO(data)
+        return list(self.json.iterload(fp, chunk_size=chunk_size, **kw))
+
+    def test_array(self):
+        expected = self.loads(ARRAY)
+        for chunk_size in (1, 2, 3, 7, 100):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(self.iterload(ARRAY, chunk_size), expected)
+
+    def test_lines(self):
+        expected = [self.loads(line) for line in LINES.split('\n')
+                    if line.strip()]
+        for chunk_size in (1, 2, 5, 100):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(self.iterload(LINES, chunk_size,
+                                               mode='lines'),
+                                 expected)
+
+    def test_bytes(self):
+        expected = ['\xe9€', 1.5]
+        for encoding in ('utf-8', 'utf-8-sig', 'utf-16', 'utf-16-be',
+                         'utf-32', 'utf-32-le'):
+            data = '["\xe9€", 1.5]'.encode(encoding)
+            with self.subTest(encoding=encoding):
+                self.assertEqual(self.iterload(data, 1), expected)
+                self.assertEqual(self.iterload(data, 1000), expected)
+
+    def test_empty(self):
+        self.assertEqual(self.iterload('[]', 1), [])
+        self.assertEqual(self.iterload(' [ ] ', 1), [])
+        self.assertEqual(self.iterload('', 1, mode='lines'), [])
+        self.assertEqual(self.iterload(b' \n', 1, mode='lines'), [])
+
+    def test_decode(self):
+        decoder = self.json.JSONStreamDecoder()
+        self.assertEqual(decoder.decode('[1, {"a"'), [1])
+        self.assertEqual(decoder.decode(': 2}, 3'), [{'a': 2}])
+        # 3 could be the start of a longer number.
+        self.assertEqual(decoder.decode('4'), [])
+        self.assertEqual(decoder.decode(']', final=True), [34])
+        # The decoder can be reused after the final chunk.
+        self.assertEqual(decoder.decode('[5]', final=True), [5])
+
+    def test_decoder_arguments(self):
+        data = '[1.5, {"b": 1, "a": 2}]'
+        self.assertEqual(
+            self.iterload(data, 3, parse_float=decimal.Decimal,
+                          object_pairs_hook=lambda x: x),
+            [decimal.Decimal('1.5'), [('b', 1), ('a', 2)]])
+
+    def test_invalid_mode(self):
+        self.assertRaises(ValueError, self.json.JSONStreamDecoder,
+                          mode='object')
+
+    def test_invalid_type(self):
+        decoder = self.json.JSONStreamDecoder()
+        self.assertRaises(TypeError, decoder.decode, 1)
+
+    def test_errors(self):
+        cases = [
+            ('', 'Expecting value'),
+            ('{}', "Expecting '\\['"),
+            ('[1', "Expecting ',' delimiter"),
+            ('[1,', 'Expecting value'),
+            ('[1,]', 'Expecting value'),
+            ('[1 2]', "Expecting ',' delimiter"),
+            ('[1] 2', 'Extra data'),
+            ('[{"a": 1]', "Expecting ',' delimiter"),
+            ('["abc', 'Unterminated string starting at'),
+        ]
+        for data, msg in cases:
+            for chunk_size in (1, 100):
+                with self.subTest(data=data, chunk_size=chunk_size):
+                    with self.assertRaisesRegex(self.JSONDecodeError, msg):
+                        self.iterload(data, chunk_size)
+        with self.assertRaisesRegex(self.JSONDecodeError, 'Expecting value'):
+            self.iterload('1\n]\n', 1, mode='lines')
+        # Values must be separated in 'lines' mode.
+        for data in '{}{}', '[1]"a"', '"a" "b""c"':
+            for chunk_size in (1, 100):
+                with self.subTest(data=data, chunk_size=chunk_size):
+                    with self.assertRaisesRegex(self.JSONDecodeError,
+                                                'Expecting whitespace'):
+                        self.iterload(data, chunk_size, mode='lines')
+
+    def test_values_before_error(self):
+        it = self.json.iterload(StringIO('[1, 2, x]'), chunk_size=1)
+        self.assertEqual(next(it), 1)
+        self.assertEqual(next(it), 2)
+        self.assertRaises(self.JSONDecodeError, next, it)
+
+    def test_bounded_buffer(self):
+        decoder = self.json.JSONStreamDecoder()
+        decoder.decode('[')
+        for i in range(1000):
+            decoder.decode('{"key": [%d, %d]}, ' % (i, i))
+            self.assertLess(decoder._size, 100)
+
+    def test_large_value(self):
+        # A value spanning many chunks is decoded once it is complete.
+        data = self.dumps([list(range(2000))] * 3)
+        decoder = self.json.JSONStreamDecoder()
+        values = []
+        for i in range(0, len(data), 10):
+            values += decoder.decode(data[i:i + 10])
+        values += decoder.decode('', final=True)
+        self.assertEqual(values, [list(range(2000))] * 3)
+
+
+class TestPyStream(TestStream, PyTest): pass
+class TestCStream(TestStream, CTest): pass
@@ -3982,6 +3982,16 @@ def test_defaults_parameter(self):
     def test_invalid_style(self):
         self.assertRaises(ValueError, logging.Formatter, None, None, 'x')
 
+    def test_uses_fields(self):
+        f = logging.Formatter('%(asctime)s %(funcName)-10s %(x)r')
+        self.assertEqual(f.usesFields(), {'asctime', 'funcName', 'x'})
+        f = logging.Formatter('{asctime} {funcName!r:{width}} {{x}}',
+                              style='{')
+        self.assertEqual(f.usesFields(), {'asctime', 'funcName', 'width'})
+        f = logging.Formatter('${asctime} $funcName $$x', style='$')
+        self.assertEqual(f.usesFields(), {'asctime', 'funcName'})
+        self.assertEqual(logging.Formatter().usesFields(), {'message'})
+
     def test_time(self):
         r = self.get_record()
         dt = datetime.datetime(1993, 4, 21, 8, 3, 0, 0, utc)
@@ -4008,6 +4018,66 @@ class NoMsecFormatter(logging.Formatter):
         f.converter = time.gmtime
         self.assertEqual(f.formatTime(r), '21/04/1993 08:03:00')
 
+    def test_time_cache(self):
+        r = self.get_record()
+        r.created = 735379380.25  # 1993-04-21 08:03:00.25 UTC
+        r.msecs = 250
+        f = logging.Formatter()
+        f.converter = time.gmtime
+        self.assertEqual(f.formatTime(r), '1993-04-21 08:03:00,250')
+        r.created += 0.5
+        r.msecs = 750
+        self.assertEqual(f.formatTime(r), '1993-04-21 08:03:00,750')
+        self.assertEqual(f.formatTime(r, '%H:%M'), '08:03')
+        r.created += 1
+        self.assertEqual(f.formatTime(r), '1993-04-21 08:03:01,750')
+        f.default_time_format = '%H:%M:%S'
+        self.assertEqual(f.formatTime(r), '08:03:01,750')
+        f.converter = lambda t: time.gmtime(t + 3600)
+        self.assertEqual(f.formatTime(r), '09:03:01,750')
+
+    def test_json(self):
+        r = self.get_record('custom')
+        r.created = 735379380.25
+        r.levelno = logging.DEBUG
+        r.levelname = 'DEBUG'
+        f = logging.JSONFormatter(datefmt='%Y')
+        f.converter = time.gmtime
+        self.assertEqual(json.loads(f.format(r)),
+                         {'asctime': '1993', 'levelname': 'DEBUG',
+                          'name': 'formatter.test',
+                          'message': 'Message with 2 placeholders'})
+        f = logging.JSONFormatter({'level': 'levelno', 'custom': 'custom',
+                                   'lineno': 'lineno', 'args': 'args',
+                                   'missing': 'missing',
+                                   'caf\xe9': 'exc_info'})
+        self.assertEqual(f.format(r),
+                         '{"level": 10, "custom": 1234, "lineno": 42, '
+                         '"args": [2, "placeholders"], "missing": null, '
+                         '"caf\\u00e9": null}')
+        f = logging.JSONFormatter(['msg'], ensure_ascii=False)
+        r.msg = '\xe9\n'
+        r.args = None
+        self.assertEqual(f.format(r), '{"msg": "\xe9\\n"}')
+        self.assertEqual(f.usesFields(), {'msg'})
+        r.msg = self
+        self.assertEqual(json.loads(f.format(r)), {'msg': str(self)})
+        self.assertRaises(ValueError, logging.JSONFormatter, [])
+        self.assertRaises(TypeError, logging.JSONFormatter, {1: 'msg'})
+
+    def test_json_exception(self):
+        f = logging.JSONFormatter(['message'])
+        try:
+            1/0
+        except ZeroDivisionError:
+            r = logging.makeLogRecord({'msg': 'error',
+                                       'exc_info': sys.exc_info(),
+                                       'stack_info': 'Stack:\n  line'})
+        data = json.loads(f.format(r))
+        self.assertEqual(list(data), ['message', 'exc_info', 'stack_info'])
+        self.assertTrue(data['exc_info'].startswith('Traceback'))
+        self.assertEqual(data['stack_info'], 'Stack:\n  line')
+
 
 class TestBufferingFormatter(logging.BufferingFormatter):
     def formatHeader(self, records):
@@ -5001,6 +5071,42 @@ def outer():
         self.assertEqual(records[-1].funcName, 'test_find_caller_with_stacklevel')
         self.assertGreater(records[-1].lineno, lineno)
 
+    def test_declared_fields(self):
+        records = self.recording.records
+        self.recording.setFields({'levelname', 'message'})
+        self.logger.warning('test')
+        self.assertEqual(records[-1].funcName, '(unknown function)')
+        self.assertEqual(records[-1].lineno, 0)
+        self.logger.warning('test', stack_info=True)
+        self.assertEqual(records[-1].funcName, 'test_declared_fields')
+
+        self.recording.setFields({'funcName', 'message'})
+        self.logger.warning('test')
+        self.assertEqual(records[-1].funcName, 'test_declared_fields')
+
+        # Handlers which did not declare their fields may use any of them,
+        # unless the record is below their level.
+        self.recording.setFields({'message'})
+        other = logging.NullHandler()
+        self.logger.addHandler(other)
+        self.addCleanup(self.logger.removeHandler, other)
+        self.logger.warning('test')
+        self.assertEqual(records[-1].funcName, 'test_declared_fields')
+        other.setLevel(logging.ERROR)
+        self.logger.warning('test')
+        self.assertEqual(records[-1].funcName, '(unknown function)')
+
+        # A fields attribute of a handler is not a declaration.
+        other.setLevel(logging.NOTSET)
+        other.fields = ['message']
+        self.logger.warning('test')
+        self.assertEqual(records[-1].funcName, 'test_declared_fields')
+
+        # Logger filters may use any field.
+        self.logger.addFilter(lambda record: True)
+        self.logger.warning('test')
+        self.assertEqual(records[-1].funcName, 'test_declared_fields')
+
     def test_make_record_with_extra_overwrite(self):
         name = 'my record'
         level = 13
@@ -5169,6 +5275,146 @@ def test_delay(self):
         self.assertTrue(os.path.exists(self.fn))
         fh.close()
 
+class AsyncFileHandlerTest(BaseFileTest):
+    def next_rec(self):
+        return logging.LogRecord('n', logging.DEBUG, 'p', 1,
+                                 self.next_message(), None, None, None)
+
+    def read_lines(self):
+        with open(self.fn, encoding='utf-8') as f:
+            return f.read().splitlines()
+
+    def blocked_handler(self, **kwargs):
+        # Return a handler whose writer thread is stuck formatting the
+        # first record until the returned event is set.
+        started = threading.Event()
+        gate = threading.Event()
+        class Formatter(logging.Formatter):
+            def format(self, record):
+                started.set()
+                gate.wait(support.SHORT_TIMEOUT)
+                return logging.Formatter.format(self, record)
+        h = logging.handlers.AsyncFileHandler(self.fn, encoding='utf-8',
+                                              **kwargs)
+        self.addCleanup(h.close)
+        h.setFormatter(Formatter())
+        h.handle(self.next_rec())
+        self.assertTrue(started.wait(support.SHORT_TIMEOUT))
+        return h, gate
+
+    @threading_helper.reap_threads
+    def test_write(self):
+        h = logging.handlers.AsyncFileHandler(self.fn, encoding='utf-8',
+                                              batchSize=7)
+        expected = []
+        for i in range(100):
+            record = self.next_rec()
+            expected.append(record.msg)
+            h.handle(record)
+        h.flush()
+        self.assertEqual(self.read_lines(), expected)
+        self.assertEqual(h.queueDepth, 0)
+        h.handle(self.next_rec())
+        h.close()
+        self.assertEqual(len(self.read_lines()), 101)
+        self.assertIsNone(h.stream)
+        self.assertEqual(h.dropped, 0)
+
+    @threading_helper.reap_threads
+    def test_delay(self):
+        os.unlink(self.fn)
+        h = logging.handlers.AsyncFileHandler(self.fn, delay=True)
+        self.assertIsNone(h.stream)
+        self.assertFalse(os.path.exists(self.fn))
+        h.handle(self.next_rec())
+        h.flush()
+        self.assertIsNotNone(h.stream)
+        self.assertTrue(os.path.exists(self.fn))
+        h.close()
+
+    @threading_helper.reap_threads
+    def test_drop(self):
+        h, gate = self.blocked_handler(queueSize=2, overflow='drop')
+        for i in range(10):
+            h.handle(self.next_rec())
+        self.assertEqual(h.queueDepth, 2)
+        self.assertEqual(h.dropped, 8)
+        gate.set()
+        h.close()
+        self.assertEqual(self.read_lines(), ['1', '2', '3'])
+
+    @threading_helper.reap_threads
+    def test_sample(self):
+        h, gate = self.blocked_handler(queueSize=1, overflow='sample',
+                                       sampleRate=3)
+        for i in range(3):
+            h.handle(self.next_rec())
+        self.assertEqual(h.dropped, 2)
+        # The third record which finds the queue full waits for room.
+        timer = threading.Timer(0.1, gate.set)
+        timer.start()
+        h.handle(self.next_rec())
+        h.close()
+        timer.join()
+        self.assertEqual(self.read_lines(), ['1', '2', '5'])
+        self.assertEqual(h.dropped, 2)
+
+    @threading_helper.reap_threads
+    def test_emit_after_close(self):
+        h = logging.handlers.AsyncFileHandler(self.fn, encoding='utf-8')
+        h.handle(self.next_rec())
+        h.close()
+        h.handle(self.next_rec())
+        self.assertIsNone(h._thread)
+        self.assertIsNone(h.stream)
+        self.assertEqual(self.read_lines(), ['1'])
+
+    @threading_helper.reap_threads
+    def test_record_after_sentinel(self):
+        # A record emitted while closing may follow the sentinel in the
+        # batch read by the writer thread.
+        h, gate = self.blocked_handler()
+        thread = h._thread
+        h.emit(self.next_rec())
+        h.queue.put(h._sentinel)
+        h.emit(self.next_rec())
+        gate.set()
+        thread.join(support.SHORT_TIMEOUT)
+        self.assertFalse(thread.is_alive())
+        h.close()
+        self.assertEqual(self.read_lines(), ['1', '2'])
+
+    @threading_helper.reap_threads
+    def test_log_while_closing(self):
+        # Formatting a queued record may log through the handler while
+        # close() waits for the writer thread.
+        h, gate = self.blocked_handler()
+        h.handle(self.next_rec())
+        class Formatter(logging.Formatter):
+            def format(self, record):
+                h.handle(logging.makeLogRecord({'msg': 'nested'}))
+                return logging.Formatter.format(self, record)
+        h.setFormatter(Formatter())
+        closer = threading.Thread(target=h.close, daemon=True)
+        closer.start()
+        deadline = time.monotonic() + support.SHORT_TIMEOUT
+        while not h._closed and time.monotonic() < deadline:
+            time.sleep(0.01)
+        gate.set()
+        closer.join(support.SHORT_TIMEOUT)
+        self.assertFalse(closer.is_alive())
+        self.assertIsNone(h.stream)
+        self.assertEqual(self.read_lines(), ['1', '2'])
+
+    def test_invalid_arguments(self):
+        AsyncFileHandler = logging.handlers.AsyncFileHandler
+        self.assertRaises(ValueError, AsyncFileHandler, self.fn,
+                          overflow='wait')
+        self.assertRaises(ValueError, AsyncFileHandler, self.fn,
+                          sampleRate=0)
+        self.assertRaises(ValueError, AsyncFileHandler, self.fn,
+                          batchSize=0)
+
 class RotatingFileHandlerTest(BaseFileTest):
     def next_rec(self):
         return logging.LogRecord('n', logging.DEBUG, 'p', 1,
@@ -5488,7 +5734,7 @@ def test_main():
         StreamHandlerTest, LogRecordFactoryTest, ChildLoggerTest,
         QueueHandlerTest, ShutdownTest, ModuleLevelMiscTest, BasicConfigTest,
         LoggerAdapterTest, LoggerTest, SMTPHandlerTest, FileHandlerTest,
-        RotatingFileHandlerTest,  LastResortTest, LogRecordTest,
+        AsyncFileHandlerTest, RotatingFileHandlerTest,  LastResortTest, LogRecordTest,
         ExceptionTest, SysLogHandlerTest, IPv6SysLogHandlerTest, HTTPHandlerTest,
         NTEventLogHandlerTest, TimedRotatingFileHandlerTest,
         UnixSocketHandlerTest, UnixDatagramHandlerTest, UnixSysLogHandlerTest,
@@ -1552,6 +1552,114 @@ def fwalk(self, top='.', *args, **kwargs):
             bfiles[:] = list(map(os.fsencode, files))
 
 
+class ParallelWalkTests(WalkTests):
+    """Tests for os.parallel_walk()."""
+
+    def walk(self, top, topdown=True, **kwargs):
+        if not topdown:
+            self.skipTest("parallel_walk() is always top-down")
+        if 'follow_symlinks' in kwargs:
+            kwargs['followlinks'] = kwargs.pop('follow_symlinks')
+        kwargs.setdefault('max_workers', 2)
+        return os.parallel_walk(top, **kwargs)
+
+    def test_walk_bad_dir(self):
+        # Subdirectories may be scanned before their parent is generated,
+        # so the error must come from a directory which does not exist
+        # when the walk starts.
+        errors = []
+        missing = os.path.join(self.walk_path, 'missing')
+        self.assertEqual(list(self.walk(missing, onerror=errors.append)), [])
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], FileNotFoundError)
+        self.assertEqual(os.fsdecode(errors[0].filename), missing)
+
+    def test_same_as_walk(self):
+        base = os.path.join(os_helper.TESTFN, 'wide')
+        for i in range(10):
+            for j in range(i):
+                os.makedirs(os.path.join(base, f'd{i}', f'd{j}'))
+        expected = list(os.walk(os_helper.TESTFN))
+        for max_pending in 1, 3, None:
+            with self.subTest(max_pending=max_pending):
+                result = list(self.walk(os_helper.TESTFN,
+                                        max_pending=max_pending))
+                self.assertEqual(result, expected)
+                result = list(self.walk(os_helper.TESTFN, ordered=False,
+                                        max_pending=max_pending))
+                self.assertEqual(sorted(result), sorted(expected))
+                roots = [root for root, dirs, files in result]
+                for root in roots[1:]:
+                    # Parents are generated before their subdirectories.
+                    self.assertLess(roots.index(os.path.dirname(root)),
+                                    roots.index(root))
+
+    @os_helper.skip_unless_symlink
+    def test_unordered_skipped_dirs(self):
+        # Directories which are not walked (symlinks, unreadable
+        # directories) must not stop the walk of the others.
+        base = os.path.join(os_helper.TESTFN, 'skipped')
+        os.makedirs(os.path.join(base, 'zreal', 'x'))
+        for i in range(5):
+            os.symlink(os.path.abspath(os.path.join(base, 'zreal')),
+                       os.path.join(base, f'link{i}'),
+                       target_is_directory=True)
+        errors = []
+        if hasattr(os, 'geteuid') and os.geteuid() != 0:
+            unreadable = os.path.join(base, 'unreadable')
+            os.mkdir(unreadable, 0)
+            self.addCleanup(os.chmod, unreadable, stat.S_IRWXU)
+        expected = list(os.walk(base, onerror=errors.append))
+        for max_pending in 1, 2, None:
+            with self.subTest(max_pending=max_pending):
+                result = list(self.walk(base, ordered=False,
+                                        max_pending=max_pending,
+                                        onerror=errors.append))
+                self.assertEqual(sorted(result), sorted(expected))
+
+    def test_prune_and_reorder(self):
+        def walk_reversed(walk, **kwargs):
+            result = []
+            for root, dirs, files in walk(self.walk_path, **kwargs):
+                result.append(root)
+                dirs.reverse()
+                if 'SUB11' in dirs:
+                    dirs.remove('SUB11')
+                    dirs.append('SUB11')
+            return result
+        expected = walk_reversed(os.walk)
+        self.assertEqual(walk_reversed(self.walk), expected)
+        self.assertEqual(walk_reversed(self.walk, max_pending=1), expected)
+
+    def test_close(self):
+        with threading_helper.wait_threads_exit():
+            base = os.path.join(os_helper.TESTFN, 'wide')
+            for i in range(20):
+                os.makedirs(os.path.join(base, f'd{i}', 'sub'))
+            walk_it = self.walk(base, max_pending=5)
+            self.assertEqual(next(walk_it)[0], base)
+            walk_it.close()
+            self.assertEqual(list(walk_it), [])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            os.parallel_walk(self.walk_path, max_workers=0)
+        with self.assertRaises(ValueError):
+            os.parallel_walk(self.walk_path, max_pending=0)
+
+
+class BytesParallelWalkTests(ParallelWalkTests):
+    """Tests for os.parallel_walk() with bytes."""
+    def walk(self, top, **kwargs):
+        for broot, bdirs, bfiles in super().walk(os.fsencode(top), **kwargs):
+            root = os.fsdecode(broot)
+            dirs = list(map(os.fsdecode, bdirs))
+            files = list(map(os.fsdecode, bfiles))
+            yield (root, dirs, files)
+            bdirs[:] = list(map(os.fsencode, dirs))
+            bfiles[:] = list(map(os.fsencode, files))
+
+
 class MakedirTests(unittest.TestCase):
     def setUp(self):
         os.mkdir(os_helper.TESTFN)
@@ -1680,6 +1680,33 @@ def test_glob_dotdot(self):
         self.assertEqual(set(p.glob("dirA/../file*")), { P(BASE, "dirA/../fileA") })
         self.assertEqual(set(p.glob("../xyzzy")), set())
 
+    def test_glob_duplicates(self):
+        # Paths selected from several starting points are yielded once.
+        P = self.cls
+        p = P(BASE)
+        results = list(p.glob("**/**/fileD"))
+        self.assertEqual(results, [P(BASE, "dirC/dirD/fileD")])
+        results = list(p.glob("dirC/**/.."))
+        self.assertEqual(len(results), len(set(results)))
+        self.assertEqual(set(results), { P(BASE, "dirC/.."),
+                                         P(BASE, "dirC/dirD/..") })
+
+    def test_glob_entries(self):
+        P = self.cls
+        p = P(BASE)
+        results = list(p.rglob("file*", entries=True))
+        self.assertEqual({path for path, entry in results},
+                         set(p.rglob("file*")))
+        for path, entry in results:
+            self.assertIsInstance(entry, os.DirEntry)
+            self.assertEqual(entry.name, path.name)
+            self.assertEqual(entry.path, str(path))
+            self.assertTrue(entry.is_file())
+        # Paths which were not found by scanning a directory have no entry.
+        self.assertEqual(list(p.glob("dirC/fileC", entries=True)),
+                         [(P(BASE, "dirC/fileC"), None)])
+        self.assertEqual(list(p.glob("**", entries=True))[0], (p, None))
+
     @os_helper.skip_unless_symlink
     def test_glob_permissions(self):
         # See bpo-38894
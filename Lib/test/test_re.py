@@ -1,6 +1,9 @@
 from test.support import (gc_collect, bigmemtest, _2G,
                           cpython_only, captured_stdout)
+from test.support import os_helper
 import locale
+import marshal
+import os
 import re
 import sre_compile
 import string
@@ -2202,6 +2205,298 @@ def test_signedness(self):
         self.assertGreaterEqual(sre_compile.MAXGROUPS, 0)
 
 
+class CacheTests(unittest.TestCase):
+
+    def setUp(self):
+        re.purge()
+        self.addCleanup(re.purge)
+        self.addCleanup(re.set_cache_size, re.cache_info().maxsize)
+
+    def test_cache_info(self):
+        self.assertEqual(re.cache_info(), (0, 0, 512, 0))
+        re.compile('a')
+        re.compile('a')
+        re.match('a', 'a')
+        re.compile(b'a')
+        re.compile('a', re.I)
+        info = re.cache_info()
+        self.assertEqual(info.hits, 2)
+        self.assertEqual(info.misses, 3)
+        self.assertEqual(info.currsize, 3)
+        re.purge()
+        self.assertEqual(re.cache_info(), (0, 0, 512, 0))
+
+    def test_lru(self):
+        re.set_cache_size(2)
+        a = re.compile('a')
+        b = re.compile('b')
+        self.assertIs(re.compile('a'), a)
+        re.compile('c')
+        # 'b' was the least recently used pattern.
+        self.assertIs(re.compile('a'), a)
+        self.assertIsNot(re.compile('b'), b)
+        self.assertEqual(re.cache_info().currsize, 2)
+        re.set_cache_size(1)
+        self.assertEqual(re.cache_info()[2:], (1, 1))
+        self.assertIsNot(re.compile('a'), a)
+
+    def test_set_cache_size(self):
+        re.set_cache_size(0)
+        self.assertIsNot(re.compile('a'), re.compile('a'))
+        self.assertEqual(re.cache_info(), (0, 2, 0, 0))
+        self.assertRaises(ValueError, re.set_cache_size, -1)
+        self.assertRaises(TypeError, re.set_cache_size, 1.0)
+
+    def test_save_and_load(self):
+        filename = os_helper.TESTFN
+        self.addCleanup(os_helper.unlink, filename)
+        patterns = [('(?P<x>a+)(b)?', 0), (b'[a-z]+', re.I), ('(?i)\\w', 0)]
+        for pattern, flags in patterns:
+            re.compile(pattern, flags)
+        re.save_cache(filename)
+        re.purge()
+        self.assertEqual(re.load_cache(filename), 3)
+        info = re.cache_info()
+        self.assertEqual((info.misses, info.currsize), (0, 3))
+        p = re.compile('(?P<x>a+)(b)?')
+        self.assertEqual(re.cache_info().hits, 1)
+        self.assertEqual(p.groupindex, {'x': 1})
+        self.assertEqual(p.match('aab').groups(), ('aa', 'b'))
+        self.assertEqual(re.compile(b'[a-z]+', re.I).match(b'AbC').group(),
+                         b'AbC')
+        self.assertTrue(re.compile('(?i)\\w').flags & re.I)
+        self.assertEqual(re.cache_info().misses, 0)
+        # Patterns already in the cache are not loaded again.
+        self.assertEqual(re.load_cache(filename), 0)
+        # The cache size is respected.
+        re.purge()
+        re.set_cache_size(2)
+        self.assertEqual(re.load_cache(filename), 3)
+        self.assertEqual(re.cache_info().currsize, 2)
+
+    def test_load_other_version(self):
+        filename = os_helper.TESTFN
+        self.addCleanup(os_helper.unlink, filename)
+        with open(filename, 'wb') as file:
+            file.write(marshal.dumps(((b're.cache', 0, 0, ''), [])))
+        self.assertEqual(re.load_cache(filename), 0)
+        with open(filename, 'wb') as file:
+            file.write(b'garbage')
+        self.assertRaises(ValueError, re.load_cache, filename)
+
+
+class RegexSetTests(unittest.TestCase):
+
+    def check(self, patterns, strings, flags=0):
+        rs = re.RegexSet(patterns, flags)
+        self.assertEqual(len(rs), len(patterns))
+        for string in strings:
+            for pos, endpos in (0, len(string)), (1, len(string) - 1):
+                for name in 'match', 'fullmatch', 'search':
+                    expected = [i for i, p in enumerate(rs.patterns)
+                                if getattr(p, name)(string, pos, endpos)]
+                    with self.subTest(string=string, pos=pos, method=name):
+                        self.assertEqual(
+                            getattr(rs, name)(string, pos, endpos), expected)
+
+    def test_matches(self):
+        patterns = [r'/users/(\d+)$', r'^/users/', r'/u', r'/usr/\w+',
+                    r'\busr\b', r'ERROR|FATAL', r'\d+ ms', r'(?i)warn',
+                    r'1?/', '']
+        strings = ['/users/12', '/usr/lib', 'x /users/12 ERROR 5 ms',
+                   'FATAL: /usr', 'Warning: 1 usr', '', 'x']
+        self.check(patterns, strings)
+        self.check(patterns, strings, re.IGNORECASE)
+        self.check([p.encode() for p in patterns],
+                   [s.encode() for s in strings])
+
+    def test_overlapping_literals(self):
+        # Literals which are prefixes of others, or overlap each other.
+        patterns = ['abc', 'ab', 'bcd', 'b', 'cd', 'abcde$']
+        self.check(patterns, ['abcde', 'abcd', 'xbcdx', 'aab', 'cd'])
+
+    def test_compiled_patterns(self):
+        a = re.compile('a', re.I)
+        rs = re.RegexSet([a, 'b'])
+        self.assertIs(rs.patterns[0], a)
+        self.assertEqual(rs.search('AB'), [0])
+        self.assertRaises(ValueError, re.RegexSet, [a], re.I)
+
+    def test_empty(self):
+        rs = re.RegexSet([])
+        self.assertEqual(rs.search('abc'), [])
+        self.assertEqual(rs.match('abc'), [])
+
+    def test_type_errors(self):
+        self.assertRaises(TypeError, re.RegexSet, ['a', b'b'])
+        self.assertRaises(TypeError, re.RegexSet, [1])
+        rs = re.RegexSet(['a'])
+        self.assertRaises(TypeError, rs.search, b'a')
+        self.assertRaises(TypeError, rs.match, b'a')
+
+
+class LinearTests(unittest.TestCase):
+
+    def assertSameMatch(self, m1, m2):
+        if m1 is None:
+            self.assertIsNone(m2)
+            return
+        self.assertIsNotNone(m2)
+        self.assertEqual(m2.span(), m1.span())
+        self.assertEqual(m2.regs, m1.regs)
+        self.assertEqual(m2.lastindex, m1.lastindex)
+        self.assertEqual(m2.lastgroup, m1.lastgroup)
+
+    def test_re_tests(self):
+        # The matches are the same as those of the backtracking engine.
+        from test.re_tests import tests, SYNTAX_ERROR
+        for t in tests:
+            pattern, s, outcome = t[:3]
+            if outcome == SYNTAX_ERROR:
+                continue
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                p = re.compile(pattern)
+                try:
+                    q = re.compile(pattern, re.LINEAR)
+                except re.error:
+                    # Backreferences and lookaround assertions.
+                    continue
+            for pos in range(min(len(s), 2) + 1):
+                for name in 'match', 'fullmatch', 'search':
+                    with self.subTest(pattern=pattern, string=s, pos=pos,
+                                      method=name):
+                        self.assertSameMatch(getattr(p, name)(s, pos),
+                                             getattr(q, name)(s, pos))
+            with self.subTest(pattern=pattern, string=s):
+                self.assertEqual(q.findall(s), p.findall(s))
+                self.assertEqual(q.sub(r'<\g<0>>', s), p.sub(r'<\g<0>>', s))
+
+    def test_empty_iterations(self):
+        # Like sre, stop repeating after an optional iteration matched an
+        # empty string.
+        for pattern, string in [(r'(?:(x|a)??x?){1,2}', 'axx'),
+                                (r'((?:a??)+|\w)', 'xx'),
+                                (r'(a*)*', 'b'), (r'(a*)+?b', 'aab'),
+                                (r'(?:a||b)*', 'ab')]:
+            with self.subTest(pattern=pattern, string=string):
+                p = re.compile(pattern)
+                q = re.compile(pattern, re.LINEAR)
+                for m1, m2 in zip(p.finditer(string), q.finditer(string)):
+                    self.assertSameMatch(m1, m2)
+                self.assertEqual(q.findall(string), p.findall(string))
+
+    def test_backtracking(self):
+        # These take exponential time with the backtracking engine.
+        p = re.compile(r'(a+)+b', re.LINEAR)
+        self.assertIsNone(p.match('a' * 1000))
+        self.assertEqual(p.search('a' * 1000 + 'b').span(), (0, 1001))
+        p = re.compile(r'^(\w+\s?)*$', re.LINEAR)
+        self.assertIsNone(p.match('word ' * 1000 + '!'))
+
+    def test_unsupported(self):
+        for pattern in [r'(a)\1', r'(?P<x>a)(?P=x)', r'(a)?(?(1)b|c)',
+                        r'a(?=b)', r'a(?!b)', r'(?<=a)b', r'(?<!a)b']:
+            with self.subTest(pattern=pattern):
+                self.assertRaisesRegex(re.error, 'not supported',
+                                       re.compile, pattern, re.LINEAR)
+        self.assertRaisesRegex(re.error, 'too large',
+                               re.compile, '(?:a{1000}){1000}', re.LINEAR)
+
+    def test_pattern(self):
+        p = re.compile(r'(?P<key>\w+)=(?P<value>\d*)', re.LINEAR)
+        self.assertIs(re.compile(r'(?P<key>\w+)=(?P<value>\d*)', re.LINEAR),
+                      p)
+        self.assertIs(re.compile(p), p)
+        self.assertEqual(p.flags, re.LINEAR | re.UNICODE)
+        self.assertEqual(p.groups, 2)
+        self.assertEqual(p.groupindex, {'key': 1, 'value': 2})
+        self.assertEqual(repr(p),
+                         "re.compile('(?P<key>\\\\w+)=(?P<value>\\\\d*)', "
+                         "re.LINEAR)")
+        self.assertEqual(repr(re.LINEAR), 're.LINEAR')
+        self.assertEqual(p.findall('a=1, b=, c'), [('a', '1'), ('b', '')])
+        self.assertEqual(p.sub(r'\g<value>:\1', 'a=1, b=2'), '1:a, 2:b')
+        self.assertEqual(p.subn(lambda m: m['key'].upper(), 'a=1, b=2'),
+                         ('A, B', 2))
+        self.assertEqual(p.split('x a=1 y', maxsplit=1), ['x ', 'a', '1', ' y'])
+        self.assertEqual(re.split(r'\s*', 'ab c', flags=re.LINEAR),
+                         re.split(r'\s*', 'ab c'))
+        self.assertEqual(re.sub('x*', '-', 'abxd', flags=re.LINEAR),
+                         '-a-b--d-')
+        self.assertIsNone(p.match('a=1', 1, 2))
+        self.assertEqual(p.search('  a=1', 1).span(), (2, 5))
+
+    def test_match_object(self):
+        m = re.search(r'(?P<key>\w+)=(\d+)?', 'x: a=', re.LINEAR)
+        self.assertEqual(m.span(), (3, 5))
+        self.assertEqual(m.group(), 'a=')
+        self.assertEqual(m[0], 'a=')
+        self.assertEqual(m.group('key', 2), ('a', None))
+        self.assertEqual(m.groups('-'), ('a', '-'))
+        self.assertEqual(m.groupdict(), {'key': 'a'})
+        self.assertEqual(m.span(2), (-1, -1))
+        self.assertEqual(m.start('key'), 3)
+        self.assertEqual(m.end(1), 4)
+        self.assertEqual(m.lastindex, 1)
+        self.assertEqual(m.lastgroup, 'key')
+        self.assertEqual(m.expand(r'[\1]'), '[a]')
+        self.assertEqual(m.string, 'x: a=')
+        self.assertEqual((m.pos, m.endpos), (0, 5))
+        self.assertRaises(IndexError, m.group, 3)
+        self.assertRaises(IndexError, m.group, 'missing')
+        self.assertEqual(repr(m),
+                         "<sre_linear.Match object; span=(3, 5), match='a='>")
+
+    def test_flags(self):
+        self.assertTrue(re.match('(?i)AB', 'ab', re.LINEAR))
+        self.assertTrue(re.match('a(?i:B)', 'ab', re.LINEAR))
+        self.assertIsNone(re.match('a(?i:B)', 'Ab', re.LINEAR))
+        self.assertEqual(re.findall('^a$', 'a\na\nb', re.LINEAR | re.M),
+                         ['a', 'a'])
+        self.assertEqual(re.findall('^a$', 'a\n', re.LINEAR), ['a'])
+        self.assertEqual(re.findall(r'.\b', 'ab c', re.LINEAR),
+                         ['b', ' ', 'c'])
+        self.assertEqual(re.findall(r'\B.', 'ab c', re.LINEAR), ['b'])
+        self.assertEqual(re.findall(r'.', 'a\nb', re.LINEAR | re.S),
+                         ['a', '\n', 'b'])
+        self.assertTrue(re.match(r'\w', '\xe9', re.LINEAR))
+        self.assertIsNone(re.match(r'\w', '\xe9', re.LINEAR | re.A))
+
+    def test_bytes(self):
+        p = re.compile(rb'(\w+)=(\d+)', re.LINEAR)
+        self.assertEqual(p.findall(b'a=1 b=2'), [(b'a', b'1'), (b'b', b'2')])
+        self.assertEqual(p.search(bytearray(b' x=3')).group(1),
+                         bytearray(b'x'))
+        self.assertEqual(p.search(memoryview(b' x=3')).span(), (1, 4))
+        self.assertRaises(TypeError, p.search, 'a=1')
+        self.assertRaises(TypeError, re.compile('a', re.LINEAR).search, b'a')
+        self.assertRaises(TypeError, re.compile('a', re.LINEAR).search, 1)
+
+    def test_pickling_and_copying(self):
+        import copy
+        import pickle
+        p = re.compile(r'a+', re.LINEAR | re.I)
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(pickle.loads(pickle.dumps(p, proto)), p)
+        self.assertIs(copy.copy(p), p)
+        self.assertIs(copy.deepcopy(p), p)
+        self.assertNotEqual(p, re.compile(r'a+', re.I))
+
+    def test_lazy_import(self):
+        from test.support.script_helper import assert_python_ok
+        code = ('import re, sys; '
+                'assert "sre_linear" not in sys.modules; '
+                're.compile("a", re.LINEAR); '
+                'assert "sre_linear" in sys.modules')
+        assert_python_ok('-c', code)
+
+    def test_regexset(self):
+        rs = re.RegexSet([r'/users/(\d+)$', r'(a|b)+x'], re.LINEAR)
+        self.assertEqual(rs.search('/users/12'), [0])
+        self.assertEqual(rs.search('abax'), [1])
+
+
 class ExternalTests(unittest.TestCase):
 
     def test_re_benchmarks(self):
@@ -519,6 +519,19 @@ def test_sitecustomize_executed(self):
             else:
                 self.fail("sitecustomize not imported automatically")
 
+    def test_sitecustomize_lazy_imports(self):
+        # sitecustomize is executed even when lazy imports are enabled.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, 'sitecustomize.py'), 'w') as f:
+                f.write('import sys\nsys.customized = True\n')
+            env = dict(os.environ, PYTHONPATH=tmpdir)
+            env.pop('PYTHONLAZYIMPORTS', None)
+            output = subprocess.check_output(
+                [sys.executable, '-X', 'lazy_imports', '-c',
+                 'import sys; print(sys.customized)'],
+                env=env, universal_newlines=True)
+        self.assertEqual(output.strip(), 'True')
+
     @test.support.requires_resource('network')
     @test.support.system_must_validate_cert
     @unittest.skipUnless(hasattr(urllib.request, "HTTPSHandler"),
@@ -61,6 +61,15 @@ typedef struct _PyEncoderObject {
     PyCFunction fast_encode;
 } PyEncoderObject;
 
+/* Output of the encoder: when write is not NULL, the accumulated text
+   is passed to it every time chunk_size characters are pending. */
+typedef struct {
+    _PyAccu accu;
+    PyObject *write;
+    Py_ssize_t chunk_size;
+    Py_ssize_t pending;
+} EncoderAccu;
+
 static PyMemberDef encoder_members[] = {
     {"markers", T_OBJECT, offsetof(PyEncoderObject, markers), READONLY, "markers"},
     {"default", T_OBJECT, offsetof(PyEncoderObject, defaultfn), READONLY, "default"},
@@ -97,11 +106,13 @@ encoder_dealloc(PyObject *self);
 static int
 encoder_clear(PyEncoderObject *self);
 static int
-encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc, PyObject *seq, Py_ssize_t indent_level);
+encoder_accumulate(EncoderAccu *acc, PyObject *unicode);
+static int
+encoder_listencode_list(PyEncoderObject *s, EncoderAccu *acc, PyObject *seq, Py_ssize_t indent_level);
 static int
-encoder_listencode_obj(PyEncoderObject *s, _PyAccu *acc, PyObject *obj, Py_ssize_t indent_level);
+encoder_listencode_obj(PyEncoderObject *s, EncoderAccu *acc, PyObject *obj, Py_ssize_t indent_level);
 static int
-encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc, PyObject *dct, Py_ssize_t indent_level);
+encoder_listencode_dict(PyEncoderObject *s, EncoderAccu *acc, PyObject *dct, Py_ssize_t indent_level);
 static PyObject *
 _encoded_const(PyObject *obj);
 static void
@@ -1283,24 +1294,76 @@ encoder_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     return (PyObject *)s;
 }
 
+static int
+encoder_flush(EncoderAccu *acc)
+{
+    /* Pass the pending text to acc->write */
+    PyObject *chunk, *res;
+    chunk = _PyAccu_Finish(&acc->accu);
+    if (chunk == NULL)
+        return -1;
+    acc->pending = 0;
+    if (_PyAccu_Init(&acc->accu)) {
+        Py_DECREF(chunk);
+        return -1;
+    }
+    res = PyObject_CallOneArg(acc->write, chunk);
+    Py_DECREF(chunk);
+    if (res == NULL)
+        return -1;
+    Py_DECREF(res);
+    return 0;
+}
+
+static int
+encoder_accumulate(EncoderAccu *acc, PyObject *unicode)
+{
+    if (_PyAccu_Accumulate(&acc->accu, unicode))
+        return -1;
+    if (acc->write == NULL)
+        return 0;
+    acc->pending += PyUnicode_GET_LENGTH(unicode);
+    if (acc->pending < acc->chunk_size)
+        return 0;
+    return encoder_flush(acc);
+}
+
 static PyObject *
 encoder_call(PyEncoderObject *self, PyObject *args, PyObject *kwds)
 {
     /* Python callable interface to encode_listencode_obj */
-    static char *kwlist[] = {"obj", "_current_indent_level", NULL};
+    static char *kwlist[] = {"obj", "_current_indent_level",
+                             "write", "chunk_size", NULL};
     PyObject *obj;
     Py_ssize_t indent_level;
-    _PyAccu acc;
-    if (!PyArg_ParseTupleAndKeywords(args, kwds, "On:_iterencode", kwlist,
-        &obj, &indent_level))
+    EncoderAccu acc;
+    acc.write = NULL;
+    acc.chunk_size = 65536;
+    acc.pending = 0;
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "On|On:_iterencode", kwlist,
+        &obj, &indent_level, &acc.write, &acc.chunk_size))
+        return NULL;
+    if (acc.write == Py_None)
+        acc.write = NULL;
+    if (acc.write != NULL && acc.chunk_size <= 0) {
+        PyErr_SetString(PyExc_ValueError, "chunk_size must be positive");
         return NULL;
-    if (_PyAccu_Init(&acc))
+    }
+    if (_PyAccu_Init(&acc.accu))
         return NULL;
     if (encoder_listencode_obj(self, &acc, obj, indent_level)) {
-        _PyAccu_Destroy(&acc);
+        _PyAccu_Destroy(&acc.accu);
         return NULL;
     }
-    return _PyAccu_FinishAsList(&acc);
+    if (acc.write == NULL)
+        return _PyAccu_FinishAsList(&acc.accu);
+    /* Streaming: write what is left and return None */
+    if (acc.pending && encoder_flush(&acc)) {
+        _PyAccu_Destroy(&acc.accu);
+        return NULL;
+    }
+    _PyAccu_Destroy(&acc.accu);
+    Py_RETURN_NONE;
 }
 
 static PyObject *
@@ -1384,16 +1447,16 @@ encoder_encode_string(PyEncoderObject *s, PyObject *obj)
 }
 
 static int
-_steal_accumulate(_PyAccu *acc, PyObject *stolen)
+_steal_accumulate(EncoderAccu *acc, PyObject *stolen)
 {
     /* Append stolen and then decrement its reference count */
-    int rval = _PyAccu_Accumulate(acc, stolen);
+    int rval = encoder_accumulate(acc, stolen);
     Py_DECREF(stolen);
     return rval;
 }
 
 static int
-encoder_listencode_obj(PyEncoderObject *s, _PyAccu *acc,
+encoder_listencode_obj(PyEncoderObject *s, EncoderAccu *acc,
                        PyObject *obj, Py_ssize_t indent_level)
 {
     /* Encode Python object obj to a JSON term */
@@ -1489,7 +1552,7 @@ encoder_listencode_obj(PyEncoderObject *s, _PyAccu *acc,
 }
 
 static int
-encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
+encoder_listencode_dict(PyEncoderObject *s, EncoderAccu *acc,
                         PyObject *dct, Py_ssize_t indent_level)
 {
     /* Encode Python dict dct a JSON term */
@@ -1511,7 +1574,7 @@ encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
             return -1;
     }
     if (PyDict_GET_SIZE(dct) == 0)  /* Fast path */
-        return _PyAccu_Accumulate(acc, empty_dict);
+        return encoder_accumulate(acc, empty_dict);
 
     if (s->markers != Py_None) {
         int has_key;
@@ -1529,7 +1592,7 @@ encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
         }
     }
 
-    if (_PyAccu_Accumulate(acc, open_dict))
+    if (encoder_accumulate(acc, open_dict))
         goto bail;
 
     if (s->indent != Py_None) {
@@ -1595,7 +1658,7 @@ encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
         }
 
         if (idx) {
-            if (_PyAccu_Accumulate(acc, s->item_separator))
+            if (encoder_accumulate(acc, s->item_separator))
                 goto bail;
         }
 
@@ -1603,12 +1666,12 @@ encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
         Py_CLEAR(kstr);
         if (encoded == NULL)
             goto bail;
-        if (_PyAccu_Accumulate(acc, encoded)) {
+        if (encoder_accumulate(acc, encoded)) {
             Py_DECREF(encoded);
             goto bail;
         }
         Py_DECREF(encoded);
-        if (_PyAccu_Accumulate(acc, s->key_separator))
+        if (encoder_accumulate(acc, s->key_separator))
             goto bail;
 
         value = PyTuple_GET_ITEM(item, 1);
@@ -1632,7 +1695,7 @@ encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
 
         yield '\n' + (' ' * (_indent * _current_indent_level))
     }*/
-    if (_PyAccu_Accumulate(acc, close_dict))
+    if (encoder_accumulate(acc, close_dict))
         goto bail;
     return 0;
 
@@ -1646,7 +1709,7 @@ encoder_listencode_dict(PyEncoderObject *s, _PyAccu *acc,
 
 
 static int
-encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc,
+encoder_listencode_list(PyEncoderObject *s, EncoderAccu *acc,
                         PyObject *seq, Py_ssize_t indent_level)
 {
     /* Encode Python list seq to a JSON term */
@@ -1670,7 +1733,7 @@ encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc,
         return -1;
     if (PySequence_Fast_GET_SIZE(s_fast) == 0) {
         Py_DECREF(s_fast);
-        return _PyAccu_Accumulate(acc, empty_array);
+        return encoder_accumulate(acc, empty_array);
     }
 
     if (s->markers != Py_None) {
@@ -1689,7 +1752,7 @@ encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc,
         }
     }
 
-    if (_PyAccu_Accumulate(acc, open_array))
+    if (encoder_accumulate(acc, open_array))
         goto bail;
     if (s->indent != Py_None) {
         /* TODO: DOES NOT RUN */
@@ -1701,12 +1764,21 @@ encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc,
         */
     }
     for (i = 0; i < PySequence_Fast_GET_SIZE(s_fast); i++) {
-        PyObject *obj = PySequence_Fast_GET_ITEM(s_fast, i);
+        PyObject *obj;
+        int rv;
         if (i) {
-            if (_PyAccu_Accumulate(acc, s->item_separator))
+            if (encoder_accumulate(acc, s->item_separator))
                 goto bail;
         }
-        if (encoder_listencode_obj(s, acc, obj, indent_level))
+        /* Hold a reference: the write callable of a streaming encoder may
+           mutate the sequence while the item is being encoded. */
+        if (i >= PySequence_Fast_GET_SIZE(s_fast))
+            break;
+        obj = PySequence_Fast_GET_ITEM(s_fast, i);
+        Py_INCREF(obj);
+        rv = encoder_listencode_obj(s, acc, obj, indent_level);
+        Py_DECREF(obj);
+        if (rv)
             goto bail;
     }
     if (ident != NULL) {
@@ -1721,7 +1793,7 @@ encoder_listencode_list(PyEncoderObject *s, _PyAccu *acc,
 
         yield '\n' + (' ' * (_indent * _current_indent_level))
     }*/
-    if (_PyAccu_Accumulate(acc, close_array))
+    if (encoder_accumulate(acc, close_array))
         goto bail;
     Py_DECREF(s_fast);
     return 0;
@@ -92,6 +92,7 @@
 #define SRE_FLAG_VERBOSE 64
 #define SRE_FLAG_DEBUG 128
 #define SRE_FLAG_ASCII 256
+#define SRE_FLAG_LINEAR 512
 #define SRE_INFO_PREFIX 1
 #define SRE_INFO_LITERAL 2
 #define SRE_INFO_CHARSET 4